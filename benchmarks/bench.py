@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for project setup, validation and migration.
+
+    python benchmarks/bench.py run                     # print results
+    python benchmarks/bench.py run --output results.json
+    python benchmarks/bench.py run --save-baseline     # refresh baseline.json
+    python benchmarks/bench.py compare results.json    # exit 1 on regressions
+
+Every benchmark reports a throughput (higher is better) and keeps the best
+of `--repeat` runs, which is the least noisy estimate on a shared machine.
+`compare` flags every benchmark that is slower than the baseline by more
+than `--threshold` (20% by default). Baselines are only comparable on the
+same machine, so refresh baseline.json when the hardware changes.
+
+Sizes are configurable: `--validate-roots 1000 10000` and
+`--migrate-files 10000 100000 1000000` run the larger workloads.
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import logging
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+try:
+    from cline_llm_methodology.llm_setup import migration, setup, validation
+except ImportError:
+    # Run from a checkout without the package installed
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+    from llm_setup import migration, setup, validation
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+DEFAULT_THRESHOLD = 0.2
+
+Result = Dict[str, object]
+
+@contextmanager
+def _quiet() -> Iterator[None]:
+    """Silence progress logging, which would otherwise dominate the timings."""
+    logging.disable(logging.INFO)
+    try:
+        yield
+    finally:
+        logging.disable(logging.NOTSET)
+
+def _best(repeat: int, run: Callable[[Path], float]) -> float:
+    """Best throughput of `repeat` runs, each in a fresh scratch directory."""
+    best = 0.0
+    for _ in range(repeat):
+        scratch = Path(tempfile.mkdtemp(prefix="llm-bench-"))
+        try:
+            best = max(best, run(scratch))
+        finally:
+            shutil.rmtree(scratch, ignore_errors=True)
+    return best
+
+def _project_config(root: Path, index: int) -> "setup.ProjectConfig":
+    return setup.ProjectConfig(
+        name=f"bench-{index}",
+        type="api",
+        technologies=["python", "fastapi"],
+        base_structure="standard",
+        documentation_path=root / f"bench-{index}"
+    )
+
+def bench_setup(projects: int) -> Callable[[Path], float]:
+    """Projects per second for `LLMMethodologySetup.run()`."""
+    def run(scratch: Path) -> float:
+        configs = [_project_config(scratch, index) for index in range(projects)]
+        start = time.perf_counter()
+        for config in configs:
+            setup.LLMMethodologySetup(config).run()
+        return projects / (time.perf_counter() - start)
+    return run
+
+def _replicate(template: Path, target: Path) -> None:
+    """Copy a project tree using hard links for its files."""
+    for dirpath, _, filenames in os.walk(template):
+        relative = Path(dirpath).relative_to(template)
+        (target / relative).mkdir(parents=True, exist_ok=True)
+        for filename in filenames:
+            os.link(Path(dirpath) / filename, target / relative / filename)
+
+def bench_validate(roots: int) -> Callable[[Path], float]:
+    """Project roots validated per second by `validate_projects()`."""
+    def run(scratch: Path) -> float:
+        template = scratch / "template"
+        setup.LLMMethodologySetup(setup.ProjectConfig(
+            name="template",
+            type="api",
+            technologies=["python"],
+            base_structure="standard",
+            documentation_path=template
+        )).run()
+        paths = [scratch / "roots" / str(index) for index in range(roots)]
+        for path in paths:
+            _replicate(template, path)
+
+        start = time.perf_counter()
+        results = validation.validate_projects(paths)
+        elapsed = time.perf_counter() - start
+        assert all(result.ok for result in results), "template project is invalid"
+        return roots / elapsed
+    return run
+
+def _synthetic_tree(root: Path, files: int, per_dir: int = 100) -> None:
+    """Legacy API-H2H tree with `files` small files across src and tests."""
+    (root / "src").mkdir(parents=True)
+    (root / "pyproject.toml").write_text(
+        '[tool.poetry]\nname = "synthetic"\n\n'
+        '[tool.poetry.dependencies]\npython = "^3.11"\n'
+    )
+    payload = b"x" * 512
+    for index in range(files - 1):
+        area = "src/pkg" if index % 2 else "tests/xml"
+        directory = root / area / f"d{index // per_dir:05d}"
+        if index % per_dir < 2:
+            directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"f{index}.dat").write_bytes(payload)
+
+def bench_migrate(files: int) -> Callable[[Path], float]:
+    """Files per second for a full `MigrationTool.run()`."""
+    def run(scratch: Path) -> float:
+        source = scratch / "legacy"
+        _synthetic_tree(source, files)
+        tool = migration.MigrationTool(
+            migration.MigrationConfig(source, scratch / "migrated")
+        )
+        start = time.perf_counter()
+        assert tool.run(), tool.errors
+        elapsed = time.perf_counter() - start
+        return tool.copy_stats.files / elapsed
+    return run
+
+def run_benchmarks(args: argparse.Namespace) -> Dict[str, Result]:
+    """Run the selected benchmarks and collect their results."""
+    suite = [(f"setup.{args.setup_projects}_projects", "projects/s",
+              bench_setup(args.setup_projects))]
+    suite += [(f"validate.{roots}_roots", "roots/s", bench_validate(roots))
+              for roots in args.validate_roots]
+    suite += [(f"migrate.{files}_files", "files/s", bench_migrate(files))
+              for files in args.migrate_files]
+
+    results: Dict[str, Result] = {}
+    with _quiet():
+        for name, unit, run in suite:
+            if args.only and not any(name.startswith(prefix) for prefix in args.only):
+                continue
+            value = _best(args.repeat, run)
+            results[name] = {"value": round(value, 2), "unit": unit}
+            print(f"{name:<28} {value:>12.2f} {unit}", flush=True)
+    return results
+
+def _metadata() -> Dict[str, object]:
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count()
+    }
+
+def compare(
+    baseline: Dict[str, Result],
+    current: Dict[str, Result],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[str]:
+    """Print a comparison table and return the regressed benchmarks.
+
+    A benchmark regresses when its throughput falls below the baseline by
+    more than `threshold` (a fraction).
+    """
+    regressions = []
+    print(f"{'benchmark':<28} {'baseline':>12} {'current':>12} {'change':>8}")
+    for name in sorted(set(baseline) | set(current)):
+        if name not in current:
+            print(f"{name:<28} {baseline[name]['value']:>12} {'-':>12} {'':>8}  missing")
+            continue
+        if name not in baseline:
+            print(f"{name:<28} {'-':>12} {current[name]['value']:>12} {'':>8}  new")
+            continue
+        old = float(baseline[name]["value"])
+        new = float(current[name]["value"])
+        change = (new - old) / old if old else 0.0
+        status = ""
+        if change < -threshold:
+            status = "REGRESSION"
+            regressions.append(name)
+        elif change > threshold:
+            status = "improved"
+        print(f"{name:<28} {old:>12.2f} {new:>12.2f} {change:>+8.1%}  {status}")
+    return regressions
+
+def _load(path: Path) -> Dict[str, Result]:
+    with path.open() as f:
+        return json.load(f)["benchmarks"]
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the benchmarks")
+    run.add_argument("--repeat", type=int, default=3, help="Runs per benchmark (best is kept)")
+    run.add_argument("--setup-projects", type=int, default=50, help="Projects per setup run")
+    run.add_argument(
+        "--validate-roots", type=int, nargs="*", default=[1000, 10000],
+        help="Project root counts to validate"
+    )
+    run.add_argument(
+        "--migrate-files", type=int, nargs="*", default=[10000],
+        help="Synthetic tree sizes to migrate"
+    )
+    run.add_argument(
+        "--only", nargs="*", default=[],
+        help="Only run benchmarks whose name starts with one of these prefixes"
+    )
+    run.add_argument("--output", type=Path, help="Write results to this JSON file")
+    run.add_argument(
+        "--save-baseline", action="store_true", help=f"Store the results as {BASELINE.name}"
+    )
+    run.add_argument(
+        "--compare", action="store_true", help="Compare the results with the baseline"
+    )
+    run.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+
+    check = commands.add_parser("compare", help="Compare results with a baseline")
+    check.add_argument("results", type=Path, help="Results file written by `run --output`")
+    check.add_argument("--baseline", type=Path, default=BASELINE)
+    check.add_argument(
+        "--threshold", type=float, default=DEFAULT_THRESHOLD,
+        help="Allowed slowdown as a fraction (default: %(default)s)"
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == "compare":
+        regressions = compare(_load(args.baseline), _load(args.results), args.threshold)
+        return 1 if regressions else 0
+
+    results = run_benchmarks(args)
+    document = {"meta": _metadata(), "benchmarks": results}
+    for path in [args.output, BASELINE if args.save_baseline else None]:
+        if path is not None:
+            path.write_text(json.dumps(document, indent=2) + "\n")
+    if args.compare:
+        print()
+        return 1 if compare(_load(BASELINE), results, args.threshold) else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,100 @@
+"""
+Batch project setup for Cline LLM Methodology.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+import json
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .setup import ProjectConfig, LLMMethodologySetup
+
+@dataclass
+class BatchResult:
+    """Outcome of a single project setup within a batch."""
+    name: str
+    path: Path
+    duration: float
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the project was set up without errors."""
+        return self.error is None
+
+def _parse_record(text: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """Decode a single JSON record, or describe why it is not one."""
+    try:
+        record = json.loads(text)
+    except ValueError as e:
+        return None, f"Invalid JSON: {e}"
+    if not isinstance(record, dict):
+        return None, f"Record must be a JSON object, not {type(record).__name__}"
+    return record, None
+
+def load_records(
+    source: Path
+) -> List[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]:
+    """Load project configuration records for a batch.
+
+    A record that is not valid JSON, or not a JSON object, does not stop
+    the others from loading; it is returned with its error instead.
+
+    Args:
+        source: JSONL file with one record per line, or a directory
+            containing one JSON file per project
+
+    Returns:
+        List of (origin, record, error) triples, where origin identifies
+        the line or file the record came from, and exactly one of record
+        and error is None
+
+    Raises:
+        OSError: If the source cannot be read
+    """
+    records = []
+    if source.is_dir():
+        for path in sorted(source.glob("*.json")):
+            records.append((path.name, *_parse_record(path.read_text())))
+    else:
+        with source.open() as f:
+            for lineno, line in enumerate(f, start=1):
+                if line.strip():
+                    records.append((f"{source.name}:{lineno}", *_parse_record(line)))
+    return records
+
+def _setup_one(config: ProjectConfig) -> BatchResult:
+    """Run a single project setup, capturing timing and failure."""
+    start = time.perf_counter()
+    error = None
+    try:
+        LLMMethodologySetup(config).run()
+    except Exception as e:
+        error = str(e) or type(e).__name__
+    return BatchResult(
+        name=config.name,
+        path=config.documentation_path,
+        duration=time.perf_counter() - start,
+        error=error
+    )
+
+def run_batch(
+    configs: Iterable[ProjectConfig],
+    workers: Optional[int] = None
+) -> List[BatchResult]:
+    """Set up many projects in one process using a thread pool.
+
+    Failures are recorded per project and never stop the rest of the batch.
+
+    Args:
+        configs: Project configurations to set up
+        workers: Maximum number of concurrent setups (defaults to the
+            executor's own choice)
+
+    Returns:
+        One result per configuration, in input order
+    """
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_setup_one, configs))
@@ -1,13 +1,20 @@
 """
 Command-line interface for Cline LLM Methodology setup.
+
+Only `click` is imported at module load. Each command imports the modules it
+needs when it runs, so `--help`, `init` and editor hooks start quickly.
 """
 
 import click
 from pathlib import Path
 import json
-from typing import Dict, Any
+from typing import TYPE_CHECKING, Dict, Any
+
+from .schema import SCHEMAS
 
-from .setup import ProjectConfig, LLMMethodologySetup
+if TYPE_CHECKING:
+    from .profiling import RunMetrics
+    from .validation import ProjectValidation
 
 def load_config(config_file: Path) -> Dict[str, Any]:
     """Load configuration from JSON file."""
@@ -18,18 +25,20 @@ def load_config(config_file: Path) -> Dict[str, Any]:
         raise click.ClickException(f"Error loading config file: {str(e)}")
 
 def validate_config(config: Dict[str, Any]) -> None:
-    """Validate configuration data."""
-    required_fields = ["name", "type", "technologies", "base_structure"]
-    missing = [field for field in required_fields if field not in config]
+    """Validate configuration data against the project config schema."""
+    from .schema import get_validator
+    
+    violations = get_validator("project_config")(config)
+    missing = [v.path for v in violations if v.kind == "required"]
     
     if missing:
         raise click.ClickException(
             f"Missing required fields in config: {', '.join(missing)}"
         )
         
-    if not isinstance(config["technologies"], list):
+    if violations:
         raise click.ClickException(
-            "Field 'technologies' must be a list"
+            "; ".join(str(violation) for violation in violations)
         )
 
 @click.group()
@@ -45,7 +54,37 @@ def cli():
     type=click.Path(path_type=Path),
     help='Output directory for project'
 )
-def setup(config_file: Path, output: Path | None):
+@click.option(
+    '--dry-run',
+    is_flag=True,
+    help='Show which files would change, with a diff, without writing'
+)
+@click.option(
+    '--events',
+    'events_file',
+    help="Write structured run events as JSON lines to this file ('-' for stderr)"
+)
+@click.option('--progress', is_flag=True, help='Show live progress')
+@click.option(
+    '--timings',
+    is_flag=True,
+    help='Report wall time, files and bytes written per step, and peak memory'
+)
+@click.option(
+    '--profile',
+    'profile_file',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write cProfile statistics (pstats format) to this file'
+)
+def setup(
+    config_file: Path,
+    output: Path | None,
+    dry_run: bool,
+    events_file: str | None,
+    progress: bool,
+    timings: bool,
+    profile_file: Path | None
+):
     """Setup new project using Cline LLM Methodology.
     
     CONFIG_FILE should be a JSON file with project configuration:
@@ -57,6 +96,12 @@ def setup(config_file: Path, output: Path | None):
         "base_structure": "standard"
     }
     """
+    from .events import run_events
+    from .profiling import profiled
+    from .setup import (
+        ProjectConfig, LLMMethodologySetup, configure_logging, flush_logging
+    )
+    
     try:
         # Load and validate config
         config = load_config(config_file)
@@ -74,11 +119,23 @@ def setup(config_file: Path, output: Path | None):
             documentation_path=doc_path
         )
         
-        # Run setup
-        setup = LLMMethodologySetup(project_config)
-        setup.run()
+        # Run setup; the log writer thread starts first so that it is not
+        # left profiled after the run
+        configure_logging()
+        with profiled(profile_file), run_events(events_file, progress) as events:
+            setup = LLMMethodologySetup(project_config, events=events)
+            setup.run(dry_run=dry_run, trace_memory=timings)
+        flush_logging()
+        _echo_metrics(setup.metrics() if timings else None, profile_file)
         
-        click.echo(f"\nProject setup complete: {doc_path}")
+        if dry_run:
+            diff = setup.diff()
+            if diff:
+                click.echo(diff)
+            click.echo(f"\nDry run for {doc_path}: {setup.change_summary()}")
+            return
+            
+        click.echo(f"\nProject setup complete: {doc_path} ({setup.change_summary()})")
         click.echo("\nNext steps:")
         click.echo("1. Review generated documentation in docs/")
         click.echo("2. Configure tools in tools_config.json")
@@ -88,66 +145,452 @@ def setup(config_file: Path, output: Path | None):
     except Exception as e:
         raise click.ClickException(str(e))
 
+@cli.command('setup-many')
+@click.argument('source', type=click.Path(exists=True, path_type=Path))
+@click.option(
+    '--output-root',
+    '-o',
+    type=click.Path(file_okay=False, path_type=Path),
+    default=Path("."),
+    help='Directory under which each project is created'
+)
+@click.option(
+    '--workers',
+    '-w',
+    type=click.IntRange(min=1),
+    help='Maximum number of projects set up concurrently'
+)
+def setup_many(source: Path, output_root: Path, workers: int | None):
+    """Setup many projects in a single process.
+
+    SOURCE is either a JSONL file with one project configuration per line,
+    or a directory of JSON configuration files. Each record uses the same
+    fields as the `setup` config file, plus an optional "output" path
+    (relative to --output-root, defaults to the project name).
+
+    Every project is attempted; failures are reported at the end.
+    """
+    import time
+    
+    from .batch import BatchResult, load_records, run_batch
+    from .setup import ProjectConfig, flush_logging
+    
+    try:
+        records = load_records(source)
+    except Exception as e:
+        raise click.ClickException(f"Error loading batch source: {str(e)}")
+
+    results = []
+    configs = []
+    for origin, record, error in records:
+        if record is None:
+            results.append(BatchResult(
+                name=origin, path=output_root, duration=0.0, error=f"{origin}: {error}"
+            ))
+            continue
+        try:
+            validate_config(record)
+        except click.ClickException as e:
+            results.append(BatchResult(
+                name=str(record.get("name", origin)),
+                path=output_root,
+                duration=0.0,
+                error=f"{origin}: {e.message}"
+            ))
+            continue
+
+        configs.append(ProjectConfig(
+            name=record["name"],
+            type=record["type"],
+            technologies=record["technologies"],
+            base_structure=record["base_structure"],
+            documentation_path=output_root / record.get("output", record["name"])
+        ))
+
+    start = time.perf_counter()
+    results.extend(run_batch(configs, workers=workers))
+    elapsed = time.perf_counter() - start
+    flush_logging()
+
+    click.echo("\nBatch results:")
+    for result in results:
+        if result.ok:
+            click.echo(f"  ✅ {result.name} ({result.duration:.3f}s) -> {result.path}")
+        else:
+            click.echo(f"  ❌ {result.name} ({result.duration:.3f}s): {result.error}")
+
+    failed = [result for result in results if not result.ok]
+    click.echo(
+        f"\n{len(results) - len(failed)} succeeded, {len(failed)} failed "
+        f"in {elapsed:.3f}s"
+    )
+
+    if failed:
+        raise click.ClickException(f"{len(failed)} of {len(results)} projects failed")
+
+def _echo_metrics(metrics: "RunMetrics | None", profile_file: Path | None) -> None:
+    """Print a run's step metrics and where its profile was written."""
+    if metrics is not None:
+        click.echo(f"\nStep timings:\n{metrics.report()}")
+    if profile_file is not None:
+        click.echo(f"\nProfile written to {profile_file} (inspect with python -m pstats)")
+
+def _echo_validation(result: "ProjectValidation") -> None:
+    """Print a human-readable validation report for one project."""
+    if result.missing_dirs:
+        click.echo("❌ Missing required directories:")
+        for dir_path in result.missing_dirs:
+            click.echo(f"  - {dir_path}")
+    else:
+        click.echo("✅ Directory structure valid")
+        
+    if result.missing_docs:
+        click.echo("\n❌ Missing required documentation:")
+        for doc_path in result.missing_docs:
+            click.echo(f"  - {doc_path}")
+    else:
+        click.echo("✅ Documentation valid")
+        
+    if result.config_status == "missing":
+        click.echo("\n❌ Missing tools_config.json")
+    elif result.config_status == "invalid":
+        click.echo("\n❌ Invalid tools_config.json format")
+        for error in result.config_errors:
+            click.echo(f"  - {error}")
+    else:
+        click.echo("✅ Configuration valid")
+        
+    if result.context_errors:
+        click.echo("\n❌ Invalid docs/methodology/context.yaml")
+        for error in result.context_errors:
+            click.echo(f"  - {error}")
+
 @cli.command()
-@click.argument('project_dir', type=click.Path(exists=True, path_type=Path))
-def validate(project_dir: Path):
-    """Validate existing project structure and configuration."""
+@click.argument(
+    'project_dirs',
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, file_okay=False, path_type=Path)
+)
+@click.option(
+    '--format',
+    'output_format',
+    type=click.Choice(["text", "json", "junit"]),
+    default="text",
+    help='Report format'
+)
+@click.option(
+    '--workers',
+    '-w',
+    type=click.IntRange(min=1),
+    help='Worker processes used when validating several projects'
+)
+def validate(project_dirs: tuple[Path, ...], output_format: str, workers: int | None):
+    """Validate existing project structure and configuration.
+    
+    Any number of PROJECT_DIRS can be given; they are validated in parallel.
+    Exits with status 1 if any project fails validation.
+    """
+    from .validation import to_json, to_junit, validate_projects
+    
     try:
-        # Check directory structure
-        required_dirs = [
-            "docs/methodology",
-            "docs/adr",
-            "src",
-            "tests",
-            "tools"
-        ]
+        results = validate_projects(list(project_dirs), workers=workers)
         
-        missing_dirs = []
-        for dir_path in required_dirs:
-            if not (project_dir / dir_path).exists():
-                missing_dirs.append(dir_path)
-                
-        if missing_dirs:
-            click.echo("❌ Missing required directories:")
-            for dir_path in missing_dirs:
-                click.echo(f"  - {dir_path}")
+        if output_format == "json":
+            click.echo(to_json(results))
+        elif output_format == "junit":
+            click.echo(to_junit(results))
+        elif len(results) == 1:
+            _echo_validation(results[0])
         else:
-            click.echo("✅ Directory structure valid")
-            
-        # Check documentation
-        required_docs = [
-            "docs/methodology/llm_methodology.md",
-            "docs/methodology/tools_integration.md",
-            "docs/methodology/project_initialization.md"
-        ]
-        
-        missing_docs = []
-        for doc_path in required_docs:
-            if not (project_dir / doc_path).exists():
-                missing_docs.append(doc_path)
+            for result in results:
+                click.echo(f"\n{result.root}")
+                _echo_validation(result)
+            failed = sum(1 for result in results if not result.ok)
+            click.echo(f"\n{len(results) - failed} valid, {failed} invalid")
                 
-        if missing_docs:
-            click.echo("\n❌ Missing required documentation:")
-            for doc_path in missing_docs:
-                click.echo(f"  - {doc_path}")
-        else:
-            click.echo("✅ Documentation valid")
+    except Exception as e:
+        raise click.ClickException(str(e))
+        
+    if not all(result.ok for result in results):
+        raise SystemExit(1)
+
+@cli.command('check-config')
+@click.argument(
+    'files',
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+@click.option(
+    '--schema',
+    type=click.Choice(sorted(SCHEMAS)),
+    help='Schema to check against (inferred from the file name by default)'
+)
+def check_config(files: tuple[Path, ...], schema: str | None):
+    """Check configuration files against their declared schema.
+    
+    Suitable as a pre-commit hook for tools_config.json and context.yaml.
+    """
+    from .schema import validate_file
+    
+    failed = 0
+    for path in files:
+        try:
+            violations = validate_file(path, schema)
+        except ValueError as e:
+            raise click.ClickException(str(e))
             
-        # Check configuration
-        config_file = project_dir / "tools_config.json"
-        if not config_file.exists():
-            click.echo("\n❌ Missing tools_config.json")
-        else:
-            try:
-                with config_file.open() as f:
-                    json.load(f)
-                click.echo("✅ Configuration valid")
-            except json.JSONDecodeError:
-                click.echo("\n❌ Invalid tools_config.json format")
+        if violations:
+            failed += 1
+            for violation in violations:
+                click.echo(f"{path}: {violation}")
                 
-    except Exception as e:
+    if failed:
+        raise click.ClickException(f"{failed} file(s) do not match their schema")
+
+@cli.command()
+@click.argument('source', type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.argument('target', type=click.Path(file_okay=False, path_type=Path))
+@click.option(
+    '--mapping',
+    '-m',
+    'mapping_file',
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help='YAML or JSON mapping file (defaults to the API-H2H layout)'
+)
+@click.option(
+    '--workers',
+    '-w',
+    type=click.IntRange(min=1),
+    help='Number of copy threads'
+)
+@click.option('--resume', is_flag=True, help='Resume an interrupted migration')
+@click.option(
+    '--incremental',
+    is_flag=True,
+    help='Only copy new or changed files (size and mtime)'
+)
+@click.option(
+    '--checksum',
+    is_flag=True,
+    help='With --incremental, also compare file contents'
+)
+@click.option(
+    '--delete',
+    is_flag=True,
+    help='With --incremental, delete migrated files whose source is gone'
+)
+@click.option(
+    '--dedup',
+    type=click.Choice(["auto", "reflink", "hardlink"]),
+    help='Store identical files once, linking duplicates'
+)
+@click.option(
+    '--events',
+    'events_file',
+    help="Write structured run events as JSON lines to this file ('-' for stderr)"
+)
+@click.option('--progress', is_flag=True, help='Show live progress')
+@click.option(
+    '--timings',
+    is_flag=True,
+    help='Report wall time, files and bytes written per step, and peak memory'
+)
+@click.option(
+    '--profile',
+    'profile_file',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write cProfile statistics (pstats format) to this file'
+)
+def migrate(
+    source: Path,
+    target: Path,
+    mapping_file: Path | None,
+    workers: int | None,
+    resume: bool,
+    incremental: bool,
+    checksum: bool,
+    delete: bool,
+    dedup: str | None,
+    events_file: str | None,
+    progress: bool,
+    timings: bool,
+    profile_file: Path | None
+):
+    """Migrate a legacy project tree into the methodology layout.
+
+    Which files are copied, and where, is decided by the mapping file:
+    ordered glob rules, rename rules and include/exclude filters. A report
+    is written to TARGET/migration_report.json.
+    """
+    from .events import run_events
+    from .mapping import load_mapping
+    from .migration import MigrationConfig, MigrationTool
+    from .profiling import profiled
+
+    try:
+        mapping = load_mapping(mapping_file)
+    except ValueError as e:
         raise click.ClickException(str(e))
 
+    with profiled(profile_file), run_events(events_file, progress) as events:
+        tool = MigrationTool(
+            MigrationConfig(source, target, mapping),
+            workers=workers,
+            incremental=incremental,
+            checksum=checksum,
+            delete=delete,
+            dedup=dedup,
+            events=events
+        )
+        success = tool.run(resume=resume, trace_memory=timings)
+    _echo_metrics(tool.metrics() if timings else None, profile_file)
+
+    for warning in tool.warnings:
+        click.echo(f"⚠️  {warning}")
+    if not success:
+        raise click.ClickException("; ".join(tool.errors) or "Migration failed")
+    click.echo(f"✅ Migrated {source} -> {target} ({tool.copy_stats})")
+
+@cli.command()
+@click.option(
+    '--socket',
+    'socket_path',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Unix socket to listen on, in a directory only you can access '
+         '(defaults to a per-user socket)'
+)
+@click.option(
+    '--idle-timeout',
+    type=click.FloatRange(min=0, min_open=True),
+    default=600.0,
+    show_default=True,
+    help='Seconds without requests before the server exits'
+)
+def serve(socket_path: Path | None, idle_timeout: float):
+    """Run a warm command server for fast repeated invocations.
+    
+    Commands sent with the `llm-setup-client` thin client run in this
+    process, with templates and validators already loaded. The client
+    starts a server automatically when none is running.
+    """
+    from .server import serve as run_server
+    
+    try:
+        run_server(socket_path, idle_timeout)
+    except (PermissionError, RuntimeError) as e:
+        raise click.ClickException(str(e))
+
+@cli.command()
+@click.argument('query')
+@click.option(
+    '--project',
+    '-p',
+    'project_dir',
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=Path("."),
+    help='Project whose documentation is searched'
+)
+@click.option(
+    '--limit',
+    '-n',
+    type=click.IntRange(min=1),
+    default=5,
+    show_default=True,
+    help='Maximum number of results'
+)
+@click.option(
+    '--format',
+    'output_format',
+    type=click.Choice(["text", "json"]),
+    default="text",
+    help='Output format'
+)
+@click.option('--no-update', is_flag=True, help='Search the index as stored, without re-indexing')
+def search(query: str, project_dir: Path, limit: int, output_format: str, no_update: bool):
+    """Search the project's ADRs, analysis, guides and methodology docs.
+
+    The index is kept in .llm_docs_index and only files changed since the
+    last search are re-indexed.
+    """
+    from .search import DocIndex
+
+    try:
+        index = DocIndex(project_dir)
+        if not no_update:
+            index.update()
+        hits = index.search(query, limit)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e))
+
+    if output_format == "json":
+        click.echo(json.dumps([hit.to_dict() for hit in hits], indent=2, ensure_ascii=False))
+        return
+    if not hits:
+        click.echo("No matching documentation")
+        return
+    for hit in hits:
+        click.echo(f"{hit.path}:{hit.line}  {hit.heading}  ({hit.score:.2f})")
+        if hit.snippet:
+            click.echo(f"    {hit.snippet}")
+
+@cli.command()
+@click.option(
+    '--project',
+    '-p',
+    'project_dir',
+    type=click.Path(exists=True, file_okay=False, path_type=Path),
+    default=Path("."),
+    help='Project to build the resume context for'
+)
+@click.option(
+    '--budget',
+    '-b',
+    type=click.IntRange(min=1),
+    default=4000,
+    show_default=True,
+    help='Maximum tokens of the packed prompt'
+)
+@click.option('--query', '-q', help='Focus of the session (defaults to the project state)')
+@click.option(
+    '--output',
+    '-o',
+    'output_file',
+    type=click.Path(dir_okay=False, path_type=Path),
+    help='Write the prompt to a file instead of stdout'
+)
+@click.option('--report', is_flag=True, help='Print the packed sections as JSON instead')
+def context(
+    project_dir: Path,
+    budget: int,
+    query: str | None,
+    output_file: Path | None,
+    report: bool
+):
+    """Pack a token-budgeted resume prompt for a project.
+
+    The project state from context.yaml comes first, followed by the most
+    relevant and most recently changed documentation sections that fit.
+    """
+    from .context import pack_context
+
+    try:
+        packed = pack_context(project_dir, budget=budget, query=query)
+    except (OSError, ValueError) as e:
+        raise click.ClickException(str(e))
+
+    if report:
+        click.echo(json.dumps(packed.to_dict(), indent=2, ensure_ascii=False))
+    elif output_file:
+        output_file.write_text(packed.prompt, encoding="utf-8")
+        click.echo(
+            f"✅ Packed {len(packed.sections)} sections "
+            f"({packed.tokens}/{packed.budget} tokens) -> {output_file}"
+        )
+    else:
+        click.echo(packed.prompt, nl=False)
+
 @cli.command()
 def init():
     """Initialize new project configuration."""
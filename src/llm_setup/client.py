@@ -0,0 +1,202 @@
+"""
+Thin client for the llm-setup command server.
+
+This module only uses the standard library and imports nothing heavy, so a
+command forwarded to a warm server costs one interpreter start plus a socket
+round trip. The server is started on demand and replaced when its package
+version differs from the client's.
+"""
+
+import json
+import os
+import socket
+import stat
+import sys
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+if TYPE_CHECKING:
+    import subprocess
+
+from . import __version__
+
+DEFAULT_IDLE_TIMEOUT = 600.0
+
+STARTUP_TIMEOUT = 10.0
+
+def default_socket_path() -> Path:
+    """Per-user socket path, overridable with LLM_SETUP_SOCKET.
+
+    The socket lives in its own directory under XDG_RUNTIME_DIR, or under the
+    system temporary directory when that is unset; `ensure_private_dir()`
+    creates that directory and checks that only the current user can use it.
+    """
+    override = os.environ.get("LLM_SETUP_SOCKET")
+    if override:
+        return Path(override)
+    base = os.environ.get("XDG_RUNTIME_DIR")
+    if not base:
+        import tempfile
+
+        base = tempfile.gettempdir()
+    return Path(base) / f"llm-setup-{os.getuid()}" / "server.sock"
+
+def ensure_private_dir(directory: Path) -> None:
+    """Create the socket directory with mode 0700 if it is missing.
+
+    Raises:
+        PermissionError: If the directory is a symlink, is owned by another
+            user, or is accessible by group or others
+    """
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    info = os.lstat(directory)
+    if (
+        not stat.S_ISDIR(info.st_mode)
+        or info.st_uid != os.getuid()
+        or info.st_mode & 0o077
+    ):
+        raise PermissionError(
+            f"Socket directory {directory} must be owned by the current user "
+            "and accessible only by them (mode 0700)"
+        )
+
+def _check_owner(socket_path: Path) -> None:
+    """Refuse to talk to a socket another user created.
+
+    Raises:
+        FileNotFoundError: If no socket exists at the path
+        PermissionError: If the path is not a socket owned by the current user
+    """
+    info = os.lstat(socket_path)
+    if not stat.S_ISSOCK(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"{socket_path} is not a socket owned by the current user")
+
+def _send(socket_path: Path, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Send one request and read one response line."""
+    _check_owner(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(socket_path))
+        sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as f:
+            line = f.readline()
+    if not line:
+        raise ConnectionError("Server closed the connection without a response")
+    return json.loads(line)
+
+def start_server(
+    socket_path: Path,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+) -> "subprocess.Popen":
+    """Start a detached server process and wait until it accepts requests."""
+    import subprocess
+
+    process = subprocess.Popen(
+        [
+            sys.executable, "-m", f"{__package__}.server",
+            "--socket", str(socket_path),
+            "--idle-timeout", str(idle_timeout)
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Server exited with status {process.returncode}")
+        try:
+            _send(socket_path, {"command": "ping", "version": __version__})
+            return process
+        except OSError:
+            time.sleep(0.02)
+    process.kill()
+    raise TimeoutError(f"Server did not start within {STARTUP_TIMEOUT:.0f}s")
+
+def request(
+    command: str,
+    socket_path: Optional[Path] = None,
+    autostart: bool = True,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    **params: Any
+) -> Dict[str, Any]:
+    """Send a request to the server, starting or replacing it if needed.
+
+    Args:
+        command: Server command ("run", "ping" or "shutdown")
+        socket_path: Server socket (defaults to `default_socket_path()`)
+        autostart: Start a server when none is listening
+        idle_timeout: Idle timeout for a server started by this call
+        **params: Command parameters
+
+    Returns:
+        Decoded server response
+    """
+    socket_path = socket_path or default_socket_path()
+    payload = {"command": command, "version": __version__, **params}
+
+    for attempt in range(2):
+        try:
+            response = _send(socket_path, payload)
+        except (FileNotFoundError, ConnectionRefusedError):
+            if not autostart or command == "shutdown":
+                raise
+            start_server(socket_path, idle_timeout)
+            continue
+
+        if response.get("error") != "version_mismatch" or attempt:
+            return response
+
+        # The old server shuts itself down; wait for it to release the socket
+        deadline = time.monotonic() + STARTUP_TIMEOUT
+        while socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.02)
+        if not autostart:
+            return response
+        start_server(socket_path, idle_timeout)
+
+    return _send(socket_path, payload)
+
+def run(args: List[str], **kwargs: Any) -> Dict[str, Any]:
+    """Run an llm-setup command line on the server.
+
+    Args:
+        args: Command-line arguments, as passed to `llm-setup`
+        **kwargs: Passed on to `request()`
+
+    Returns:
+        Response with "exit_code" and "output"
+    """
+    return request("run", args=args, cwd=os.getcwd(), **kwargs)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Forward an llm-setup command line to the server.
+
+    `--stop` and `--ping` control the server itself; everything else is run
+    exactly as `llm-setup` would run it.
+    """
+    args = list(sys.argv[1:] if argv is None else argv)
+
+    if args == ["--stop"]:
+        try:
+            request("shutdown", autostart=False)
+        except (FileNotFoundError, ConnectionRefusedError):
+            pass
+        return 0
+
+    if args == ["--ping"]:
+        response = request("ping")
+        print(f"llm-setup server {response['version']} (pid {response['pid']})")
+        return 0
+
+    response = run(args)
+    if not response.get("ok"):
+        print(f"Error: {response.get('error')}", file=sys.stderr)
+        return 1
+    sys.stdout.write(response["output"])
+    return response["exit_code"]
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,261 @@
+"""
+Token-budgeted resume context for a project.
+
+`pack_context()` assembles the prompt an agent needs to resume work: the
+project state from `docs/methodology/context.yaml`, followed by the
+documentation sections that matter most, until a token budget is spent.
+
+Sections come from the documentation search index (see `search.py`), so
+only files changed since the last run are re-read for ranking. Each section
+is scored by
+
+    relevance_weight * relevance + recency_weight * recency
+
+where relevance is its BM25 score for the focus query (by default the
+project name, type, technologies, phase and mode), scaled to [0, 1], and
+recency halves every `half_life` days since its file was last modified.
+Sections are packed greedily by score; one that does not fit is skipped in
+favour of smaller ones further down.
+
+Token counts are estimates (a token per punctuation mark, and per word plus
+one for every further five characters) and are cached per section, keyed by a
+digest of its text, in `TOKEN_CACHE_FILE` at the project root.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from typing import Any, Dict, List, Optional
+
+from .search import DocIndex
+from .validation import CONTEXT_FILE
+
+DEFAULT_BUDGET = 4000
+
+DEFAULT_HALF_LIFE = 14.0
+
+TOKEN_CACHE_FILE = ".llm_context_tokens"
+
+logger = logging.getLogger(__name__)
+
+_PIECE = re.compile(r"\w+|[^\w\s]")
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a text, without a model tokenizer."""
+    return sum(
+        1 + (len(piece) - 1) // 5 if piece[0].isalnum() or piece[0] == "_" else 1
+        for piece in _PIECE.findall(text)
+    )
+
+class TokenCache:
+    """Token counts keyed by a digest of the counted text."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._counts: Dict[str, int] = {}
+        self._used: Dict[str, int] = {}
+        try:
+            self._counts = json.loads(path.read_text())["counts"]
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    def count(self, text: str) -> int:
+        """Token count of a text, estimated only if it is not cached."""
+        key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        tokens = self._counts.get(key)
+        if tokens is None:
+            self.misses += 1
+            tokens = estimate_tokens(text)
+        else:
+            self.hits += 1
+        self._used[key] = tokens
+        return tokens
+
+    def save(self) -> None:
+        """Write the counts used since the cache was opened, dropping the
+        rest, if anything changed."""
+        if self._used == self._counts:
+            return
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_text(json.dumps({"version": 1, "counts": self._used}))
+        os.replace(temporary, self.path)
+        self._counts = dict(self._used)
+
+@dataclass
+class PackedSection:
+    """A documentation section included in a packed context."""
+    path: str
+    heading: str
+    line: int
+    tokens: int
+    score: float
+
+@dataclass
+class PackedContext:
+    """Result of packing a project's resume context."""
+    prompt: str
+    tokens: int
+    budget: int
+    query: str
+    sections: List[PackedSection] = field(default_factory=list)
+    skipped: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    duration: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain representation, without the prompt, for reports."""
+        data = asdict(self)
+        del data["prompt"]
+        return data
+
+def load_context(root: Path) -> Dict[str, Any]:
+    """Project context from `docs/methodology/context.yaml`, or {} if the
+    project has none.
+
+    Raises:
+        ValueError: If the file is not valid YAML
+    """
+    import yaml
+
+    path = Path(root) / CONTEXT_FILE
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return {}
+    try:
+        context = yaml.load(text, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid {CONTEXT_FILE}: {e}")
+    return context if isinstance(context, dict) else {}
+
+def default_query(context: Dict[str, Any]) -> str:
+    """Focus query built from the project description and current state."""
+    project = context.get("project") or {}
+    state = context.get("state") or {}
+    terms = [project.get("name"), project.get("type"), state.get("phase"), state.get("mode")]
+    terms.extend(project.get("technologies") or [])
+    return " ".join(str(term) for term in terms if term)
+
+def _render_state(context: Dict[str, Any]) -> str:
+    """Markdown summary of context.yaml."""
+    project = context.get("project") or {}
+    state = context.get("state") or {}
+    lines = ["# Project context", ""]
+    if project:
+        technologies = ", ".join(project.get("technologies") or [])
+        lines.append(f"- Project: {project.get('name')} ({project.get('type')})")
+        if technologies:
+            lines.append(f"- Technologies: {technologies}")
+    if state:
+        lines.append(
+            f"- Phase: {state.get('phase')}, progress {state.get('progress')}%, "
+            f"mode {state.get('mode')}"
+        )
+    metrics = context.get("metrics") or {}
+    if metrics:
+        lines.append("- Metrics: " + ", ".join(f"{k} {v}%" for k, v in metrics.items()))
+    return "\n".join(lines)
+
+def _fit_header(header: str, budget: int) -> str:
+    """The project state header, with trailing lines dropped until it fits
+    the budget, or "" if not even its title does."""
+    lines = header.splitlines()
+    while lines and estimate_tokens("\n".join(lines)) > budget:
+        lines.pop()
+    fitted = "\n".join(lines).strip()
+    if fitted != header:
+        if fitted:
+            logger.warning("Project state truncated to fit a budget of %d tokens", budget)
+        else:
+            logger.warning("Project state skipped: it does not fit a budget of %d tokens", budget)
+    return fitted
+
+def pack_context(
+    root: Path,
+    budget: int = DEFAULT_BUDGET,
+    query: Optional[str] = None,
+    relevance_weight: float = 0.7,
+    recency_weight: float = 0.3,
+    half_life: float = DEFAULT_HALF_LIFE,
+    now: Optional[float] = None
+) -> PackedContext:
+    """Build a resume prompt for a project within a token budget.
+
+    Args:
+        root: Project root
+        budget: Maximum tokens of the prompt, project state included (the
+            state is truncated, or left out, if it alone exceeds the budget)
+        query: Focus of the session (defaults to `default_query()`)
+        relevance_weight: Weight of the query relevance in a section's score
+        recency_weight: Weight of the file's recency in a section's score
+        half_life: Days after which a file's recency score halves
+        now: Reference time for recency (defaults to the current time)
+
+    Raises:
+        ValueError: If the budget is not positive or context.yaml is invalid
+    """
+    if budget <= 0:
+        raise ValueError("Token budget must be positive")
+    started = time.perf_counter()
+    root = Path(root)
+    now = time.time() if now is None else now
+    context = load_context(root)
+    query = query or default_query(context)
+
+    index = DocIndex(root)
+    index.update()
+    relevance = {
+        (hit.path, hit.line): hit.score
+        for hit in index.search(query, limit=len(index.sections), snippets=False)
+    }
+    best = max(relevance.values(), default=0.0) or 1.0
+
+    candidates = []
+    for path, heading, first, last, _ in index.sections:
+        age = max(0.0, now - index.files[path][1] / 1e9) / 86400
+        score = (
+            relevance_weight * relevance.get((path, first), 0.0) / best
+            + recency_weight * 0.5 ** (age / half_life)
+        )
+        candidates.append((score, path, heading, first, last))
+    candidates.sort(key=lambda candidate: (-candidate[0], candidate[1], candidate[3]))
+
+    cache = TokenCache(root / TOKEN_CACHE_FILE)
+    header = _fit_header(_render_state(context), budget) if context else ""
+    parts = [header] if header else []
+    used = cache.count(header) if header else 0
+    packed = PackedContext("", 0, budget, query)
+    lines: Dict[str, List[str]] = {}
+    for score, path, heading, first, last in candidates:
+        if path not in lines:
+            lines[path] = (root / path).read_text(
+                encoding="utf-8", errors="replace"
+            ).splitlines()
+        body = "\n".join(lines[path][first - 1:last]).strip()
+        if not body.partition("\n")[2].strip():
+            # A heading with nothing under it before the next one
+            continue
+        block = f"## {path} (line {first})\n\n{body}"
+        tokens = cache.count(block)
+        if used + tokens > budget:
+            packed.skipped += 1
+            continue
+        used += tokens
+        parts.append(block)
+        packed.sections.append(PackedSection(path, heading, first, tokens, round(score, 4)))
+    cache.save()
+
+    packed.prompt = "\n\n".join(parts) + "\n"
+    packed.tokens = used
+    packed.cache_hits = cache.hits
+    packed.cache_misses = cache.misses
+    packed.duration = time.perf_counter() - started
+    return packed
@@ -0,0 +1,199 @@
+"""
+Structured event stream for setup and migration runs.
+
+Runs report what they do as events: `run_start`, `step_start`, `step_end`
+(with duration, files and bytes), periodic `progress` while copying, and
+`run_end`. Events are written as JSON lines and passed to subscribers such
+as the live `RichProgress` view.
+
+A stream with no sink and no subscriber is disabled: `emit()` returns
+immediately and hot loops check `enabled` before building an event, so
+runs that do not ask for events pay nothing for them.
+"""
+
+from contextlib import contextmanager
+import json
+import sys
+import threading
+import time
+import uuid
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional
+
+Event = Dict[str, Any]
+
+Subscriber = Callable[[Event], None]
+
+PROGRESS_INTERVAL = 0.5
+
+class EventStream:
+    """Thread-safe emitter of structured run events."""
+
+    def __init__(self, sink: Optional[IO[str]] = None, close_sink: bool = False):
+        """Create an event stream.
+
+        Args:
+            sink: Text stream receiving one JSON object per line
+            close_sink: Close the sink when the stream is closed
+        """
+        self.run_id = uuid.uuid4().hex[:12]
+        self._sink = sink
+        self._close_sink = close_sink
+        self._subscribers: List[Subscriber] = []
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether anything consumes the events."""
+        return self._sink is not None or bool(self._subscribers)
+
+    def subscribe(self, subscriber: Subscriber) -> None:
+        """Call `subscriber` with every event emitted from now on."""
+        self._subscribers.append(subscriber)
+
+    def emit(self, event: str, **fields: Any) -> None:
+        """Emit an event with the given fields."""
+        if not self.enabled:
+            return
+        record: Event = {"ts": time.time(), "run": self.run_id, "event": event, **fields}
+        with self._lock:
+            if self._sink is not None:
+                self._sink.write(json.dumps(record, default=str) + "\n")
+                self._sink.flush()
+            for subscriber in self._subscribers:
+                subscriber(record)
+
+    @contextmanager
+    def step(self, name: str, **fields: Any) -> Iterator[Dict[str, Any]]:
+        """Emit `step_start` and `step_end` around a block.
+
+        The yielded dict is added to the `step_end` event, so the block can
+        report counters such as files and bytes.
+        """
+        if not self.enabled:
+            yield {}
+            return
+        result: Dict[str, Any] = {}
+        self.emit("step_start", step=name, **fields)
+        start = time.perf_counter()
+        try:
+            yield result
+        except BaseException as e:
+            result.pop("ok", None)
+            self.emit(
+                "step_end", step=name, ok=False, error=str(e),
+                duration=time.perf_counter() - start, **result
+            )
+            raise
+        self.emit(
+            "step_end", step=name, ok=result.pop("ok", True),
+            duration=time.perf_counter() - start, **result
+        )
+
+    def close(self) -> None:
+        """Flush and release the sink."""
+        if self._sink is not None:
+            self._sink.flush()
+            if self._close_sink:
+                self._sink.close()
+
+NULL_EVENTS = EventStream()
+
+def open_events(path: Optional[str]) -> EventStream:
+    """Create an event stream writing JSON lines to a file.
+
+    Args:
+        path: Output file, "-" for standard error, or None for a stream
+            without a sink (subscribers can still be added)
+    """
+    if path is None:
+        return EventStream()
+    if path == "-":
+        return EventStream(sys.stderr)
+    return EventStream(open(path, "a", encoding="utf-8"), close_sink=True)
+
+@contextmanager
+def run_events(path: Optional[str] = None, progress: bool = False) -> Iterator[EventStream]:
+    """Event stream for a command-line run.
+
+    Args:
+        path: JSON-lines output, as for `open_events()`
+        progress: Show a live `RichProgress` view while the block runs
+    """
+    stream = open_events(path)
+    try:
+        if not progress:
+            yield stream
+            return
+        with RichProgress() as view:
+            stream.subscribe(view)
+            yield stream
+    finally:
+        stream.close()
+
+class RichProgress:
+    """Live progress view driven by an event stream.
+
+    Shows one line per step with its elapsed time, and for copy steps the
+    files done out of the total (once known) and throughput.
+    """
+
+    def __init__(self, console: Any = None):
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            SpinnerColumn,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
+        self.progress = Progress(
+            SpinnerColumn(),
+            TextColumn("{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TextColumn("{task.fields[rate]}"),
+            TimeElapsedColumn(),
+            console=console,
+            transient=False
+        )
+        self._tasks: Dict[str, Any] = {}
+
+    def __enter__(self) -> "RichProgress":
+        self.progress.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.progress.stop()
+
+    def __call__(self, event: Event) -> None:
+        kind = event["event"]
+        if kind == "step_start":
+            self._tasks[event["step"]] = self.progress.add_task(
+                event["step"], total=None, rate=""
+            )
+            return
+
+        task = self._tasks.get(event.get("step", ""))
+        if task is None:
+            return
+        if kind == "progress":
+            rate = event.get("bytes_per_second")
+            self.progress.update(
+                task,
+                completed=event.get("files", 0),
+                total=event.get("total_files"),
+                rate=f"{rate / 1e6:.1f} MB/s" if rate else ""
+            )
+        elif kind == "step_end":
+            if "files" in event:
+                completed = event["files"] + event.get("skipped", 0)
+            else:
+                completed = 1
+            description = event["step"] if event.get("ok", True) else f"[red]{event['step']}"
+            self.progress.update(
+                task,
+                completed=completed,
+                total=completed,
+                description=description
+            )
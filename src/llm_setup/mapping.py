@@ -0,0 +1,309 @@
+"""
+Declarative path mapping for project migrations.
+
+A mapping file lists which source paths are migrated and where they go:
+
+    rules:
+      - source: docs/prompt_llm/**
+        target: docs/methodology
+      - source: "tests/{unit,integration,xml}/**"
+        target: tests
+      - source: pyproject.toml
+        target: pyproject.toml
+    rename:
+      - pattern: '\\.markdown$'
+        replace: .md
+    include: ["**"]
+    exclude: [__pycache__, "*.pyc"]
+    required: [pyproject.toml, src, tests]
+
+Rules are tried in order and the first match wins. The part of a path below
+the rule's fixed prefix (everything before the first wildcard) is kept under
+the target; a rule without wildcards maps one file to exactly its target.
+Globs support `*`, `**`, `?`, `[...]` and `{a,b}`. Include and exclude
+patterns without a slash match any path component, like .gitignore.
+
+All rules are compiled into a single regular expression, and so are the
+include and exclude filters, so each path is matched once rather than once
+per rule, and directories no rule can reach are never listed.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+import json
+import os
+import re
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Sequence, Tuple
+
+DEFAULT_MAPPING: Dict[str, Any] = {
+    "rules": [
+        {"source": "docs/adr/**", "target": "docs/adr"},
+        {"source": "docs/migration/**", "target": "docs/migration"},
+        {"source": "docs/prompt_llm/**", "target": "docs/methodology"},
+        {"source": "docs/analysis/**", "target": "docs/analysis"},
+        {"source": "docs/guides/**", "target": "docs/guides"},
+        {"source": "tests/{unit,integration,xml}/**", "target": "tests"},
+        {"source": "src/**", "target": "src"},
+        {"source": "pyproject.toml", "target": "pyproject.toml"},
+        {"source": "pytest.ini", "target": "pytest.ini"},
+        {"source": ".env.example", "target": ".env.example"},
+        {"source": ".gitignore", "target": ".gitignore"},
+        {"source": "README.md", "target": "README.md"}
+    ],
+    "required": ["pyproject.toml", "src", "tests"]
+}
+
+_WILDCARDS = re.compile(r"[*?\[{]")
+
+def _segment_to_regex(segment: str) -> str:
+    """Translate one glob path segment to a regular expression."""
+    out = []
+    i = 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = segment.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = segment[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body}]")
+                i = end
+        elif char == "{":
+            end = segment.find("}", i)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                options = segment[i + 1:end].split(",")
+                out.append("(?:" + "|".join(_segment_to_regex(o) for o in options) + ")")
+                i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+def glob_to_regex(glob: str) -> str:
+    """Translate a path glob to a regular expression (without anchors)."""
+    segments = glob.strip("/").split("/")
+    out = []
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            out.append(".*" if last else "(?:[^/]+/)*")
+        else:
+            out.append(_segment_to_regex(segment) + ("" if last else "/"))
+    return "".join(out)
+
+def _split_prefix(glob: str) -> Tuple[str, str]:
+    """Split a glob into its fixed directory prefix and the wildcard rest."""
+    segments = glob.strip("/").split("/")
+    for index, segment in enumerate(segments):
+        if _WILDCARDS.search(segment):
+            return "/".join(segments[:index]), "/".join(segments[index:])
+    return "/".join(segments), ""
+
+def _directory_regex(rest: str) -> str:
+    """Expression matching "/"-prefixed directories below a rule's fixed
+    prefix that can contain files matching the wildcard part `rest`."""
+    segments = rest.split("/")
+    if segments[-1] != "**":
+        segments = segments[:-1]
+    out = ""
+    for segment in reversed(segments):
+        if segment == "**":
+            out = "(?:/.*)?"
+        else:
+            out = f"(?:/{_segment_to_regex(segment)}{out})?"
+    return out
+
+def _filter_regex(patterns: Sequence[str]) -> Optional[Pattern[str]]:
+    """Compile include/exclude patterns into one expression.
+
+    A pattern also matches everything below the paths it matches.
+    """
+    if not patterns:
+        return None
+    parts = []
+    for pattern in patterns:
+        body = glob_to_regex(pattern)
+        if "/" not in pattern.strip("/"):
+            body = f"(?:[^/]+/)*{body}"
+        parts.append(f"{body}(?:/.*)?")
+    return re.compile("|".join(f"(?:{part})" for part in parts))
+
+@dataclass(frozen=True)
+class MappingRule:
+    """Maps source paths matching a glob below a target path."""
+    source: str
+    target: str
+
+@dataclass(frozen=True)
+class RenameRule:
+    """Regular-expression substitution applied to mapped target paths."""
+    pattern: str
+    replace: str
+
+@dataclass
+class Mapping:
+    """Compiled set of mapping rules and filters."""
+    rules: List[MappingRule]
+    rename: List[RenameRule] = field(default_factory=list)
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+    required: List[str] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        alternatives = []
+        directories = []
+        # Fixed directories every rule needs to reach: the prefix of a tree
+        # rule, or the parent of a single-file rule
+        self._anchors: List[str] = []
+        for index, rule in enumerate(self.rules):
+            prefix, rest = _split_prefix(rule.source)
+            if rest:
+                head = re.escape(prefix + "/") if prefix else ""
+                alternatives.append(f"(?P<m{index}>{head}(?P<r{index}>{glob_to_regex(rest)}))")
+                directories.append(
+                    re.escape(f"/{prefix}" if prefix else "") + _directory_regex(rest)
+                )
+                self._anchors.append(prefix)
+            else:
+                alternatives.append(f"(?P<m{index}>{re.escape(prefix)})")
+                self._anchors.append(prefix.rpartition("/")[0])
+        self._matcher = re.compile("|".join(alternatives)) if alternatives else None
+        self._directories = (
+            re.compile("|".join(f"(?:{d})" for d in directories)) if directories else None
+        )
+        self._renames = [(re.compile(r.pattern), r.replace) for r in self.rename]
+        self._include = _filter_regex(self.include)
+        self._exclude = _filter_regex(self.exclude)
+
+    def excluded(self, path: str) -> bool:
+        """Whether a relative path (or a directory containing it) is filtered out."""
+        if self._exclude is not None and self._exclude.fullmatch(path):
+            return True
+        return self._include is not None and not self._include.fullmatch(path)
+
+    def match(self, path: str) -> Optional[Tuple[int, str]]:
+        """Map a relative source path.
+
+        Args:
+            path: POSIX path relative to the source root
+
+        Returns:
+            (index of the matching rule, target path relative to the target
+            root), or None if the path is not migrated
+        """
+        if self._matcher is None or self.excluded(path):
+            return None
+        found = self._matcher.fullmatch(path)
+        if found is None:
+            return None
+        index = int(found.lastgroup[1:])
+        rule = self.rules[index]
+        rest = found.group(f"r{index}") if f"r{index}" in found.re.groupindex else None
+        target = f"{rule.target.rstrip('/')}/{rest}" if rest else rule.target
+        for pattern, replace in self._renames:
+            target = pattern.sub(replace, target)
+        return index, target.lstrip("/")
+
+    def descend(self, directory: str) -> bool:
+        """Whether files below a relative directory can be migrated."""
+        if self._exclude is not None and self._exclude.fullmatch(directory):
+            return False
+        if self._directories is not None and self._directories.fullmatch("/" + directory):
+            return True
+        return any(
+            anchor == directory or anchor.startswith(directory + "/")
+            for anchor in self._anchors
+        )
+
+    def walk(self, root: Path) -> Iterator[Tuple[Path, str, int, os.stat_result]]:
+        """List the files of a source tree that are migrated.
+
+        Only directories that some rule can reach are listed.
+
+        Yields:
+            (source file, target path relative to the target root, rule
+            index, stat of the source file)
+        """
+        pending = [""]
+        while pending:
+            relative = pending.pop()
+            try:
+                iterator = os.scandir(root / relative if relative else root)
+            except OSError:
+                continue
+            with iterator:
+                for entry in iterator:
+                    path = f"{relative}/{entry.name}" if relative else entry.name
+                    if entry.is_dir():
+                        if self.descend(path):
+                            pending.append(path)
+                        continue
+                    mapped = self.match(path)
+                    if mapped is not None:
+                        yield Path(entry.path), mapped[1], mapped[0], entry.stat()
+
+    def target_roots(self) -> List[str]:
+        """Target directories populated by tree rules (rules with wildcards)."""
+        return sorted({
+            rule.target.strip("/")
+            for rule in self.rules
+            if _split_prefix(rule.source)[1]
+        })
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Mapping":
+        """Build a mapping from decoded mapping-file data.
+
+        Raises:
+            ValueError: If the data is not a valid mapping
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("rules"), list):
+            raise ValueError("Mapping must define a list of rules")
+        try:
+            rules = [MappingRule(r["source"], r["target"]) for r in data["rules"]]
+            rename = [RenameRule(r["pattern"], r["replace"]) for r in data.get("rename", [])]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"Invalid mapping rule: {e}")
+        try:
+            return cls(
+                rules=rules,
+                rename=rename,
+                include=list(data.get("include", [])),
+                exclude=list(data.get("exclude", [])),
+                required=list(data.get("required", []))
+            )
+        except re.error as e:
+            raise ValueError(f"Invalid pattern in mapping: {e}")
+
+def load_mapping(path: Optional[Path] = None) -> Mapping:
+    """Load and compile a YAML or JSON mapping file.
+
+    Args:
+        path: Mapping file; the API-H2H layout (`DEFAULT_MAPPING`) when omitted
+
+    Raises:
+        ValueError: If the file cannot be parsed or is not a valid mapping
+    """
+    if path is None:
+        return Mapping.from_dict(DEFAULT_MAPPING)
+
+    import yaml
+
+    with path.open("rb") as f:
+        try:
+            if path.suffix == ".json":
+                data = json.load(f)
+            else:
+                data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+        except (ValueError, yaml.YAMLError) as e:
+            raise ValueError(f"Cannot parse {path}: {e}")
+    return Mapping.from_dict(data)
@@ -0,0 +1,1448 @@
+"""
+Project migration (by default from the API-H2H layout) into the Cline LLM
+Methodology layout.
+
+A declarative mapping (see `.mapping`) decides what is copied and where.
+Used by `llm-setup migrate` and scripts/migrate_from_api_h2h.py.
+"""
+
+import os
+import shutil
+import hashlib
+import json
+import re
+import threading
+import tomllib
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+import logging
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+)
+
+from .events import NULL_EVENTS, PROGRESS_INTERVAL, EventStream, run_events
+from .mapping import Mapping, load_mapping
+from .profiling import RunMetrics, StepMetrics, max_rss, profiled, track_memory
+
+logger = logging.getLogger(__name__)
+
+REPORT_FILE = "migration_report.json"
+
+# Target files written by migrations, so `--delete` never touches others
+MIGRATED_FILES = ".migrated_files.json"
+
+class MigrationConfig:
+    """Migration settings."""
+    
+    def __init__(
+        self,
+        source_dir: str | Path,
+        target_dir: str | Path,
+        mapping: Optional[Mapping] = None
+    ):
+        self.source_dir = Path(source_dir)
+        self.target_dir = Path(target_dir)
+        self.mapping = mapping or load_mapping()
+
+@dataclass
+class CopyStats:
+    """Statistics of a file copy."""
+    files: int = 0
+    bytes: int = 0
+    skipped: int = 0
+    added: int = 0
+    updated: int = 0
+    deleted: int = 0
+    linked: int = 0
+    saved_bytes: int = 0
+    seconds: float = 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        """Average copy throughput."""
+        return self.bytes / self.seconds if self.seconds > 0 else 0.0
+
+    def add(self, other: "CopyStats") -> None:
+        """Accumulate the statistics of another copy."""
+        self.files += other.files
+        self.bytes += other.bytes
+        self.skipped += other.skipped
+        self.added += other.added
+        self.updated += other.updated
+        self.deleted += other.deleted
+        self.linked += other.linked
+        self.saved_bytes += other.saved_bytes
+        self.seconds += other.seconds
+
+    def delta(self) -> Dict[str, int]:
+        """Change summary of an incremental sync."""
+        return {
+            "added": self.added,
+            "updated": self.updated,
+            "unchanged": self.skipped,
+            "deleted": self.deleted
+        }
+
+    def __str__(self) -> str:
+        text = (
+            f"{self.files} files, {self.bytes / 1e6:.1f} MB "
+            f"in {self.seconds:.2f}s ({self.bytes_per_second / 1e6:.1f} MB/s)"
+        )
+        if self.added or self.updated:
+            text += f", {self.added} added, {self.updated} updated"
+        if self.skipped:
+            text += f", {self.skipped} skipped"
+        if self.deleted:
+            text += f", {self.deleted} deleted"
+        if self.linked:
+            text += (
+                f", {self.linked} duplicates linked "
+                f"({self.saved_bytes / 1e6:.1f} MB saved)"
+            )
+        return text
+
+_ZERO_COPY_ERRORS = (OSError, AttributeError)
+
+def _zero_copy(src_fd: int, dst_fd: int, size: int) -> bool:
+    """Copy inside the kernel with copy_file_range or sendfile.
+
+    Returns False if the platform or file system does not support either
+    before anything was copied, so the caller falls back to a user-space copy.
+    """
+    for primitive in ("copy_file_range", "sendfile"):
+        copy = getattr(os, primitive, None)
+        if copy is None:
+            continue
+        offset = 0
+        try:
+            while offset < size:
+                if primitive == "sendfile":
+                    sent = copy(dst_fd, src_fd, offset, size - offset)
+                else:
+                    sent = copy(src_fd, dst_fd, size - offset, offset, offset)
+                if sent == 0:
+                    break
+                offset += sent
+            if offset:
+                return True
+        except _ZERO_COPY_ERRORS:
+            if offset:
+                raise
+    return False
+
+def hash_file(path: Path) -> str:
+    """SHA-256 of a file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def copy_file(source: Path, target: Path, size: int, with_hash: bool = False) -> Optional[str]:
+    """Copy a file with its metadata.
+
+    Without hashing, the copy is done inside the kernel when possible. With
+    hashing, the content is read once to both copy it and compute its SHA-256.
+
+    Returns:
+        SHA-256 of the content if requested, otherwise None
+    """
+    digest = hashlib.sha256() if with_hash else None
+    try:
+        if os.lstat(target).st_nlink > 1:
+            # Do not write through a hard link created by deduplication
+            os.unlink(target)
+    except FileNotFoundError:
+        pass
+    with open(source, "rb") as src, open(target, "wb") as dst:
+        if digest is not None:
+            for chunk in iter(lambda: src.read(1 << 20), b""):
+                digest.update(chunk)
+                dst.write(chunk)
+        elif size == 0 or not _zero_copy(src.fileno(), dst.fileno(), size):
+            shutil.copyfileobj(src, dst, 1 << 20)
+    shutil.copystat(source, target)
+    return digest.hexdigest() if digest is not None else None
+
+FICLONE = 0x40049409
+
+def _reflink(original: Path, target: Path) -> bool:
+    """Clone a file sharing its blocks (copy-on-write)."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(original, "rb") as src, open(target, "wb") as dst:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except OSError:
+        target.unlink(missing_ok=True)
+        return False
+
+def link_file(source: Path, original: Path, target: Path, mode: str) -> bool:
+    """Create `target` as a reflink or hard link of an existing copy.
+
+    Args:
+        source: Source file of `target`, whose metadata a reflink gets (a
+            hard link shares the original's)
+        original: Already migrated copy with the same content
+        target: File to create or replace
+        mode: "reflink", "hardlink" or "auto" (reflink, else a hard link)
+
+    Returns:
+        False if the file system supports neither
+    """
+    temporary = target.with_name(f".{target.name}.dedup")
+    if mode in ("auto", "reflink") and _reflink(original, temporary):
+        shutil.copystat(source, temporary)
+        os.replace(temporary, target)
+        return True
+    if mode in ("auto", "hardlink"):
+        try:
+            os.link(original, temporary)
+        except OSError:
+            return False
+        os.replace(temporary, target)
+        return True
+    return False
+
+class _Original:
+    """First copy of a content, which its duplicates wait for."""
+
+    def __init__(self, path: Path, ok: bool = False):
+        self.path = path
+        self.ok = ok
+        self.ready = threading.Event()
+        if ok:
+            self.ready.set()
+
+class DedupIndex:
+    """Index of already copied contents, by SHA-256.
+
+    The first copy of each content is written normally; later ones are
+    linked to it once it is complete. In an incremental sync, target files
+    that did not change also serve as originals (see `seed`).
+    """
+
+    def __init__(self, mode: str = "auto"):
+        self.mode = mode
+        self._originals: Dict[str, _Original] = {}
+        # Existing copies by size, only read when a content of the same size
+        # shows up
+        self._candidates: Dict[int, List[Path]] = {}
+        self._lock = threading.Lock()
+
+    def seed(self, path: Path, size: int) -> None:
+        """Offer an existing copy, which will not be rewritten, as an original."""
+        if size == 0:
+            return
+        with self._lock:
+            self._candidates.setdefault(size, []).append(path)
+
+    def _hash_candidates(self, size: int) -> None:
+        """Index the existing copies of a size by content."""
+        inodes: Set[Tuple[int, int]] = set()
+        for path in self._candidates.pop(size, ()):
+            try:
+                info = os.stat(path)
+                if (info.st_dev, info.st_ino) in inodes:
+                    # Another link to an already indexed content
+                    continue
+                inodes.add((info.st_dev, info.st_ino))
+                digest = hash_file(path)
+            except OSError:
+                continue
+            self._originals.setdefault(digest, _Original(path, ok=True))
+
+    def claim(self, digest: str, target: Path, size: int = 0) -> Optional[_Original]:
+        """Register `target` as the original of a content.
+
+        Returns:
+            None if it is the first, otherwise the registered original
+        """
+        with self._lock:
+            original = self._originals.get(digest)
+            if original is None and size in self._candidates:
+                self._hash_candidates(size)
+                original = self._originals.get(digest)
+            if original is None:
+                self._originals[digest] = _Original(target)
+            return original
+
+    def release(self, digest: str, ok: bool) -> None:
+        """Mark the original as complete or, if it failed, forget it."""
+        with self._lock:
+            original = self._originals[digest]
+            if not ok:
+                del self._originals[digest]
+        original.ok = ok
+        original.ready.set()
+
+SkipCheck = Callable[[Path, Path, os.stat_result], bool]
+CopiedCallback = Callable[[Path, Path, os.stat_result, Optional[str]], None]
+
+def _remove(path: Path) -> None:
+    """Remove a file or a whole directory from the target."""
+    if path.is_dir() and not path.is_symlink():
+        shutil.rmtree(path)
+    else:
+        path.unlink()
+
+class FastCopier:
+    """Tree copier that enumerates once and copies in parallel.
+
+    In incremental mode only new or changed files are copied, comparing size
+    and mtime (or content, with `checksum`); with `delete`, whatever no
+    longer exists in the source is removed from the target.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        progress_interval: float = 5.0,
+        with_hash: bool = False,
+        incremental: bool = False,
+        delete: bool = False,
+        checksum: bool = False,
+        dedup: Optional[str] = None,
+        events: Optional[EventStream] = None
+    ):
+        self.workers = workers or min(32, (os.cpu_count() or 1) * 4)
+        self.progress_interval = progress_interval
+        self.events = events or NULL_EVENTS
+        self.with_hash = with_hash
+        self.incremental = incremental or delete or checksum
+        self.delete = delete
+        self.checksum = checksum
+        self.dedup = DedupIndex(dedup) if dedup else None
+        self._lock = threading.Lock()
+
+    def enumerate(
+        self,
+        source: Path,
+        target: Path,
+        removed: Optional[List[Path]] = None
+    ) -> Iterator[Tuple[Path, Path, os.stat_result]]:
+        """Walk the source tree, creating the target directories.
+
+        Yields (source, target, source stat) for each file. If `removed` is
+        given, target entries that do not exist in the source (or whose type
+        changed) are removed and added to it.
+        """
+        pending = [(source, target)]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            dst_dir.mkdir(parents=True, exist_ok=True)
+            names: Dict[str, bool] = {}
+            with os.scandir(src_dir) as entries:
+                for entry in entries:
+                    dst = dst_dir / entry.name
+                    is_dir = entry.is_dir()
+                    names[entry.name] = is_dir
+                    if is_dir:
+                        pending.append((Path(entry.path), dst))
+                    else:
+                        yield Path(entry.path), dst, entry.stat()
+            if removed is not None:
+                removed.extend(self._prune(dst_dir, names))
+
+    def _prune(self, target: Path, names: Dict[str, bool]) -> List[Path]:
+        """Remove the extra entries of a target directory."""
+        extra = []
+        with os.scandir(target) as entries:
+            for entry in entries:
+                is_dir = names.get(entry.name)
+                if is_dir is None or is_dir != entry.is_dir(follow_symlinks=False):
+                    extra.append(Path(entry.path))
+        for path in extra:
+            _remove(path)
+        return extra
+
+    def compare(self, source: Path, target: Path, stat: os.stat_result) -> Optional[str]:
+        """Compare a file with its copy.
+
+        Returns:
+            "added" if there is no copy, "updated" if it differs, or None if
+            it is up to date
+        """
+        try:
+            current = target.stat()
+        except FileNotFoundError:
+            return "added"
+        if current.st_size != stat.st_size:
+            return "updated"
+        if current.st_mtime_ns == stat.st_mtime_ns and not self.checksum:
+            return None
+        # A linked duplicate has its original's mtime: compare it by content
+        linked = current.st_nlink > 1
+        if (self.checksum or linked) and hash_file(source) == hash_file(target):
+            if current.st_mtime_ns != stat.st_mtime_ns and not linked:
+                shutil.copystat(source, target)
+            return None
+        return "updated"
+
+    def _copy_dedup(
+        self,
+        source: Path,
+        target: Path,
+        size: int
+    ) -> Tuple[Optional[str], bool]:
+        """Copy a file, or link it to a copy with the same content.
+
+        Returns:
+            (SHA-256 of the content, whether it was linked instead of copied)
+        """
+        if size == 0:
+            return copy_file(source, target, size, self.with_hash), False
+
+        # Hash while copying, so the source is read once; a duplicate's copy
+        # is then replaced by a link to the original
+        digest = copy_file(source, target, size, with_hash=True)
+        original = self.dedup.claim(digest, target, size)
+        if original is None:
+            self.dedup.release(digest, True)
+            return digest, False
+
+        original.ready.wait()
+        if original.ok and link_file(source, original.path, target, self.dedup.mode):
+            return digest, True
+        return digest, False
+
+    def copy_tree(
+        self,
+        source: Path,
+        target: Path,
+        skip: Optional[SkipCheck] = None,
+        on_copied: Optional[CopiedCallback] = None
+    ) -> CopyStats:
+        """Copy a whole tree on a bounded thread pool.
+
+        Args:
+            source: Source directory
+            target: Target directory
+            skip: Decides whether a file is already copied and can be skipped
+            on_copied: Called (from the copy threads) after each file
+
+        Raises:
+            shutil.Error: With the list of files that could not be copied
+        """
+        removed: Optional[List[Path]] = [] if self.delete else None
+        stats = self.copy_files(
+            self.enumerate(source, target, removed), source.name, skip, on_copied
+        )
+        stats.deleted = len(removed or ())
+        return stats
+
+    def copy_files(
+        self,
+        files: Iterable[Tuple[Path, Path, os.stat_result]],
+        label: str = "",
+        skip: Optional[SkipCheck] = None,
+        on_copied: Optional[CopiedCallback] = None
+    ) -> CopyStats:
+        """Copy files on a bounded thread pool.
+
+        Args:
+            files: (source, target, source stat) tuples; the target
+                directories must already exist
+            label: Name used in progress messages
+            skip: Decides whether a file is already copied and can be skipped
+            on_copied: Called (from the copy threads) after each file
+
+        Raises:
+            shutil.Error: With the list of files that could not be copied
+        """
+        stats = CopyStats()
+        errors: List[Tuple[str, str, str]] = []
+        start = time.perf_counter()
+        last_report = last_event = start
+        slots = threading.BoundedSemaphore(self.workers * 4)
+        events = self.events if self.events.enabled else None
+        total_files: Optional[int] = None
+
+        def progress(now: float) -> None:
+            # Called with self._lock held
+            nonlocal last_report, last_event
+            if events is not None and now - last_event >= PROGRESS_INTERVAL:
+                last_event = now
+                elapsed = now - start
+                events.emit(
+                    "progress",
+                    step=label,
+                    files=stats.files + stats.skipped,
+                    total_files=total_files,
+                    copied=stats.files,
+                    skipped=stats.skipped,
+                    bytes=stats.bytes,
+                    bytes_per_second=stats.bytes / elapsed if elapsed > 0 else 0.0,
+                    elapsed=elapsed
+                )
+            if now - last_report >= self.progress_interval:
+                last_report = now
+                stats.seconds = now - start
+                logger.info(f"Progress {label}: {stats}")
+
+        def done(
+            src: Path,
+            dst: Path,
+            size: int,
+            status: Optional[str],
+            linked: bool,
+            error: Optional[BaseException]
+        ) -> None:
+            slots.release()
+            with self._lock:
+                if error is not None:
+                    errors.append((str(src), str(dst), str(error)))
+                    return
+                if status is None:
+                    stats.skipped += 1
+                else:
+                    if status == "added":
+                        stats.added += 1
+                    elif status == "updated":
+                        stats.updated += 1
+                    stats.files += 1
+                    if linked:
+                        stats.linked += 1
+                        stats.saved_bytes += size
+                    else:
+                        stats.bytes += size
+                progress(time.perf_counter())
+
+        # With incremental deduplication, changed files are copied once every
+        # other file was compared, so any unchanged file can be their original
+        deferred: List[Tuple[Path, Path, os.stat_result, str]] = []
+        defer = self.incremental and self.dedup is not None
+
+        def copy(
+            src: Path,
+            dst: Path,
+            stat: os.stat_result,
+            status: Optional[str] = None,
+            compared: bool = False
+        ) -> None:
+            linked = False
+            try:
+                if not compared:
+                    status = self.compare(src, dst, stat) if self.incremental else "copied"
+                    if defer and self.dedup is not None:
+                        if status is None:
+                            self.dedup.seed(dst, stat.st_size)
+                        else:
+                            with self._lock:
+                                deferred.append((src, dst, stat, status))
+                            slots.release()
+                            return
+                if status is not None:
+                    if self.dedup is not None:
+                        digest, linked = self._copy_dedup(src, dst, stat.st_size)
+                    else:
+                        digest = copy_file(src, dst, stat.st_size, self.with_hash)
+                    if on_copied is not None:
+                        on_copied(src, dst, stat, digest)
+            except BaseException as e:
+                done(src, dst, stat.st_size, status, linked, e)
+            else:
+                done(src, dst, stat.st_size, status, linked, None)
+
+        planned = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for src, dst, stat in files:
+                planned += 1
+                if skip is not None and skip(src, dst, stat):
+                    with self._lock:
+                        stats.skipped += 1
+                    continue
+                slots.acquire()
+                executor.submit(copy, src, dst, stat)
+            with self._lock:
+                total_files = planned
+        if deferred:
+            with ThreadPoolExecutor(max_workers=self.workers) as executor:
+                for src, dst, stat, status in deferred:
+                    slots.acquire()
+                    executor.submit(copy, src, dst, stat, status, True)
+
+        stats.seconds = time.perf_counter() - start
+        if events is not None:
+            events.emit(
+                "progress",
+                step=label,
+                files=stats.files + stats.skipped,
+                total_files=planned,
+                copied=stats.files,
+                skipped=stats.skipped,
+                bytes=stats.bytes,
+                bytes_per_second=stats.bytes_per_second,
+                elapsed=stats.seconds
+            )
+        if errors:
+            raise shutil.Error(errors)
+        return stats
+
+class MigrationJournal:
+    """Persistent journal of completed steps and copied files.
+
+    Each line is a JSON object. It lets an interrupted migration resume
+    without repeating steps or copying files again.
+    """
+
+    FILE_NAME = ".migration_journal.jsonl"
+
+    def __init__(self, path: Path, resume: bool = False, sync_every: int = 1000):
+        self.path = path
+        self.sync_every = sync_every
+        self.steps: Set[str] = set()
+        self.files: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        if resume and path.exists():
+            self._load()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(path, "a" if resume else "w", encoding="utf-8")
+
+    def _load(self) -> None:
+        """Read the journal, ignoring a truncated last line."""
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("type") == "step":
+                    self.steps.add(entry["name"])
+                elif entry.get("type") == "file":
+                    self.files[entry["path"]] = entry
+
+    def _append(self, entry: Dict, sync: bool = False) -> None:
+        with self._lock:
+            self._handle.write(json.dumps(entry) + "\n")
+            self._pending += 1
+            if sync or self._pending >= self.sync_every:
+                self._sync()
+
+    def _sync(self) -> None:
+        self._handle.flush()
+        os.fsync(self._handle.fileno())
+        self._pending = 0
+
+    def step_done(self, name: str) -> None:
+        """Record a completed step."""
+        self.steps.add(name)
+        self._append({"type": "step", "name": name}, sync=True)
+
+    def file_done(self, key: str, stat: os.stat_result, digest: Optional[str]) -> None:
+        """Record a copied file with the size, mtime and hash of its source."""
+        entry = {
+            "type": "file",
+            "path": key,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest
+        }
+        self.files[key] = entry
+        self._append(entry)
+
+    def is_copied(
+        self,
+        key: str,
+        stat: os.stat_result,
+        target: Path,
+        verify: bool = False
+    ) -> bool:
+        """Whether a file was already copied and its source has not changed."""
+        entry = self.files.get(key)
+        if entry is None:
+            return False
+        if entry["size"] != stat.st_size or entry["mtime_ns"] != stat.st_mtime_ns:
+            return False
+        try:
+            if target.stat().st_size != stat.st_size:
+                return False
+        except OSError:
+            return False
+        if verify and entry.get("sha256"):
+            return hash_file(target) == entry["sha256"]
+        return True
+
+    def close(self) -> None:
+        """Flush the journal to disk and close it."""
+        with self._lock:
+            self._sync()
+            self._handle.close()
+
+NEW_DEPENDENCIES = {
+    "cline-llm-methodology": "^1.0.0",
+    "mkdocs": "^1.5.0",
+    "mkdocs-material": "^9.0.0"
+}
+
+DEPENDENCIES_TABLE = "tool.poetry.dependencies"
+
+PYPROJECT_FILE = "pyproject.toml"
+
+_TABLE_HEADER = re.compile(r"^\s*\[\s*([^\[\]]+?)\s*\]\s*(#.*)?$")
+
+# Comment that earlier versions of the migration script left in pyproject.toml
+_LEGACY_TODO = "# TODO: Agregar dependencias de Cline LLM Methodology:"
+
+def _normalize_name(name: str) -> str:
+    """Normalize a package name for comparison (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def merge_dependencies(text: str, dependencies: Dict[str, str]) -> str:
+    """Add dependencies to the Poetry table of a pyproject.toml.
+
+    Only missing dependencies are inserted, right after the last entry of the
+    table, leaving the rest of the file untouched; declared ones keep their
+    version. If the table does not exist it is appended. Applying it twice
+    changes nothing.
+
+    Args:
+        text: Content of the pyproject.toml
+        dependencies: Package name -> version constraint
+
+    Raises:
+        ValueError: If the file is not valid TOML or declares its
+            dependencies in a way that cannot be edited line by line
+    """
+    try:
+        document = tomllib.loads(text)
+    except tomllib.TOMLDecodeError as e:
+        raise ValueError(f"Invalid pyproject.toml: {e}")
+
+    newline = "\r\n" if "\r\n" in text else "\n"
+    lines = text.splitlines(keepends=True)
+
+    # Remove the comments that earlier versions of the script added
+    if _LEGACY_TODO in text:
+        start = next(i for i, line in enumerate(lines) if line.strip() == _LEGACY_TODO)
+        end = start + 1
+        while end < len(lines) and lines[end].startswith("# ") and " = " in lines[end]:
+            end += 1
+        if start > 0 and not lines[start - 1].strip():
+            start -= 1
+        del lines[start:end]
+
+    declared = document.get("tool", {}).get("poetry", {}).get("dependencies", {})
+    present = {_normalize_name(name) for name in declared}
+    missing = [
+        f'{name} = "{version}"{newline}'
+        for name, version in dependencies.items()
+        if _normalize_name(name) not in present
+    ]
+    if not missing:
+        return "".join(lines)
+
+    header = None
+    for index, line in enumerate(lines):
+        match = _TABLE_HEADER.match(line)
+        if match and re.sub(r"\s+", "", match.group(1)) == DEPENDENCIES_TABLE:
+            header = index
+            break
+
+    if header is None:
+        if declared:
+            raise ValueError(
+                f"Dependencies are not declared in a [{DEPENDENCIES_TABLE}] table"
+            )
+        if lines and not lines[-1].endswith(("\n", "\r")):
+            lines[-1] += newline
+        if lines and lines[-1].strip():
+            lines.append(newline)
+        lines.append(f"[{DEPENDENCIES_TABLE}]{newline}")
+        lines.extend(missing)
+        return "".join(lines)
+
+    insert = header + 1
+    for index in range(header + 1, len(lines)):
+        stripped = lines[index].strip()
+        if stripped.startswith("["):
+            break
+        if stripped and not stripped.startswith("#"):
+            insert = index + 1
+    if not lines[insert - 1].endswith(("\n", "\r")):
+        lines[insert - 1] += newline
+    lines[insert:insert] = missing
+    return "".join(lines)
+
+class MigrationTool:
+    """Project migration tool."""
+    
+    def __init__(
+        self,
+        config: MigrationConfig,
+        workers: Optional[int] = None,
+        with_hash: bool = False,
+        verify: bool = False,
+        incremental: bool = False,
+        delete: bool = False,
+        checksum: bool = False,
+        dedup: Optional[str] = None,
+        events: Optional[EventStream] = None
+    ):
+        self.config = config
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.events = events or NULL_EVENTS
+        self.copier = FastCopier(
+            workers,
+            with_hash=with_hash,
+            incremental=incremental,
+            delete=delete,
+            checksum=checksum,
+            dedup=dedup,
+            events=self.events
+        )
+        self.copy_stats = CopyStats()
+        self.verify = verify
+        self.journal: Optional[MigrationJournal] = None
+        self.report: Optional[Dict] = None
+        self._metrics = RunMetrics()
+        # Source of pyproject.toml, which is merged rather than copied
+        self._pyproject: Optional[Path] = None
+
+    def metrics(self) -> RunMetrics:
+        """Time and writes per step, and peak memory, of the last run."""
+        return self._metrics
+
+    def _journal_key(self, path: Path) -> str:
+        """Journal key of a target file."""
+        return path.relative_to(self.config.target_dir).as_posix()
+
+    def copy_files(
+        self,
+        files: Iterable[Tuple[Path, Path, os.stat_result]],
+        label: str = ""
+    ) -> CopyStats:
+        """Copy files, journaling each one, and accumulate their statistics."""
+        journal = self.journal
+        if journal is None:
+            stats = self.copier.copy_files(files, label)
+            self.copy_stats.add(stats)
+            return stats
+
+        def skip(src: Path, dst: Path, stat: os.stat_result) -> bool:
+            return journal.is_copied(self._journal_key(dst), stat, dst, self.verify)
+
+        def on_copied(
+            src: Path, dst: Path, stat: os.stat_result, digest: Optional[str]
+        ) -> None:
+            journal.file_done(self._journal_key(dst), stat, digest)
+
+        stats = self.copier.copy_files(files, label, skip, on_copied)
+        self.copy_stats.add(stats)
+        return stats
+
+    def plan(self, planned: Set[str]) -> Iterator[Tuple[Path, Path, os.stat_result]]:
+        """Files to migrate according to the mapping, creating their target
+        directories.
+
+        pyproject.toml is left out: `update_dependencies` writes it merged.
+
+        Args:
+            planned: Receives the relative target path of each file
+        """
+        created: Set[Path] = set()
+        self._pyproject = None
+        for src, relative, _, stat in self.config.mapping.walk(self.config.source_dir):
+            if relative == PYPROJECT_FILE:
+                self._pyproject = src
+                planned.add(relative)
+                continue
+            dst = self.config.target_dir / relative
+            if dst.parent not in created:
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                created.add(dst.parent)
+            planned.add(relative)
+            yield src, dst, stat
+
+    def _load_migrated(self) -> Set[str]:
+        """Target files recorded by earlier migrations."""
+        try:
+            with open(self.config.target_dir / MIGRATED_FILES, encoding="utf-8") as f:
+                files = json.load(f)["files"]
+        except (OSError, ValueError, KeyError, TypeError):
+            return set()
+        return {
+            path for path in files
+            if isinstance(path, str)
+            and not Path(path).is_absolute() and ".." not in Path(path).parts
+        }
+
+    def _save_migrated(self, files: Set[str]) -> None:
+        """Record the target files written by migrations."""
+        path = self.config.target_dir / MIGRATED_FILES
+        temporary = path.with_name(f".{path.name}.tmp")
+        temporary.write_text(json.dumps({"version": 1, "files": sorted(files)}))
+        os.replace(temporary, path)
+
+    def delete_stale(self, planned: Set[str], migrated: Set[str]) -> int:
+        """Remove files written by an earlier migration that no longer
+        correspond to any source file.
+
+        Files that no migration wrote, such as those created by
+        `llm-setup setup`, are left alone, and so are the mapped target
+        directories themselves even when they end up empty.
+
+        Args:
+            planned: Relative target paths of this run
+            migrated: Relative target paths recorded by earlier migrations
+        """
+        kept = {Path(".")}
+        for root in self.config.mapping.target_roots():
+            kept.update(Path(root, "_").parents)
+        deleted = 0
+        for relative in sorted(migrated - planned):
+            path = self.config.target_dir / relative
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            deleted += 1
+            directory = Path(relative).parent
+            while directory not in kept:
+                absolute = self.config.target_dir / directory
+                if any(absolute.iterdir()):
+                    break
+                absolute.rmdir()
+                directory = directory.parent
+        return deleted
+
+    def validate_source(self) -> bool:
+        """Validate the source directory."""
+        if not self.config.source_dir.exists():
+            self.errors.append(f"Source directory does not exist: {self.config.source_dir}")
+            return False
+        
+        for file in self.config.mapping.required:
+            if not (self.config.source_dir / file).exists():
+                self.errors.append(f"Required file or directory not found: {file}")
+                return False
+        
+        return True
+
+    def prepare_target(self) -> bool:
+        """Prepare the target directory."""
+        try:
+            self.config.target_dir.mkdir(parents=True, exist_ok=True)
+            return True
+        except Exception as e:
+            self.errors.append(f"Error preparing target directory: {e}")
+            return False
+
+    def migrate_files(self) -> bool:
+        """Migrate the files selected by the mapping."""
+        try:
+            planned: Set[str] = set()
+            migrated = self._load_migrated()
+            stats = self.copy_files(self.plan(planned), "migrate_files")
+            if self.copier.delete:
+                stats.deleted = self.delete_stale(planned, migrated)
+                self.copy_stats.deleted += stats.deleted
+                migrated = set()
+            self._save_migrated(migrated | planned)
+            if not planned:
+                self.warnings.append("The mapping selected no files")
+            logger.info(f"Migrated files ({stats})")
+            return True
+        except Exception as e:
+            self.errors.append(f"Error migrating files: {e}")
+            return False
+
+    def _pyproject_source(self) -> Optional[Path]:
+        """Source file that the mapping migrates to pyproject.toml, if any."""
+        if self._pyproject is not None:
+            return self._pyproject
+        # When resuming after migrate_files the plan is not walked
+        candidate = self.config.source_dir / PYPROJECT_FILE
+        mapped = self.config.mapping.match(PYPROJECT_FILE)
+        if mapped is not None and mapped[1] == PYPROJECT_FILE and candidate.is_file():
+            return candidate
+        return None
+
+    def update_dependencies(self) -> bool:
+        """Add the methodology dependencies to pyproject.toml.
+
+        The source pyproject.toml is merged with `NEW_DEPENDENCIES` and the
+        target is only rewritten if the result changes, so an incremental
+        sync without changes counts it as unchanged.
+        """
+        try:
+            pyproject_path = self.config.target_dir / PYPROJECT_FILE
+            source = self._pyproject_source()
+            if source is None and not pyproject_path.exists():
+                # A custom mapping may not migrate pyproject.toml
+                self.warnings.append(
+                    "pyproject.toml not found; dependencies not updated"
+                )
+                return True
+
+            try:
+                with open(pyproject_path, 'r', encoding="utf-8", newline="") as f:
+                    current: Optional[str] = f.read()
+            except FileNotFoundError:
+                current = None
+            if source is None:
+                content = current
+            else:
+                with open(source, 'r', encoding="utf-8", newline="") as f:
+                    content = f.read()
+
+            updated = merge_dependencies(content, NEW_DEPENDENCIES)
+            stats = CopyStats()
+            if updated == current:
+                stats.skipped = 1
+                self.copy_stats.add(stats)
+                logger.info("Dependencies already up to date")
+                return True
+
+            temporary = pyproject_path.with_name(f".{pyproject_path.name}.tmp")
+            with open(temporary, 'w', encoding="utf-8", newline="") as f:
+                f.write(updated)
+            shutil.copymode(source or pyproject_path, temporary)
+            os.replace(temporary, pyproject_path)
+            logger.info("Dependencies added to pyproject.toml")
+
+            if source is not None:
+                stats.files = 1
+                stats.bytes = len(updated.encode("utf-8"))
+                if self.copier.incremental:
+                    if current is None:
+                        stats.added = 1
+                    else:
+                        stats.updated = 1
+                self.copy_stats.add(stats)
+            return True
+        except Exception as e:
+            self.errors.append(f"Error updating dependencies: {e}")
+            return False
+
+    def create_migration_report(self) -> Dict:
+        """Build the migration report."""
+        return {
+            "success": len(self.errors) == 0,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "source": str(self.config.source_dir),
+            "target": str(self.config.target_dir),
+            "copied_files": self.copy_stats.files,
+            "copied_bytes": self.copy_stats.bytes,
+            "skipped_files": self.copy_stats.skipped,
+            "copy_seconds": round(self.copy_stats.seconds, 3),
+            "timestamp": datetime.now().isoformat()
+        }
+
+    def run(self, resume: bool = False, trace_memory: bool = False) -> bool:
+        """Run the whole migration.
+
+        Args:
+            resume: Continue an interrupted migration, skipping the steps and
+                files the journal records as done
+            trace_memory: Measure peak Python memory for `metrics()`
+                (tracing slows the run down)
+        """
+        if trace_memory:
+            memory: Dict[str, int] = {}
+            try:
+                with track_memory() as memory:
+                    return self.run(resume)
+            finally:
+                self._metrics.peak_memory = memory.get("peak")
+
+        steps = [
+            ("Validating source", self.validate_source),
+            ("Preparing target", self.prepare_target),
+            ("Migrating files", self.migrate_files),
+            ("Updating dependencies", self.update_dependencies)
+        ]
+
+        self.journal = MigrationJournal(
+            self.config.target_dir / MigrationJournal.FILE_NAME, resume=resume
+        )
+        success = True
+        self._metrics = RunMetrics()
+        start = time.perf_counter()
+        self.events.emit(
+            "run_start",
+            kind="migration",
+            source=str(self.config.source_dir),
+            target=str(self.config.target_dir),
+            resume=resume
+        )
+        try:
+            for desc, step in steps:
+                name = step.__name__
+                if name in self.journal.steps:
+                    logger.info(f"Skipped (already completed): {desc}")
+                    self.events.emit("step_skipped", step=name)
+                    continue
+                logger.info(f"Starting: {desc}")
+                before = CopyStats()
+                before.add(self.copy_stats)
+                step_start = time.perf_counter()
+                with self.events.step(name, description=desc) as result:
+                    ok = step()
+                    result["ok"] = ok
+                    copied = self.copy_stats.files - before.files
+                    skipped = self.copy_stats.skipped - before.skipped
+                    if copied or skipped:
+                        result["files"] = copied
+                        result["bytes"] = self.copy_stats.bytes - before.bytes
+                        result["skipped"] = skipped
+                    if not ok:
+                        result["errors"] = self.errors
+                self._metrics.steps.append(StepMetrics(
+                    name,
+                    time.perf_counter() - step_start,
+                    files=copied,
+                    bytes=self.copy_stats.bytes - before.bytes
+                ))
+                if not ok:
+                    success = False
+                    logger.error(f"Failed: {desc}")
+                    break
+                self.journal.step_done(name)
+                logger.info(f"Completed: {desc}")
+        finally:
+            self.journal.close()
+            self._metrics.seconds = time.perf_counter() - start
+            self._metrics.max_rss = max_rss()
+            self.events.emit(
+                "run_end",
+                ok=success and not self.errors,
+                duration=time.perf_counter() - start,
+                files=self.copy_stats.files,
+                bytes=self.copy_stats.bytes,
+                skipped=self.copy_stats.skipped,
+                errors=self.errors
+            )
+
+        report = self.create_migration_report()
+        report["resumed"] = resume
+        if self.copier.incremental:
+            report["delta"] = self.copy_stats.delta()
+        if self.copier.dedup is not None:
+            report["dedup"] = {
+                "mode": self.copier.dedup.mode,
+                "linked_files": self.copy_stats.linked,
+                "saved_bytes": self.copy_stats.saved_bytes
+            }
+        report_path = self.config.target_dir / REPORT_FILE
+        
+        with open(report_path, 'w') as f:
+            json.dump(report, f, indent=2)
+
+        self.report = report
+        return success
+
+def load_manifest(path: Path) -> List[Tuple[Path, Path]]:
+    """Read a migration manifest.
+
+    The manifest is a JSON list, or one JSON object per line, of
+    {"source": ..., "target": ...}. Relative paths are resolved from the
+    manifest's directory.
+
+    Raises:
+        ValueError: If the manifest is invalid
+    """
+    text = path.read_text(encoding="utf-8")
+    try:
+        if text.lstrip().startswith("["):
+            entries = json.loads(text)
+        else:
+            entries = [json.loads(line) for line in text.splitlines() if line.strip()]
+    except ValueError as e:
+        raise ValueError(f"Invalid manifest {path}: {e}")
+
+    pairs = []
+    for index, entry in enumerate(entries, 1):
+        if not isinstance(entry, dict) or "source" not in entry or "target" not in entry:
+            raise ValueError(f"Manifest entry {index} has no source/target")
+        pairs.append((
+            path.parent / entry["source"],
+            path.parent / entry["target"]
+        ))
+    return pairs
+
+def migrate_one(
+    source: Path,
+    target: Path,
+    options: Dict[str, Any],
+    resume: bool = False,
+    mapping: Optional[Mapping] = None
+) -> Dict:
+    """Migrate one repository and summarize the result.
+
+    Runs in a pool process; never raises.
+    """
+    start = time.perf_counter()
+    result: Dict[str, Any] = {"source": str(source), "target": str(target)}
+    try:
+        tool = MigrationTool(MigrationConfig(source, target, mapping), **options)
+        result["success"] = tool.run(resume=resume)
+        result["errors"] = tool.errors
+        result["warnings"] = tool.warnings
+        result["copied_files"] = tool.copy_stats.files
+        result["copied_bytes"] = tool.copy_stats.bytes
+    except Exception as e:
+        result["success"] = False
+        result["errors"] = [f"{type(e).__name__}: {e}"]
+        result["warnings"] = []
+    result["duration"] = round(time.perf_counter() - start, 3)
+    return result
+
+def migrate_many(
+    pairs: List[Tuple[Path, Path]],
+    options: Dict[str, Any],
+    jobs: Optional[int] = None,
+    resume: bool = False,
+    mapping: Optional[Mapping] = None,
+    events: Optional[EventStream] = None
+) -> Dict:
+    """Migrate many repositories in parallel on a process pool.
+
+    Args:
+        pairs: (source, target) pairs
+        options: Arguments for each MigrationTool
+        jobs: Maximum concurrent migrations (defaults to one per CPU)
+        resume: Resume each migration from its journal
+        mapping: Mapping shared by every migration
+        events: Receives a `repo_end` event per finished repository and the
+            overall progress
+
+    Returns:
+        Summary with each repository's result, in manifest order
+    """
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(pairs)))
+    if options.get("workers") is None:
+        # Share the copy threads among the processes
+        options = {**options, "workers": max(4, min(32, (os.cpu_count() or 1) * 4) // jobs)}
+
+    events = events or NULL_EVENTS
+    start = time.perf_counter()
+    results: List[Optional[Dict]] = [None] * len(pairs)
+    events.emit("run_start", kind="migrate_many", total=len(pairs), jobs=jobs)
+    events.emit("step_start", step="migrate_many")
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            executor.submit(migrate_one, source, target, options, resume, mapping): index
+            for index, (source, target) in enumerate(pairs)
+        }
+        for done, future in enumerate(as_completed(futures), 1):
+            index = futures[future]
+            result = results[index] = future.result()
+            status = "OK" if result["success"] else "ERROR"
+            logger.info(
+                f"[{done}/{len(pairs)}] {status} {result['source']} "
+                f"({result['duration']:.1f}s)"
+            )
+            events.emit("repo_end", **result)
+            events.emit(
+                "progress", step="migrate_many", files=done, total_files=len(pairs)
+            )
+
+    failed = [result for result in results if not result["success"]]
+    duration = time.perf_counter() - start
+    events.emit("step_end", step="migrate_many", ok=not failed, duration=duration)
+    events.emit(
+        "run_end", ok=not failed, duration=duration,
+        succeeded=len(pairs) - len(failed), failed=len(failed)
+    )
+    return {
+        "total": len(pairs),
+        "succeeded": len(pairs) - len(failed),
+        "failed": len(failed),
+        "jobs": jobs,
+        "duration": round(duration, 3),
+        "copied_files": sum(result.get("copied_files", 0) for result in results),
+        "copied_bytes": sum(result.get("copied_bytes", 0) for result in results),
+        "failures": [
+            {"source": result["source"], "errors": result["errors"]}
+            for result in failed
+        ],
+        "repositories": results,
+        "timestamp": datetime.now().isoformat()
+    }
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command-line entry point."""
+    import argparse
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s'
+    )
+    
+    parser = argparse.ArgumentParser(
+        description="Migrate an API-H2H project to Cline LLM Methodology"
+    )
+    parser.add_argument(
+        "source",
+        nargs="?",
+        help="API-H2H project directory"
+    )
+    parser.add_argument(
+        "target",
+        nargs="?",
+        help="Target directory for the new project"
+    )
+    parser.add_argument(
+        "--mapping",
+        type=Path,
+        default=None,
+        help="YAML or JSON mapping file (defaults to the API-H2H layout)"
+    )
+    parser.add_argument(
+        "--events",
+        default=None,
+        help="Write structured run events as JSON lines to this file ('-' for stderr)"
+    )
+    parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Show live progress"
+    )
+    parser.add_argument(
+        "--timings",
+        action="store_true",
+        help="Report wall time, files and bytes written per step, and peak memory"
+    )
+    parser.add_argument(
+        "--profile",
+        type=Path,
+        default=None,
+        help="Write cProfile statistics (pstats format) to this file"
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        default=None,
+        help="JSON manifest of source/target pairs to migrate in parallel"
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="With --manifest, maximum concurrent migrations (defaults to the CPU count)"
+    )
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=Path("migration_summary.json"),
+        help="With --manifest, file for the aggregated summary"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of copy threads (defaults to a multiple of the CPU count)"
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume an interrupted migration from its journal"
+    )
+    parser.add_argument(
+        "--hash",
+        action="store_true",
+        help="Record the SHA-256 of each copied file (disables in-kernel copies)"
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="When resuming, check the SHA-256 of already copied files"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Copy only new or changed files (by size and mtime)"
+    )
+    parser.add_argument(
+        "--checksum",
+        action="store_true",
+        help="In incremental mode, also compare content (SHA-256)"
+    )
+    parser.add_argument(
+        "--delete",
+        action="store_true",
+        help="In incremental mode, remove files written by earlier migrations "
+             "that no longer exist in the source"
+    )
+    parser.add_argument(
+        "--dedup",
+        metavar="MODE",
+        choices=["auto", "reflink", "hardlink"],
+        help="Store files with the same content once, linking the duplicates: "
+             "auto (a reflink where the file system supports it, otherwise a "
+             "hard link), reflink or hardlink"
+    )
+    
+    args = parser.parse_args(argv)
+    if args.manifest is None and (args.source is None or args.target is None):
+        parser.error("source and target, or --manifest, are required")
+    if args.manifest is not None and args.timings:
+        parser.error("--timings is not supported with --manifest")
+    
+    options = {
+        "workers": args.workers,
+        "with_hash": args.hash,
+        "verify": args.verify,
+        "incremental": args.incremental,
+        "delete": args.delete,
+        "checksum": args.checksum,
+        "dedup": args.dedup
+    }
+
+    try:
+        mapping = load_mapping(args.mapping)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    if args.manifest is not None:
+        try:
+            pairs = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+        with profiled(args.profile), run_events(args.events, args.progress) as events:
+            summary = migrate_many(
+                pairs,
+                options,
+                jobs=args.jobs,
+                resume=args.resume,
+                mapping=mapping,
+                events=events
+            )
+        with open(args.summary, 'w') as f:
+            json.dump(summary, f, indent=2)
+        logger.info(
+            f"Migrated {summary['succeeded']}/{summary['total']} repositories "
+            f"in {summary['duration']:.1f}s; summary in {args.summary}"
+        )
+        return 0 if not summary["failed"] else 1
+
+    config = MigrationConfig(args.source, args.target, mapping)
+    with profiled(args.profile), run_events(args.events, args.progress) as events:
+        tool = MigrationTool(config, events=events, **options)
+        success = tool.run(resume=args.resume, trace_memory=args.timings)
+
+    if args.timings:
+        logger.info(f"Step timings:\n{tool.metrics().report()}")
+    if args.profile is not None:
+        logger.info(f"Profile written to {args.profile}")
+    
+    if success:
+        logger.info("Migration completed successfully")
+        return 0
+    else:
+        logger.error("Migration failed")
+        return 1
+
+if __name__ == "__main__":
+    raise SystemExit(main())
\ No newline at end of file
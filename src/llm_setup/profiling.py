@@ -0,0 +1,159 @@
+"""
+Timing and profiling instrumentation for setup and migration runs.
+
+`RunMetrics` collects per-step wall time and write counters (files and
+bytes written), plus the peak memory of the run. `track_memory()` measures
+the peak Python heap with tracemalloc, which is only switched on when asked
+for, and `profiled()` writes a cProfile/pstats dump covering every thread
+started while it is active, including the step and copy worker pools.
+"""
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+import sys
+import threading
+import tracemalloc
+from typing import Any, Dict, Iterator, List, Optional
+
+@dataclass
+class StepMetrics:
+    """Wall time and writes of a single step."""
+    name: str
+    seconds: float
+    files: int = 0
+    bytes: int = 0
+
+@dataclass
+class RunMetrics:
+    """Measurements of a complete run."""
+    steps: List[StepMetrics] = field(default_factory=list)
+    seconds: float = 0.0
+    peak_memory: Optional[int] = None
+    max_rss: Optional[int] = None
+
+    @property
+    def files(self) -> int:
+        """Files written by all steps."""
+        return sum(step.files for step in self.steps)
+
+    @property
+    def bytes(self) -> int:
+        """Bytes written by all steps."""
+        return sum(step.bytes for step in self.steps)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain representation for JSON reports."""
+        return {
+            "seconds": self.seconds,
+            "files": self.files,
+            "bytes": self.bytes,
+            "peak_memory": self.peak_memory,
+            "max_rss": self.max_rss,
+            "steps": [vars(step).copy() for step in self.steps]
+        }
+
+    def report(self) -> str:
+        """Format the measurements as a table, slowest step first."""
+        width = max([len(step.name) for step in self.steps] + [4])
+        lines = [f"  {'step':<{width}}  {'ms':>9}  {'files':>6}  {'bytes':>12}"]
+        for step in sorted(self.steps, key=lambda step: step.seconds, reverse=True):
+            lines.append(
+                f"  {step.name:<{width}}  {step.seconds * 1000:>9.1f}"
+                f"  {step.files:>6}  {step.bytes:>12}"
+            )
+        lines.append(
+            f"  {'total':<{width}}  {self.seconds * 1000:>9.1f}"
+            f"  {self.files:>6}  {self.bytes:>12}"
+        )
+        if self.peak_memory is not None:
+            lines.append(f"  peak Python memory: {self.peak_memory / 1e6:.1f} MB")
+        if self.max_rss is not None:
+            lines.append(f"  max RSS: {self.max_rss / 1e6:.1f} MB")
+        return "\n".join(lines)
+
+def max_rss() -> Optional[int]:
+    """Peak resident set size of this process in bytes, where available."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+@contextmanager
+def track_memory() -> Iterator[Dict[str, int]]:
+    """Measure the peak Python heap allocated while the block runs.
+
+    The yielded dict receives a "peak" entry in bytes when the block exits.
+    Tracing is stopped again unless it was already running.
+    """
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    result: Dict[str, int] = {}
+    try:
+        yield result
+    finally:
+        result["peak"] = max(tracemalloc.get_traced_memory()[1] - baseline, 0)
+        if started:
+            tracemalloc.stop()
+
+@contextmanager
+def profiled(path: Optional[Path]) -> Iterator[None]:
+    """Write cProfile statistics for the block to a pstats file.
+
+    From Python 3.12 a single profiler sees every thread and is stopped
+    when the block exits. Before that, cProfile only follows the thread
+    that enables it, so every thread started inside the block gets its own
+    profiler and all of them are merged into the dump; such a profiler can
+    only be switched off by its own thread, so threads started in the block
+    should be stopped and joined before it exits (pools used as context
+    managers are). Does nothing when `path` is None.
+    """
+    if path is None:
+        yield
+        return
+
+    import cProfile
+    import pstats
+
+    profiles = [cProfile.Profile()]
+    if sys.version_info >= (3, 12):
+        profiles[0].enable()
+        try:
+            yield
+        finally:
+            profiles[0].disable()
+            pstats.Stats(profiles[0]).dump_stats(str(path))
+        return
+
+    lock = threading.Lock()
+    stopped = False
+
+    def start_thread(*_: Any) -> None:
+        # Called on the first profiling event of a new thread; enabling a
+        # profiler replaces this hook for the thread
+        with lock:
+            if stopped:
+                sys.setprofile(None)
+                return
+            profile = cProfile.Profile()
+            profiles.append(profile)
+            profile.enable()
+
+    threading.setprofile(start_thread)
+    profiles[0].enable()
+    try:
+        yield
+    finally:
+        threading.setprofile(None)
+        with lock:
+            stopped = True
+            for profile in profiles:
+                profile.disable()
+            stats = pstats.Stats(*profiles)
+        stats.dump_stats(str(path))
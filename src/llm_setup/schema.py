@@ -0,0 +1,304 @@
+"""
+Declared schemas for project configuration files.
+
+Schemas use a small subset of JSON Schema (type, properties, required,
+additionalProperties, items, enum, minimum, maximum, minLength, pattern).
+Each schema is compiled once into a tree of closures and cached, so
+validating a file is a single walk over its data with no schema
+interpretation left to do.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+import json
+import re
+from typing import Any, Callable, Dict, List, Optional
+
+PROJECT_CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["name", "type", "technologies", "base_structure"],
+    "properties": {
+        "name": {"type": "string", "minLength": 1},
+        "type": {"type": "string", "minLength": 1},
+        "technologies": {"type": "array", "items": {"type": "string"}},
+        "base_structure": {"type": "string", "minLength": 1}
+    }
+}
+
+SEARCH_TYPE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "depth": {"type": "string", "enum": ["basic", "detailed", "comprehensive"]},
+        "include_code": {"type": "boolean"},
+        "include_examples": {"type": "boolean"},
+        "include_docs": {"type": "boolean"},
+        "max_results": {"type": "integer", "minimum": 1}
+    }
+}
+
+TOOLS_CONFIG_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "browser_action": {
+            "type": "object",
+            "properties": {
+                "resolution": {"type": "string", "pattern": r"^\d+x\d+$"},
+                "screenshots_enabled": {"type": "boolean"},
+                "console_logs_enabled": {"type": "boolean"}
+            }
+        },
+        "tavily_ai": {
+            "type": "object",
+            "properties": {
+                "search_types": {
+                    "type": "object",
+                    "additionalProperties": SEARCH_TYPE_SCHEMA
+                }
+            }
+        },
+        "mcp_tools": {
+            "type": "object",
+            "properties": {
+                "enabled": {"type": "boolean"},
+                "auto_discovery": {"type": "boolean"}
+            }
+        },
+        "http": {
+            "type": "object",
+            "properties": {
+                "max_connections_per_host": {"type": "integer", "minimum": 1},
+                "keepalive_expiry": {"type": "number", "minimum": 0},
+                "http2": {"type": "boolean"},
+                "timeout": {"type": "number", "minimum": 0}
+            }
+        }
+    }
+}
+
+PERCENTAGE_SCHEMA: Dict[str, Any] = {"type": "number", "minimum": 0, "maximum": 100}
+
+CONTEXT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "required": ["project", "state", "metrics"],
+    "properties": {
+        "project": {
+            "type": "object",
+            "required": ["name", "type", "technologies"],
+            "properties": {
+                "name": {"type": "string", "minLength": 1},
+                "type": {"type": "string"},
+                "technologies": {"type": "array", "items": {"type": "string"}}
+            }
+        },
+        "state": {
+            "type": "object",
+            "required": ["phase", "progress", "mode"],
+            "properties": {
+                "phase": {"type": "string"},
+                "progress": PERCENTAGE_SCHEMA,
+                "mode": {"type": "string"}
+            }
+        },
+        "metrics": {
+            "type": "object",
+            "additionalProperties": PERCENTAGE_SCHEMA
+        }
+    }
+}
+
+SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "project_config": PROJECT_CONFIG_SCHEMA,
+    "tools_config": TOOLS_CONFIG_SCHEMA,
+    "context": CONTEXT_SCHEMA
+}
+
+FILE_SCHEMAS: Dict[str, str] = {
+    "tools_config.json": "tools_config",
+    "context.yaml": "context"
+}
+
+_TYPES: Dict[str, Callable[[Any], bool]] = {
+    "object": lambda value: isinstance(value, dict),
+    "array": lambda value: isinstance(value, list),
+    "string": lambda value: isinstance(value, str),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": lambda value: isinstance(value, int) and not isinstance(value, bool),
+    "number": lambda value: (
+        isinstance(value, (int, float)) and not isinstance(value, bool)
+    )
+}
+
+_TYPE_NAMES = {
+    "object": "an object",
+    "array": "a list",
+    "string": "a string",
+    "boolean": "a boolean",
+    "integer": "an integer",
+    "number": "a number"
+}
+
+@dataclass(frozen=True)
+class SchemaViolation:
+    """A single schema violation at a path inside a document."""
+    path: str
+    message: str
+    kind: str
+
+    def __str__(self) -> str:
+        return f"Field '{self.path or '(root)'}' {self.message}"
+
+Check = Callable[[Any, str, List[SchemaViolation]], None]
+
+def _join(path: str, key: str) -> str:
+    """Extend a dotted document path with a property name."""
+    return f"{path}.{key}" if path else key
+
+def _compile(schema: Dict[str, Any]) -> Check:
+    """Compile a schema node into a single validation function."""
+    checks: List[Check] = []
+
+    expected = schema.get("type")
+    if expected is not None:
+        is_type = _TYPES[expected]
+        message = f"must be {_TYPE_NAMES[expected]}"
+    else:
+        is_type = None
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        allowed_text = ", ".join(repr(value) for value in allowed)
+
+        def check_enum(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            if value not in allowed:
+                out.append(SchemaViolation(path, f"must be one of {allowed_text}", "enum"))
+        checks.append(check_enum)
+
+    if "minLength" in schema:
+        min_length = schema["minLength"]
+
+        def check_length(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            if len(value) < min_length:
+                out.append(SchemaViolation(
+                    path, f"must have at least {min_length} character(s)", "minLength"
+                ))
+        checks.append(check_length)
+
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            if not pattern.search(value):
+                out.append(SchemaViolation(
+                    path, f"must match {pattern.pattern!r}", "pattern"
+                ))
+        checks.append(check_pattern)
+
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+
+        def check_minimum(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            if value < minimum:
+                out.append(SchemaViolation(path, f"must be >= {minimum}", "minimum"))
+        checks.append(check_minimum)
+
+    if "maximum" in schema:
+        maximum = schema["maximum"]
+
+        def check_maximum(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            if value > maximum:
+                out.append(SchemaViolation(path, f"must be <= {maximum}", "maximum"))
+        checks.append(check_maximum)
+
+    required = list(schema.get("required", []))
+    if required:
+        def check_required(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            for key in required:
+                if key not in value:
+                    out.append(SchemaViolation(_join(path, key), "is required", "required"))
+        checks.append(check_required)
+
+    properties = {
+        key: _compile(subschema)
+        for key, subschema in schema.get("properties", {}).items()
+    }
+    additional = schema.get("additionalProperties")
+    additional_check = _compile(additional) if isinstance(additional, dict) else None
+    if properties or additional_check or additional is False:
+        def check_properties(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            for key, item in value.items():
+                check = properties.get(key)
+                if check is not None:
+                    check(item, _join(path, key), out)
+                elif additional_check is not None:
+                    additional_check(item, _join(path, key), out)
+                elif additional is False:
+                    out.append(SchemaViolation(
+                        _join(path, key), "is not allowed", "additionalProperties"
+                    ))
+        checks.append(check_properties)
+
+    if "items" in schema:
+        item_check = _compile(schema["items"])
+
+        def check_items(value: Any, path: str, out: List[SchemaViolation]) -> None:
+            for index, item in enumerate(value):
+                item_check(item, f"{path}[{index}]", out)
+        checks.append(check_items)
+
+    def check(value: Any, path: str, out: List[SchemaViolation]) -> None:
+        if is_type is not None and not is_type(value):
+            out.append(SchemaViolation(path, message, "type"))
+            return
+        for run in checks:
+            run(value, path, out)
+
+    return check
+
+@lru_cache(maxsize=None)
+def get_validator(name: str) -> Callable[[Any], List[SchemaViolation]]:
+    """Get the compiled validator for a declared schema.
+
+    Args:
+        name: One of the keys of `SCHEMAS`
+
+    Returns:
+        Function returning every violation found in a document
+    """
+    check = _compile(SCHEMAS[name])
+
+    def validate(document: Any) -> List[SchemaViolation]:
+        violations: List[SchemaViolation] = []
+        check(document, "", violations)
+        return violations
+
+    return validate
+
+def validate_file(path: Path, schema: Optional[str] = None) -> List[SchemaViolation]:
+    """Parse a JSON or YAML file and validate it against a declared schema.
+
+    Args:
+        path: File to validate
+        schema: Schema name; inferred from the file name when omitted
+
+    Raises:
+        ValueError: If no schema is known for the file or it cannot be parsed
+    """
+    import yaml
+
+    name = schema or FILE_SCHEMAS.get(path.name)
+    if name is None:
+        raise ValueError(f"No schema declared for {path.name}")
+
+    with path.open("rb") as f:
+        try:
+            if path.suffix in (".yaml", ".yml"):
+                document = yaml.load(
+                    f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+                )
+            else:
+                document = json.load(f)
+        except (ValueError, yaml.YAMLError) as e:
+            raise ValueError(f"Cannot parse {path}: {e}")
+
+    return get_validator(name)(document)
@@ -0,0 +1,345 @@
+"""
+Local full-text search over a project's documentation.
+
+The markdown files under `DOC_DIRS` are split into sections (one per
+heading) and indexed in an inverted index ranked with BM25. The index is
+stored in a single compact file at the project root (`INDEX_FILE`):
+
+    MAGIC | header length (4 bytes) | zlib(JSON header) | zlib(postings)
+
+The header lists the indexed files (with size and mtime, to detect
+changes), the sections and, for each term, the byte range of its postings.
+Postings are (section gap, term frequency) pairs encoded as varints, and a
+query only decodes the postings of its own terms.
+
+`DocIndex.update()` re-reads only files that are new or changed since the
+last run and drops the sections of removed files.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import json
+import math
+import os
+import re
+import struct
+import unicodedata
+import zlib
+from typing import Dict, Iterator, List, Optional, Tuple
+
+DOC_DIRS = ["docs/adr", "docs/analysis", "docs/guides", "docs/methodology"]
+
+INDEX_FILE = ".llm_docs_index"
+
+MAGIC = b"LLMDOCS1"
+
+K1 = 1.2
+
+B = 0.75
+
+_TOKEN = re.compile(r"\w+")
+
+_HEADING = re.compile(r"#{1,6}\s+(.*?)\s*#*\s*$")
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase terms without accents."""
+    folded = unicodedata.normalize("NFKD", text.casefold())
+    folded = "".join(char for char in folded if not unicodedata.combining(char))
+    return _TOKEN.findall(folded)
+
+def split_sections(text: str, title: str) -> Iterator[Tuple[str, int, int, str]]:
+    """Split markdown into sections at ATX headings outside code fences.
+
+    Yields:
+        (heading, first line, last line, text) per non-empty section, with
+        1-based line numbers; text before the first heading uses `title`
+    """
+    heading, start, lines = title, 1, []
+    fenced = False
+    for number, line in enumerate(text.splitlines(), 1):
+        if line.lstrip().startswith(("```", "~~~")):
+            fenced = not fenced
+        match = None if fenced else _HEADING.match(line)
+        if match:
+            if any(part.strip() for part in lines):
+                yield heading, start, number - 1, "\n".join(lines)
+            heading, start, lines = match.group(1), number, [line]
+        else:
+            lines.append(line)
+    if any(part.strip() for part in lines):
+        yield heading, start, start + len(lines) - 1, "\n".join(lines)
+
+def _encode(pairs: List[Tuple[int, int]]) -> bytes:
+    """Varint-encode (section gap, frequency) pairs of sorted postings."""
+    out = bytearray()
+    previous = 0
+    for section, frequency in pairs:
+        for value in (section - previous, frequency):
+            while value >= 0x80:
+                out.append((value & 0x7F) | 0x80)
+                value >>= 7
+            out.append(value)
+        previous = section
+    return bytes(out)
+
+def _decode(data: bytes) -> List[Tuple[int, int]]:
+    """Inverse of `_encode()`."""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    pairs = []
+    section = 0
+    for index in range(0, len(values), 2):
+        section += values[index]
+        pairs.append((section, values[index + 1]))
+    return pairs
+
+@dataclass
+class SearchHit:
+    """A documentation section matching a query."""
+    path: str
+    heading: str
+    line: int
+    score: float
+    snippet: str = ""
+
+    def to_dict(self) -> Dict:
+        """Plain representation for JSON output."""
+        return asdict(self)
+
+@dataclass
+class IndexUpdate:
+    """Files examined by an index update."""
+    added: List[str] = field(default_factory=list)
+    updated: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> bool:
+        """Whether the index had to be rewritten."""
+        return bool(self.added or self.updated or self.removed)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self.added)} added, {len(self.updated)} updated, "
+            f"{len(self.removed)} removed, {self.unchanged} unchanged"
+        )
+
+class DocIndex:
+    """BM25 inverted index over a project's markdown documentation."""
+
+    def __init__(self, root: Path, index_file: Optional[Path] = None):
+        """Open the index of a project, loading it if it exists.
+
+        Args:
+            root: Project root
+            index_file: Index location (defaults to `INDEX_FILE` in root)
+        """
+        self.root = Path(root)
+        self.index_file = index_file or self.root / INDEX_FILE
+        # path -> [size, mtime_ns]
+        self.files: Dict[str, List[int]] = {}
+        # [path, heading, first line, last line, length in terms]
+        self.sections: List[list] = []
+        # term -> (offset, size) in the postings blob
+        self.terms: Dict[str, Tuple[int, int]] = {}
+        self._postings = b""
+        self._load()
+
+    def _load(self) -> None:
+        """Load the index file.
+
+        A truncated or corrupt index loads as empty, so that `update()`
+        rebuilds it.
+
+        Raises:
+            ValueError: If the file is not a documentation index at all
+        """
+        try:
+            data = self.index_file.read_bytes()
+        except FileNotFoundError:
+            return
+        if not data.startswith(MAGIC):
+            raise ValueError(f"Not a documentation index: {self.index_file}")
+        offset = len(MAGIC)
+        try:
+            (length,) = struct.unpack_from(">I", data, offset)
+            offset += 4
+            header = json.loads(zlib.decompress(data[offset:offset + length]))
+            files = header["files"]
+            sections = header["sections"]
+            terms = {term: tuple(span) for term, span in header["terms"].items()}
+            postings = zlib.decompress(data[offset + length:])
+        except (
+            struct.error, zlib.error, ValueError, KeyError, TypeError, AttributeError
+        ):
+            return
+        self.files, self.sections, self.terms = files, sections, terms
+        self._postings = postings
+
+    def postings(self, term: str) -> List[Tuple[int, int]]:
+        """(section, frequency) pairs of a term."""
+        span = self.terms.get(term)
+        if span is None:
+            return []
+        return _decode(self._postings[span[0]:span[0] + span[1]])
+
+    def _scan(self) -> Dict[str, List[int]]:
+        """Current markdown files with their size and mtime."""
+        found = {}
+        for directory in DOC_DIRS:
+            for dirpath, dirnames, filenames in os.walk(self.root / directory):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if not filename.endswith(".md"):
+                        continue
+                    path = os.path.join(dirpath, filename)
+                    stat = os.stat(path)
+                    relative = Path(path).relative_to(self.root).as_posix()
+                    found[relative] = [stat.st_size, stat.st_mtime_ns]
+        return found
+
+    def update(self) -> IndexUpdate:
+        """Bring the index up to date with the documentation on disk.
+
+        Only new and changed files are read; the index file is rewritten
+        only when something changed.
+        """
+        current = self._scan()
+        result = IndexUpdate()
+        for path, stat in current.items():
+            if path not in self.files:
+                result.added.append(path)
+            elif self.files[path] != stat:
+                result.updated.append(path)
+            else:
+                result.unchanged += 1
+        result.removed = sorted(set(self.files) - set(current))
+        if not result.changed:
+            return result
+
+        stale = set(result.updated) | set(result.removed)
+        # Keep the postings of unchanged files, renumbering their sections
+        renumbered: Dict[int, int] = {}
+        sections = []
+        for number, section in enumerate(self.sections):
+            if section[0] not in stale:
+                renumbered[number] = len(sections)
+                sections.append(section)
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for term in self.terms:
+            kept = [
+                (renumbered[section], frequency)
+                for section, frequency in self.postings(term)
+                if section in renumbered
+            ]
+            if kept:
+                postings[term] = kept
+
+        for path in result.added + result.updated:
+            text = (self.root / path).read_text(encoding="utf-8", errors="replace")
+            for heading, first, last, body in split_sections(text, Path(path).stem):
+                counts: Dict[str, int] = {}
+                terms = tokenize(body)
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                number = len(sections)
+                sections.append([path, heading, first, last, len(terms)])
+                for term, frequency in counts.items():
+                    postings.setdefault(term, []).append((number, frequency))
+
+        self.files = current
+        self.sections = sections
+        self._store(postings)
+        return result
+
+    def _store(self, postings: Dict[str, List[Tuple[int, int]]]) -> None:
+        """Encode the postings and write the index file atomically."""
+        blob = bytearray()
+        self.terms = {}
+        for term in sorted(postings):
+            encoded = _encode(postings[term])
+            self.terms[term] = (len(blob), len(encoded))
+            blob += encoded
+        self._postings = bytes(blob)
+
+        header = zlib.compress(json.dumps({
+            "version": 1,
+            "files": self.files,
+            "sections": self.sections,
+            "terms": self.terms
+        }, separators=(",", ":")).encode("utf-8"))
+        temporary = self.index_file.with_name(f".{self.index_file.name}.tmp")
+        with open(temporary, "wb") as f:
+            f.write(MAGIC + struct.pack(">I", len(header)) + header)
+            f.write(zlib.compress(self._postings))
+        os.replace(temporary, self.index_file)
+
+    def search(self, query: str, limit: int = 10, snippets: bool = True) -> List[SearchHit]:
+        """Rank documentation sections against a query with BM25.
+
+        Args:
+            query: Free-text query
+            limit: Maximum number of hits
+            snippets: Read each hit's section to include a short excerpt
+        """
+        if not self.sections:
+            return []
+        average = sum(section[4] for section in self.sections) / len(self.sections)
+        count = len(self.sections)
+        scores: Dict[int, float] = {}
+        for term in set(tokenize(query)):
+            matches = self.postings(term)
+            if not matches:
+                continue
+            idf = math.log(1 + (count - len(matches) + 0.5) / (len(matches) + 0.5))
+            for section, frequency in matches:
+                length = self.sections[section][4]
+                norm = K1 * (1 - B + B * length / average) if average else K1
+                scores[section] = scores.get(section, 0.0) + idf * (
+                    frequency * (K1 + 1) / (frequency + norm)
+                )
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+        hits = []
+        for section, score in ranked:
+            path, heading, first, last, _ = self.sections[section]
+            hit = SearchHit(path, heading, first, round(score, 4))
+            if snippets:
+                hit.snippet = self._snippet(path, first, last, query)
+            hits.append(hit)
+        return hits
+
+    def _snippet(self, path: str, first: int, last: int, query: str, width: int = 200) -> str:
+        """First lines of a section that mention a query term."""
+        try:
+            lines = (self.root / path).read_text(encoding="utf-8").splitlines()
+        except OSError:
+            return ""
+        wanted = set(tokenize(query))
+        body = [line.strip() for line in lines[first - 1:last] if line.strip()]
+        for index, line in enumerate(body):
+            if wanted & set(tokenize(line)):
+                return " ".join(body[index:index + 3])[:width]
+        return " ".join(body[:3])[:width]
+
+def search(root: Path, query: str, limit: int = 10, update: bool = True) -> List[SearchHit]:
+    """Search a project's documentation, updating its index first.
+
+    Args:
+        root: Project root
+        query: Free-text query
+        limit: Maximum number of hits
+        update: Re-index changed files before searching
+    """
+    index = DocIndex(root)
+    if update:
+        index.update()
+    return index.search(query, limit)
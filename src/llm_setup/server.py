@@ -0,0 +1,198 @@
+"""
+Persistent command server for llm-setup.
+
+The server keeps the CLI, the setup engine, the compiled templates and the
+compiled schema validators loaded, and runs `llm-setup` command lines sent
+over a local Unix socket. It exits after an idle timeout, and as soon as a
+client reports a different package version, so upgrades take effect on the
+next call.
+
+Protocol: one JSON object per line in each direction.
+"""
+
+import importlib
+import json
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import __version__
+from .client import DEFAULT_IDLE_TIMEOUT, default_socket_path, ensure_private_dir
+
+# Modules that commands import lazily, preloaded by `CommandServer.warm_up()`
+WARM_MODULES = [".cli", ".setup", ".validation"]
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handle a single JSON request line."""
+
+    server: "CommandServer"
+
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            response = self.server.dispatch(json.loads(line))
+        except Exception as e:
+            response = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+class CommandServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server running llm-setup commands in a warm process."""
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: Optional[Path] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+    ):
+        """Bind the server socket.
+
+        Args:
+            socket_path: Socket to listen on (defaults to the per-user socket)
+            idle_timeout: Seconds without requests before the server exits
+
+        Raises:
+            PermissionError: If the socket directory is not private to the
+                current user
+            RuntimeError: If another server is already listening on the socket
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self.idle_timeout = idle_timeout
+        self.stopping = False
+        self.last_activity = time.monotonic()
+        self.active = 0
+        self._state_lock = threading.Lock()
+        self._command_lock = threading.Lock()
+
+        ensure_private_dir(self.socket_path.parent)
+        self._remove_stale_socket()
+        # Create the socket without group or other permissions from the start
+        previous = os.umask(0o177)
+        try:
+            super().__init__(str(self.socket_path), _RequestHandler)
+        finally:
+            os.umask(previous)
+        self.timeout = min(1.0, idle_timeout)
+
+    def _remove_stale_socket(self) -> None:
+        """Remove a socket file left behind by a server that died."""
+        if not self.socket_path.exists():
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(str(self.socket_path))
+        except OSError:
+            self.socket_path.unlink(missing_ok=True)
+        else:
+            raise RuntimeError(f"A server is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def warm_up(self) -> None:
+        """Load everything commands need before the first request arrives."""
+        from .schema import SCHEMAS, get_validator
+        from .templates import TEMPLATES_DIR, get_environment
+
+        for module in WARM_MODULES:
+            importlib.import_module(module, __package__)
+        environment = get_environment()
+        for template in TEMPLATES_DIR.glob("*.j2"):
+            environment.get_template(template.name)
+        for name in SCHEMAS:
+            get_validator(name)
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a decoded request and build its response."""
+        if request.get("version") != __version__:
+            self.stopping = True
+            return {"ok": False, "error": "version_mismatch", "version": __version__}
+
+        command = request.get("command")
+        if command == "ping":
+            return {"ok": True, "version": __version__, "pid": os.getpid()}
+        if command == "shutdown":
+            self.stopping = True
+            return {"ok": True}
+        if command == "run":
+            return self._run_command(request.get("args", []), request.get("cwd"))
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+    def _run_command(self, args: list, cwd: Optional[str]) -> Dict[str, Any]:
+        """Run an llm-setup command line in-process and capture its output.
+
+        Commands are serialized because they share the process's working
+        directory and standard streams.
+        """
+        from click.testing import CliRunner
+
+        from .cli import cli
+
+        with self._command_lock:
+            previous = os.getcwd()
+            try:
+                if cwd:
+                    os.chdir(cwd)
+                result = CliRunner().invoke(cli, args, prog_name="llm-setup")
+            finally:
+                os.chdir(previous)
+
+        return {"ok": True, "exit_code": result.exit_code, "output": result.output}
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        with self._state_lock:
+            self.active += 1
+        super().process_request(request, client_address)
+
+    def shutdown_request(self, request: Any) -> None:
+        super().shutdown_request(request)
+        with self._state_lock:
+            self.active -= 1
+            self.last_activity = time.monotonic()
+
+    def idle(self) -> bool:
+        """Whether the idle timeout has expired with no request in flight."""
+        with self._state_lock:
+            return (
+                self.active == 0
+                and time.monotonic() - self.last_activity >= self.idle_timeout
+            )
+
+    def serve(self) -> None:
+        """Serve requests until shut down, idle, or replaced by a new version."""
+        try:
+            while not self.stopping and not self.idle():
+                self.handle_request()
+        finally:
+            self.server_close()
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.socket_path.unlink(missing_ok=True)
+
+def serve(
+    socket_path: Optional[Path] = None,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT
+) -> None:
+    """Run a warm command server in the foreground."""
+    server = CommandServer(socket_path, idle_timeout)
+    server.warm_up()
+    server.serve()
+
+def main() -> None:
+    """Entry point used by the client to start a detached server."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="llm-setup command server")
+    parser.add_argument("--socket", type=Path, default=None)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    args = parser.parse_args()
+    serve(args.socket, args.idle_timeout)
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,28 @@
 Core setup module for Cline LLM Methodology.
 """
 
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
+import atexit
+import difflib
+import hashlib
 import shutil
 import json
+import os
+import re
+import time
+import uuid
 import yaml
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 import logging
+import logging.handlers
+import queue
 import sys
+import threading
+
+from .events import NULL_EVENTS, EventStream
+from .profiling import RunMetrics, StepMetrics, max_rss, track_memory
 
 @dataclass
 class ProjectConfig:
@@ -20,28 +34,185 @@ class ProjectConfig:
     base_structure: str
     documentation_path: Path
 
+@dataclass
+class SetupStep:
+    """Single unit of work in the setup task graph."""
+    name: str
+    action: Callable[[], None]
+    message: str
+    depends_on: Tuple[str, ...] = ()
+
+MANIFEST_FILE = ".llm_setup_manifest.json"
+
+LOGGER_NAME = "llm_setup"
+
+_logging_lock = threading.Lock()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+class _StdoutHandler(logging.StreamHandler):
+    """Stream handler writing to whatever `sys.stdout` is at emit time, so
+    a redirected or replaced stdout is honoured after configuration."""
+    
+    def __init__(self) -> None:
+        super().__init__(sys.stdout)
+        
+    @property
+    def stream(self):
+        return sys.stdout
+        
+    @stream.setter
+    def stream(self, value) -> None:
+        pass
+
+def configure_logging() -> logging.Logger:
+    """Configure the `llm_setup` logger once per process.
+    
+    Records are put on a queue and written to stdout by a background
+    `QueueListener`, so logging never blocks a setup step on a slow
+    terminal. Later calls return the configured logger unchanged, and the
+    queue is drained at interpreter exit.
+    """
+    global _log_listener
+    logger = logging.getLogger(LOGGER_NAME)
+    with _logging_lock:
+        if _log_listener is None:
+            records: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            handler = _StdoutHandler()
+            handler.setFormatter(
+                logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+            )
+            _log_listener = logging.handlers.QueueListener(records, handler)
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+            logger.addHandler(logging.handlers.QueueHandler(records))
+            logger.setLevel(logging.INFO)
+    return logger
+
+def flush_logging() -> None:
+    """Write out every queued log record before returning."""
+    with _logging_lock:
+        if _log_listener is not None:
+            _log_listener.stop()
+            _log_listener.start()
+
+def _fsync_dir(path: Path) -> None:
+    """Flush a directory entry to disk where the platform supports it."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def _fsync_tree(root: Path) -> None:
+    """Flush every file and directory under root to disk."""
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            with open(os.path.join(dirpath, filename), "rb") as f:
+                os.fsync(f.fileno())
+        _fsync_dir(Path(dirpath))
+
+def _hash_file(path: Path) -> str:
+    """Compute the SHA-256 digest of a file's content."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _process_alive(pid: int) -> bool:
+    """Whether a process with this id is running."""
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # os.kill would terminate it; assume it is still running
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+def _remove_stale_staging(target: Path) -> None:
+    """Remove staging and backup directories of `target` left behind by
+    runs that were killed.
+
+    Their names carry the id of the process that created them, so the
+    directories of runs still in progress are kept.
+    """
+    pattern = re.compile(
+        rf"\.{re.escape(target.name)}\.staging-(?:(\d+)-)?[0-9a-f]{{12}}(?:-backup)?"
+    )
+    try:
+        entries = list(os.scandir(target.parent))
+    except OSError:
+        return
+    for entry in entries:
+        match = pattern.fullmatch(entry.name)
+        if match is None or not entry.is_dir(follow_symlinks=False):
+            continue
+        if match.group(1) is not None and _process_alive(int(match.group(1))):
+            continue
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+def _preserve(path: Path, backup: Path) -> None:
+    """Keep a copy of path at backup without ever removing the original."""
+    try:
+        os.link(path, backup)
+    except OSError:
+        shutil.copy2(path, backup)
+
 class LLMMethodologySetup:
     """Implementation of the LLM methodology setup."""
     
-    def __init__(self, config: ProjectConfig):
+    def __init__(
+        self,
+        config: ProjectConfig,
+        template_dirs: Sequence[Path] = (),
+        events: Optional[EventStream] = None
+    ):
         """Initialize setup with project configuration.
         
         Args:
             config: Project configuration
+            template_dirs: Extra template directories searched before the
+                built-in template pack
+            events: Stream receiving structured run and step events
         """
         self.config = config
+        self.template_dirs = tuple(template_dirs)
+        self.events = events or NULL_EVENTS
+        self._step_state = threading.local()
         self.logger = self._setup_logging()
+        self.timings: Dict[str, float] = {}
+        self.writes: Dict[str, Dict[str, int]] = {}
+        self.peak_memory: Optional[int] = None
+        self._elapsed = 0.0
+        self.changes: Dict[str, str] = {}
+        self._staging: Optional[Path] = None
+        self._dry_run = False
+        self._manifest: Dict[str, Dict] = {}
+        self._rendered: Dict[str, str] = {}
+        self._digests: Dict[str, str] = {}
+        
+    @property
+    def root(self) -> Path:
+        """Directory the setup steps write into.
+        
+        This is the staging directory while `run()` is in progress, and the
+        configured documentation path otherwise.
+        """
+        return self._staging or self.config.documentation_path
         
     def _setup_logging(self) -> logging.Logger:
         """Configure logging system."""
-        logger = logging.getLogger("llm_setup")
-        handler = logging.StreamHandler(sys.stdout)
-        handler.setFormatter(
-            logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-        )
-        logger.addHandler(handler)
-        logger.setLevel(logging.INFO)
-        return logger
+        return configure_logging()
         
     def create_directory_structure(self) -> None:
         """Create base directory structure."""
@@ -57,25 +228,38 @@ class LLMMethodologySetup:
             "examples"             # Example projects
         ]
         
+        if self._dry_run:
+            return
+            
         for dir_path in directories:
-            Path(self.config.documentation_path / dir_path).mkdir(
+            Path(self.root / dir_path).mkdir(
                 parents=True, exist_ok=True
             )
             
+    def _documentation_generators(self) -> Dict[str, Callable[[], str]]:
+        """Map each base documentation file to its generator."""
+        return {
+            "README.md": self._generate_readme,
+            "llm_methodology.md": self._generate_methodology_doc,
+            "tools_integration.md": self._generate_tools_doc,
+            "tavily_integration.md": self._generate_tavily_doc,
+            "project_initialization.md": self._generate_initialization_doc,
+            "resume_prompt.md": self._generate_resume_doc
+        }
+        
     def create_base_documentation(self) -> None:
         """Create base documentation files."""
-        docs = {
-            "README.md": self._generate_readme(),
-            "llm_methodology.md": self._generate_methodology_doc(),
-            "tools_integration.md": self._generate_tools_doc(),
-            "tavily_integration.md": self._generate_tavily_doc(),
-            "project_initialization.md": self._generate_initialization_doc(),
-            "resume_prompt.md": self._generate_resume_doc()
-        }
+        for filename in self._documentation_generators():
+            self.create_documentation_file(filename)
+            
+    def create_documentation_file(self, filename: str) -> None:
+        """Create a single base documentation file.
         
-        for filename, content in docs.items():
-            path = self.config.documentation_path / "docs/methodology" / filename
-            path.write_text(content)
+        Args:
+            filename: Name of the file under docs/methodology
+        """
+        content = self._documentation_generators()[filename]()
+        self._write_text(f"docs/methodology/{filename}", content)
             
     def setup_tools_configuration(self) -> None:
         """Configure project tools."""
@@ -89,11 +273,13 @@ class LLMMethodologySetup:
                 "search_types": {
                     "technical": {
                         "depth": "comprehensive",
-                        "include_code": True
+                        "include_code": True,
+                        "max_results": 10
                     },
                     "implementation": {
                         "depth": "detailed",
-                        "include_examples": True
+                        "include_examples": True,
+                        "max_results": 5
                     }
                 }
             },
@@ -103,8 +289,7 @@ class LLMMethodologySetup:
             }
         }
         
-        config_path = self.config.documentation_path / "tools_config.json"
-        config_path.write_text(json.dumps(tools_config, indent=2))
+        self._write_text("tools_config.json", json.dumps(tools_config, indent=2))
         
     def create_project_context(self) -> None:
         """Create initial project context."""
@@ -126,8 +311,7 @@ class LLMMethodologySetup:
             }
         }
         
-        context_path = self.config.documentation_path / "docs/methodology/context.yaml"
-        context_path.write_text(yaml.dump(context, indent=2))
+        self._write_text("docs/methodology/context.yaml", yaml.dump(context, indent=2))
         
     def setup_version_control(self) -> None:
         """Configure version control."""
@@ -140,166 +324,427 @@ class LLMMethodologySetup:
         .coverage
         htmlcov/
         .pytest_cache/
+        .llm_docs_index
+        .llm_context_tokens
         """
         
-        gitignore_path = self.config.documentation_path / ".gitignore"
-        gitignore_path.write_text(gitignore.strip())
+        self._write_text(".gitignore", gitignore.strip())
         
-    def run(self) -> None:
-        """Execute complete setup process."""
+    def _load_manifest(self) -> Dict[str, Dict]:
+        """Read the content-hash manifest of a previous setup, if any."""
         try:
-            self.logger.info("Starting LLM methodology setup...")
+            with (self.config.documentation_path / MANIFEST_FILE).open() as f:
+                return json.load(f).get("files", {})
+        except (OSError, ValueError):
+            return {}
+            
+    def _current_digest(self, relative: str) -> Optional[str]:
+        """Digest of a file in the target project, or None if it is missing.
+        
+        The manifest digest is trusted when the file's size and mtime still
+        match the manifest, so unchanged files are never read.
+        """
+        path = self.config.documentation_path / relative
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+            
+        entry = self._manifest.get(relative)
+        if (
+            entry
+            and entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+        ):
+            return entry.get("sha256")
+        return _hash_file(path)
+        
+    def _write_text(self, relative: str, content: str) -> None:
+        """Write a generated file unless the project already has that content.
+        
+        Args:
+            relative: Path of the file relative to the project root
+            content: Rendered file content
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        current = self._current_digest(relative)
+        
+        if current is None:
+            status = "created"
+        elif current == digest:
+            status = "unchanged"
+        else:
+            status = "modified"
+            
+        self.changes[relative] = status
+        self._rendered[relative] = content
+        self._digests[relative] = digest
+        
+        if status != "unchanged" and not self._dry_run:
+            path = self.root / relative
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+            written = getattr(self._step_state, "written", None)
+            if written is not None:
+                written["files"] = written.get("files", 0) + 1
+                written["bytes"] = written.get("bytes", 0) + len(data)
+            
+    def _write_manifest(self) -> None:
+        """Record digests of the generated files in the staging tree.
+        
+        The manifest is only written when it differs from the one already
+        in the project, so a no-op re-setup touches nothing.
+        """
+        files = {}
+        for relative, digest in self._digests.items():
+            staged = self.root / relative
+            path = staged if staged.exists() else (
+                self.config.documentation_path / relative
+            )
+            stat = path.stat()
+            files[relative] = {
+                "sha256": digest,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns
+            }
+            
+        if files != self._manifest:
+            (self.root / MANIFEST_FILE).write_text(
+                json.dumps({"version": 1, "files": files}, indent=2, sort_keys=True)
+            )
+            
+    def _change_counts(self) -> Dict[str, int]:
+        """Count generated files by status for the most recent run."""
+        counts = {"created": 0, "modified": 0, "unchanged": 0}
+        for status in self.changes.values():
+            counts[status] += 1
+        return counts
+        
+    def change_summary(self) -> str:
+        """Count generated files by status for the most recent run."""
+        return ", ".join(
+            f"{count} {status}" for status, count in self._change_counts().items()
+        )
+        
+    def diff(self) -> str:
+        """Unified diff between the project on disk and the rendered output.
+        
+        Reflects the most recent `run()`, including a dry run.
+        """
+        chunks: List[str] = []
+        for relative, status in sorted(self.changes.items()):
+            if status == "unchanged":
+                continue
+            old = []
+            if status == "modified":
+                old = (self.config.documentation_path / relative).read_text(
+                    encoding="utf-8"
+                ).splitlines(keepends=True)
+            new = self._rendered[relative].splitlines(keepends=True)
+            chunks.extend(
+                difflib.unified_diff(old, new, f"a/{relative}", f"b/{relative}")
+            )
+        return "".join(chunks)
+        
+    def steps(self) -> List[SetupStep]:
+        """Declare the setup task graph.
+        
+        Only the directory structure is a real prerequisite; every file
+        write after it is independent and may run concurrently.
+        """
+        after_dirs = ("directories",)
+        steps = [
+            SetupStep(
+                "directories",
+                self.create_directory_structure,
+                "Directory structure created"
+            )
+        ]
+        
+        for filename in self._documentation_generators():
+            steps.append(SetupStep(
+                f"docs/{filename}",
+                lambda filename=filename: self.create_documentation_file(filename),
+                f"Documentation created: {filename}",
+                after_dirs
+            ))
+            
+        steps.extend([
+            SetupStep(
+                "tools", self.setup_tools_configuration, "Tools configured", after_dirs
+            ),
+            SetupStep(
+                "context", self.create_project_context, "Project context created",
+                after_dirs
+            ),
+            SetupStep(
+                "version_control", self.setup_version_control,
+                "Version control configured", after_dirs
+            )
+        ])
+        return steps
+        
+    def _run_step(self, step: SetupStep) -> None:
+        """Execute a single step and record its wall time and the files it
+        writes."""
+        with self.events.step(step.name) as written:
+            self._step_state.written = written
+            start = time.perf_counter()
+            try:
+                step.action()
+            finally:
+                self.timings[step.name] = time.perf_counter() - start
+                self.writes[step.name] = dict(written)
+                self._step_state.written = None
+        self.logger.info(step.message)
+        
+    def _run_steps(self, steps: List[SetupStep], max_workers: Optional[int]) -> None:
+        """Execute steps on a thread pool as soon as their dependencies finish.
+        
+        No new step is started once one has failed; steps already running
+        are allowed to finish and the first error is re-raised.
+        """
+        pending = {step.name: step for step in steps}
+        unknown = {
+            dep for step in steps for dep in step.depends_on if dep not in pending
+        }
+        if unknown:
+            raise ValueError(f"Unknown step dependencies: {', '.join(sorted(unknown))}")
+            
+        done: Set[str] = set()
+        errors: List[BaseException] = []
+        running: Dict[Future, SetupStep] = {}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                if not errors:
+                    for name, step in list(pending.items()):
+                        if all(dep in done for dep in step.depends_on):
+                            running[executor.submit(self._run_step, step)] = step
+                            del pending[name]
+                            
+                if not running:
+                    break
+                    
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    step = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        errors.append(error)
+                    else:
+                        done.add(step.name)
+                        
+        if errors:
+            raise errors[0]
+        if pending:
+            raise ValueError(
+                f"Circular step dependencies: {', '.join(sorted(pending))}"
+            )
             
-            self.create_directory_structure()
-            self.logger.info("Directory structure created")
+    def timing_report(self) -> str:
+        """Format recorded step timings, slowest first."""
+        return "\n".join(
+            f"  {name}: {duration * 1000:.1f} ms"
+            for name, duration in sorted(
+                self.timings.items(), key=lambda item: item[1], reverse=True
+            )
+        )
+        
+    def metrics(self) -> RunMetrics:
+        """Per-step wall time and writes, and peak memory, of the most
+        recent run.
+        
+        Peak Python memory is only measured by `run(trace_memory=True)`.
+        """
+        return RunMetrics(
+            steps=[
+                StepMetrics(
+                    name,
+                    duration,
+                    files=self.writes.get(name, {}).get("files", 0),
+                    bytes=self.writes.get(name, {}).get("bytes", 0)
+                )
+                for name, duration in self.timings.items()
+            ],
+            seconds=self._elapsed,
+            peak_memory=self.peak_memory,
+            max_rss=max_rss()
+        )
+        
+    def _publish(self, staging: Path, target: Path) -> None:
+        """Move a fully written staging tree into place.
+        
+        A new target is published with a single atomic rename. An existing
+        target is updated file by file with atomic replacements; if any of
+        them fails, every file already replaced is restored and every file
+        or directory added is removed again.
+        """
+        if not target.exists():
+            os.rename(staging, target)
+            _fsync_dir(target.parent)
+            return
             
-            self.create_base_documentation()
-            self.logger.info("Base documentation created")
+        backup = staging.with_name(staging.name + "-backup")
+        created_dirs: List[Path] = []
+        replaced: List[Tuple[Path, Optional[Path]]] = []
+        try:
+            for dirpath, _, filenames in os.walk(staging):
+                relative = Path(dirpath).relative_to(staging)
+                dest_dir = target / relative
+                if not dest_dir.is_dir():
+                    dest_dir.mkdir()
+                    created_dirs.append(dest_dir)
+                    
+                if not filenames:
+                    continue
+                for filename in filenames:
+                    dest = dest_dir / filename
+                    saved = None
+                    if dest.exists():
+                        saved = backup / relative / filename
+                        saved.parent.mkdir(parents=True, exist_ok=True)
+                        _preserve(dest, saved)
+                    replaced.append((dest, saved))
+                    os.replace(Path(dirpath) / filename, dest)
+                    
+                _fsync_dir(dest_dir)
+                
+        except BaseException:
+            for dest, saved in reversed(replaced):
+                try:
+                    if saved is not None:
+                        os.replace(saved, dest)
+                    else:
+                        dest.unlink(missing_ok=True)
+                except OSError:
+                    self.logger.error(f"Could not roll back {dest}")
+            for dest_dir in reversed(created_dirs):
+                shutil.rmtree(dest_dir, ignore_errors=True)
+            raise
+        finally:
+            shutil.rmtree(backup, ignore_errors=True)
             
-            self.setup_tools_configuration()
-            self.logger.info("Tools configured")
+    def run(
+        self,
+        max_workers: Optional[int] = None,
+        dry_run: bool = False,
+        trace_memory: bool = False
+    ) -> None:
+        """Execute complete setup process.
+        
+        The project is generated in a staging directory next to the target
+        and only published once every step has succeeded, so a failed or
+        interrupted run never leaves a partially written project behind.
+        Staging directories of earlier runs that were killed are removed
+        first.
+        Files whose rendered content matches what is already on disk are not
+        rewritten; `changes` reports the status of every generated file.
+        
+        Args:
+            max_workers: Maximum number of steps executed concurrently
+            dry_run: Compute `changes` and `diff()` without writing anything
+            trace_memory: Measure the peak Python memory of the run for
+                `metrics()` (tracing slows the run down)
+        """
+        self.peak_memory = None
+        if trace_memory:
+            memory: Dict[str, int] = {}
+            try:
+                with track_memory() as memory:
+                    self.run(max_workers, dry_run)
+            finally:
+                self.peak_memory = memory.get("peak")
+            return
             
-            self.create_project_context()
-            self.logger.info("Project context created")
+        target = self.config.documentation_path
+        staging = None
+        try:
+            self.logger.info("Starting LLM methodology setup...")
+            self.timings = {}
+            self.writes = {}
+            self._elapsed = 0.0
+            self.changes = {}
+            self._rendered = {}
+            self._digests = {}
+            self._dry_run = dry_run
+            self._manifest = self._load_manifest()
             
-            self.setup_version_control()
-            self.logger.info("Version control configured")
+            start = time.perf_counter()
+            self.events.emit(
+                "run_start",
+                kind="setup",
+                project=self.config.name,
+                target=str(target),
+                dry_run=dry_run
+            )
+            resolved = target.resolve()
+            if not dry_run:
+                resolved.parent.mkdir(parents=True, exist_ok=True)
+                _remove_stale_staging(resolved)
+                staging = resolved.with_name(
+                    f".{resolved.name}.staging-{os.getpid()}-{uuid.uuid4().hex[:12]}"
+                )
+                staging.mkdir()
+                self._staging = staging
+                
+            self._run_steps(self.steps(), max_workers)
+            if staging is not None:
+                self._write_manifest()
+                _fsync_tree(staging)
+                self._publish(staging, resolved)
+            total = self._elapsed = time.perf_counter() - start
+            self.events.emit(
+                "run_end",
+                ok=True,
+                duration=total,
+                changes=self._change_counts()
+            )
             
             self.logger.info("Setup completed successfully")
+            self.logger.info(self.change_summary())
+            self.logger.info(
+                f"Step timings (total {total * 1000:.1f} ms):\n{self.timing_report()}"
+            )
             
         except Exception as e:
+            self.events.emit("run_end", ok=False, error=str(e))
             self.logger.error(f"Error during setup: {str(e)}")
             raise
+            
+        finally:
+            self._staging = None
+            self._dry_run = False
+            if staging is not None and staging.exists():
+                shutil.rmtree(staging, ignore_errors=True)
+
+    def _render(self, template: str) -> str:
+        """Render a documentation template for this project."""
+        from .templates import render_template
+        
+        return render_template(template, self.config, self.template_dirs)
 
     def _generate_readme(self) -> str:
         """Generate project README."""
-        return f"""# {self.config.name}
-
-Project using Cline LLM Methodology.
-
-## Overview
-
-- Type: {self.config.type}
-- Technologies: {', '.join(self.config.technologies)}
-
-## Documentation
-
-See the `docs/` directory for complete documentation:
-
-- [LLM Methodology](docs/methodology/llm_methodology.md)
-- [Tools Integration](docs/methodology/tools_integration.md)
-- [Project Initialization](docs/methodology/project_initialization.md)
-
-## Development
-
-### Setup
-
-```bash
-# Install dependencies
-poetry install
-
-# Setup environment
-poetry shell
-
-# Run tests
-pytest
-```
-
-### Structure
-
-```
-{self.config.name}/
-├── docs/           # Documentation
-├── src/           # Source code
-├── tests/         # Tests
-└── tools/         # Tools and scripts
-```
-"""
+        return self._render("README.md.j2")
 
     def _generate_methodology_doc(self) -> str:
         """Generate methodology documentation."""
-        return """# LLM Methodology
-
-Structured approach for developing projects with LLM in VSCode using Cline.
-
-## Core Principles
-
-1. Structured Documentation
-2. Tool Integration
-3. Context Management
-4. Iterative Development
-
-## Components
-
-1. Documentation Structure
-2. Tool Configuration
-3. Project Templates
-4. Development Workflow
-
-See individual component documentation for details.
-"""
+        return self._render("llm_methodology.md.j2")
 
     def _generate_tools_doc(self) -> str:
         """Generate tools documentation."""
-        return """# Tools Integration
-
-Configuration and usage of integrated tools.
-
-## Available Tools
-
-1. Browser Action
-2. Tavily AI
-3. MCP Tools
-
-## Configuration
-
-See `tools_config.json` for detailed configuration.
-"""
+        return self._render("tools_integration.md.j2")
 
     def _generate_tavily_doc(self) -> str:
         """Generate Tavily AI documentation."""
-        return """# Tavily AI Integration
-
-Integration with Tavily AI for technical search and research.
-
-## Configuration
-
-See `tools_config.json` for search type configurations.
-
-## Usage
-
-Examples of common search patterns and best practices.
-"""
+        return self._render("tavily_integration.md.j2")
 
     def _generate_initialization_doc(self) -> str:
         """Generate initialization documentation."""
-        return """# Project Initialization
-
-Guide for initializing new projects using the methodology.
-
-## Steps
-
-1. Configuration
-2. Directory Setup
-3. Tool Integration
-4. Documentation
-
-## Templates
-
-Available project templates and their usage.
-"""
+        return self._render("project_initialization.md.j2")
 
     def _generate_resume_doc(self) -> str:
         """Generate resume documentation."""
-        return """# Work Resumption
-
-Guide for resuming work on projects.
-
-## Context Management
-
-How to maintain and restore context when resuming work.
-
-## Tools
-
-Using tools effectively for work continuation.
-"""
\ No newline at end of file
+        return self._render("resume_prompt.md.j2")
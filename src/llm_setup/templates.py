@@ -0,0 +1,108 @@
+"""
+Template engine for generated project documentation.
+
+Templates are compiled once per process and their bytecode is persisted on
+disk, so repeated setups (and later processes) skip parsing entirely.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+import os
+from typing import Any, List, Optional, Sequence, Tuple
+
+from jinja2 import (
+    BaseLoader,
+    BytecodeCache,
+    ChoiceLoader,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    StrictUndefined,
+    Template,
+)
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+
+def default_cache_dir() -> Path:
+    """Directory holding compiled template bytecode.
+
+    Uses LLM_SETUP_CACHE_DIR when set, otherwise the user cache directory.
+    """
+    override = os.environ.get("LLM_SETUP_CACHE_DIR")
+    if override:
+        return Path(override) / "templates"
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "llm_setup" / "templates"
+
+def _bytecode_cache(cache_dir: Path) -> Optional[BytecodeCache]:
+    """Create an on-disk bytecode cache, or None if the directory is unusable."""
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError:
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
+@lru_cache(maxsize=None)
+def get_environment(
+    template_dirs: Tuple[str, ...] = (),
+    cache_dir: Optional[str] = None
+) -> Environment:
+    """Get the shared template environment for a template search path.
+
+    Args:
+        template_dirs: Extra template directories, searched before the
+            built-in template pack
+        cache_dir: Bytecode cache directory (defaults to `default_cache_dir()`)
+    """
+    loaders: List[BaseLoader] = [FileSystemLoader(path) for path in template_dirs]
+    loaders.append(FileSystemLoader(str(TEMPLATES_DIR)))
+
+    return Environment(
+        loader=ChoiceLoader(loaders),
+        bytecode_cache=_bytecode_cache(
+            Path(cache_dir) if cache_dir else default_cache_dir()
+        ),
+        auto_reload=False,
+        keep_trailing_newline=True,
+        undefined=StrictUndefined,
+        autoescape=False
+    )
+
+@lru_cache(maxsize=1024)
+def _select_template(
+    environment: Environment,
+    name: str,
+    project_type: str,
+    base_structure: str
+) -> Template:
+    """Resolve the most specific template for a project, memoizing misses."""
+    return environment.select_template([
+        f"{project_type}/{base_structure}/{name}",
+        f"{project_type}/{name}",
+        f"{base_structure}/{name}",
+        name
+    ])
+
+def render_template(
+    name: str,
+    config: Any,
+    template_dirs: Sequence[Path] = (),
+    **context: Any
+) -> str:
+    """Render a documentation template for a project.
+
+    The most specific template wins: `<type>/<base_structure>/<name>`, then
+    `<type>/<name>`, `<base_structure>/<name>` and finally `<name>`.
+
+    Args:
+        name: Template name, e.g. "README.md.j2"
+        config: Project configuration exposed to templates as `config`
+        template_dirs: Extra template directories searched first
+        **context: Additional template variables
+
+    Raises:
+        jinja2.TemplateNotFound: If no candidate template exists
+    """
+    environment = get_environment(tuple(str(path) for path in template_dirs))
+    template = _select_template(environment, name, config.type, config.base_structure)
+    return template.render(config=config, **context)
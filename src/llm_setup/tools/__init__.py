@@ -0,0 +1,6 @@
+"""
+Clients for the external tools used by methodology projects.
+
+Tool settings come from the project's `tools_config.json`, written by
+`llm-setup setup`.
+"""
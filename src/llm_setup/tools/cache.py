@@ -0,0 +1,168 @@
+"""
+Persistent response cache for tool clients.
+
+Responses are stored in a single SQLite file so that every process and
+agent sharing the project reuses them. Entries expire after a TTL, and the
+least recently used ones are evicted once the cache holds more than
+`max_entries` entries or `max_bytes` bytes of payload.
+"""
+
+from dataclasses import asdict, dataclass
+from pathlib import Path
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+DEFAULT_TTL = 3600.0
+
+DEFAULT_MAX_ENTRIES = 1000
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+def default_cache_dir() -> Path:
+    """Cache directory, from CACHE_DIR (as in `.env.example`) or `.cache`."""
+    return Path(os.environ.get("CACHE_DIR") or ".cache")
+
+def default_ttl() -> float:
+    """Entry lifetime in seconds, from CACHE_TTL or `DEFAULT_TTL`."""
+    try:
+        return float(os.environ["CACHE_TTL"])
+    except (KeyError, ValueError):
+        return DEFAULT_TTL
+
+def cache_key(namespace: str, request: Dict[str, Any]) -> str:
+    """Stable key for a request: a digest of its canonical JSON form."""
+    canonical = json.dumps(request, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(f"{namespace}\0{canonical}".encode("utf-8")).hexdigest()
+
+@dataclass
+class CacheStats:
+    """Cache counters since the cache was opened."""
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    writes: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Counters plus the hit rate, for reports."""
+        return {**asdict(self), "hit_rate": round(self.hit_rate, 4)}
+
+class ResponseCache:
+    """On-disk JSON response cache with TTL and LRU eviction."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl: Optional[float] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES
+    ):
+        """Open (or create) a cache.
+
+        Args:
+            path: SQLite file (defaults to `responses.sqlite3` in
+                `default_cache_dir()`)
+            ttl: Seconds an entry stays valid (defaults to `default_ttl()`)
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of the stored responses
+        """
+        self.path = path or default_cache_dir() / "responses.sqlite3"
+        self.ttl = default_ttl() if ttl is None else ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+        with self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created REAL NOT NULL,"
+                " accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    def get(self, key: str) -> Optional[Any]:
+        """Cached response for a key, or None if missing or expired."""
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self.stats.expired += 1
+                row = None
+            if row is None:
+                self.stats.misses += 1
+                return None
+            self._db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+            self.stats.hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: str, value: Any) -> None:
+        """Store a response, evicting least recently used entries if needed."""
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        now = time.time()
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (key, data, len(data), now, now)
+            )
+            self.stats.writes += 1
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used ones until the
+        cache is within its bounds."""
+        cursor = self._db.execute(
+            "DELETE FROM entries WHERE created < ?", (time.time() - self.ttl,)
+        )
+        self.stats.evictions += cursor.rowcount
+        count, size = self._db.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        if count <= self.max_entries and size <= self.max_bytes:
+            return
+        evicted = 0
+        for key, entry_size in self._db.execute(
+            "SELECT key, size FROM entries ORDER BY accessed"
+        ).fetchall():
+            if count <= self.max_entries and size <= self.max_bytes:
+                break
+            count -= 1
+            size -= entry_size
+            evicted += 1
+            self._db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self.stats.evictions += evicted
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
@@ -0,0 +1,443 @@
+"""
+Tavily search client with a persistent response cache.
+
+    from cline_llm_methodology.llm_setup.tools import tavily
+
+    results = tavily.search("python async/await tutorial")
+    results = tavily.search("fastapi dependencies", search_type="technical")
+    batch = await tavily.search_many(["asyncio tasks", ("pydantic v2", "technical")])
+
+Search types come from `tavily_ai.search_types` in `tools_config.json`
+and set the depth, result count and content flags of a search; explicit
+arguments override them. The depth names used there map onto Tavily's
+`search_depth`: "basic" stays basic, "detailed" and "comprehensive" use
+the advanced search.
+
+Responses are cached on disk (see `ResponseCache`) under a key made of the
+normalized query and the request parameters, so repeated searches cost no
+network round trip and no quota. The API key is read from TAVILY_API_KEY
+and the endpoint from TAVILY_BASE_URL, which lets tests point the client
+at a local stub server.
+
+`AsyncTavilyClient` runs many searches at once under a concurrency limit,
+retrying rate-limited requests with backoff and sharing one request
+between identical searches in flight.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import asyncio
+import json
+import os
+import random
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from .cache import ResponseCache, cache_key
+from .transport import Transport, TransportConfig, shared_transport
+
+DEFAULT_BASE_URL = "https://api.tavily.com"
+
+DEFAULT_MAX_RESULTS = 5
+
+DEFAULT_TIMEOUT = 30.0
+
+DEPTHS = {
+    "basic": "basic",
+    "detailed": "advanced",
+    "comprehensive": "advanced"
+}
+
+RETRYABLE_ERRORS = {"rate_limit_exceeded", "server_error", "network_error"}
+
+SearchItem = Union[str, Tuple[str, Optional[str]], Dict[str, Any]]
+
+class TavilyAPIError(Exception):
+    """Error returned by the Tavily API.
+
+    `code` is "invalid_api_key", "rate_limit_exceeded", "bad_request",
+    "server_error" or "network_error"; `status` is the HTTP status, if any.
+    """
+
+    def __init__(
+        self,
+        code: str,
+        message: str,
+        status: Optional[int] = None,
+        retry_after: Optional[float] = None
+    ):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+        self.retry_after = retry_after
+
+    @property
+    def retryable(self) -> bool:
+        """Whether the same request may succeed later."""
+        return self.code in RETRYABLE_ERRORS
+
+def _error_code(status: int) -> str:
+    if status in (401, 403):
+        return "invalid_api_key"
+    if status == 429:
+        return "rate_limit_exceeded"
+    if status >= 500:
+        return "server_error"
+    return "bad_request"
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given in seconds."""
+    try:
+        return max(float(value), 0.0) if value else None
+    except ValueError:
+        return None
+
+def normalize_query(query: str) -> str:
+    """Canonical form of a query: case-folded, with whitespace collapsed."""
+    return " ".join(query.casefold().split())
+
+def load_search_types(config_file: Path) -> Dict[str, Dict[str, Any]]:
+    """Read `tavily_ai.search_types` from a tools_config.json file."""
+    with config_file.open() as f:
+        config = json.load(f)
+    return dict(config.get("tavily_ai", {}).get("search_types", {}))
+
+def default_timeout() -> float:
+    """Request timeout in seconds, from TAVILY_TIMEOUT (as in `.env.example`)."""
+    try:
+        return float(os.environ["TAVILY_TIMEOUT"])
+    except (KeyError, ValueError):
+        return DEFAULT_TIMEOUT
+
+class TavilyClient:
+    """Blocking Tavily search client."""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        search_types: Optional[Dict[str, Dict[str, Any]]] = None,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        transport: Optional[Transport] = None
+    ):
+        """Create a client.
+
+        Args:
+            api_key: API key (defaults to TAVILY_API_KEY)
+            search_types: Named search settings, as in tools_config.json
+            cache: Response cache (defaults to one in the cache directory)
+            use_cache: Disable to always query the API
+            base_url: API endpoint (defaults to TAVILY_BASE_URL or the
+                public API)
+            timeout: Request timeout in seconds (defaults to TAVILY_TIMEOUT)
+            transport: HTTP transport (defaults to the shared pooled one)
+        """
+        self.api_key = api_key or os.environ.get("TAVILY_API_KEY", "")
+        self.search_types = dict(search_types or {})
+        self.base_url = (
+            base_url or os.environ.get("TAVILY_BASE_URL") or DEFAULT_BASE_URL
+        ).rstrip("/")
+        self.timeout = timeout or default_timeout()
+        self.transport = transport or shared_transport()
+        if cache is None and use_cache:
+            cache = ResponseCache()
+        self.cache = cache if use_cache else None
+
+    @classmethod
+    def from_config(cls, config_file: Path, **kwargs: Any) -> "TavilyClient":
+        """Create a client using the search types of a tools_config.json
+        file; its "http" section configures the shared transport if that
+        has not been created yet."""
+        if "transport" not in kwargs:
+            kwargs["transport"] = shared_transport(
+                TransportConfig.from_tools_config(config_file)
+            )
+        return cls(search_types=load_search_types(config_file), **kwargs)
+
+    def request_for(
+        self,
+        query: str,
+        search_type: Optional[str] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """Build the API request body for a search, without the API key.
+
+        Raises:
+            ValueError: If the search type is not configured
+        """
+        settings: Dict[str, Any] = {}
+        if search_type is not None:
+            if search_type not in self.search_types:
+                raise ValueError(f"Unknown search type: {search_type}")
+            settings.update(self.search_types[search_type])
+        settings.update({k: v for k, v in options.items() if v is not None})
+
+        depth = settings.get("depth", os.environ.get("TAVILY_SEARCH_DEPTH", "basic"))
+        include_code = settings.get("include_code", False)
+        return {
+            "query": query,
+            "search_depth": DEPTHS.get(depth, depth),
+            "max_results": int(settings.get(
+                "max_results", os.environ.get("TAVILY_MAX_RESULTS", DEFAULT_MAX_RESULTS)
+            )),
+            # Code and examples are only present in the raw page content
+            "include_raw_content": bool(
+                include_code or settings.get("include_examples", False)
+            ),
+            "include_answer": bool(settings.get("include_answer", False))
+        }
+
+    def _post(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a search request to the API."""
+        data = json.dumps({**body, "api_key": self.api_key}).encode("utf-8")
+        try:
+            response = self.transport.request(
+                "POST",
+                f"{self.base_url}/search",
+                body=data,
+                headers={"Content-Type": "application/json"},
+                timeout=self.timeout
+            )
+        except OSError as e:
+            raise TavilyAPIError("network_error", f"Tavily API unreachable: {e}")
+        if response.status >= 400:
+            raise TavilyAPIError(
+                _error_code(response.status),
+                f"Tavily API error {response.status}",
+                response.status,
+                _retry_after(response.headers.get("retry-after"))
+            )
+        return response.json()
+
+    def cache_key(self, body: Dict[str, Any]) -> str:
+        """Cache key of a request body built by `request_for()`.
+
+        Only the key uses the normalized query; the API gets it as given.
+        """
+        normalized = {**body, "query": normalize_query(body["query"])}
+        return cache_key("tavily.search", normalized)
+
+    def search(
+        self,
+        query: str,
+        search_type: Optional[str] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """Search the web, answering from the cache when possible.
+
+        Args:
+            query: Search query
+            search_type: Name of a configured search type
+            **options: Overrides for the search type settings (depth,
+                max_results, include_code, include_examples, include_answer)
+
+        Returns:
+            Decoded Tavily response, with its "results" list
+
+        Raises:
+            TavilyAPIError: If the API call fails
+            ValueError: If the search type is not configured
+        """
+        body = self.request_for(query, search_type, **options)
+        if self.cache is None:
+            return self._post(body)
+
+        key = self.cache_key(body)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        response = self._post(body)
+        self.cache.put(key, response)
+        return response
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters of the response cache."""
+        if self.cache is None:
+            return {}
+        return {**self.cache.stats.to_dict(), "entries": len(self.cache)}
+
+class AsyncTavilyClient:
+    """Asyncio front end for `TavilyClient`.
+
+    Searches run concurrently, at most `max_concurrency` requests at a
+    time. Identical searches in flight at the same time share one request,
+    cached responses never wait for a slot, and rate-limited or failed
+    requests are retried with exponential backoff (honouring Retry-After).
+    """
+
+    def __init__(
+        self,
+        client: Optional[TavilyClient] = None,
+        max_concurrency: int = 8,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        **kwargs: Any
+    ):
+        """Create an async client.
+
+        Args:
+            client: Blocking client providing settings, cache and transport
+                (created from `kwargs` when omitted)
+            max_concurrency: Maximum number of requests in flight
+            max_retries: Retries of a retryable failure before giving up
+            backoff: Delay before the first retry; doubled for each retry
+            max_backoff: Upper bound of a single delay
+        """
+        self.client = client or TavilyClient(**kwargs)
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retries = 0
+        self.coalesced = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight: Dict[str, "asyncio.Future[Dict[str, Any]]"] = {}
+
+    def _delay(self, attempt: int, error: TavilyAPIError) -> float:
+        if error.retry_after is not None:
+            return min(error.retry_after, self.max_backoff)
+        delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+        # Jitter spreads out retries of requests that failed together
+        return delay * random.uniform(0.5, 1.0)
+
+    async def _post(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request within the concurrency limit, retrying failures."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Semaphores belong to the loop that first uses them
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        if self._executor is None:
+            # Blocking requests need a thread each; the default executor
+            # may have fewer threads than the concurrency limit
+            self._executor = ThreadPoolExecutor(
+                self.max_concurrency, thread_name_prefix="tavily"
+            )
+        attempt = 0
+        while True:
+            try:
+                async with self._semaphore:
+                    return await loop.run_in_executor(
+                        self._executor, self.client._post, body
+                    )
+            except TavilyAPIError as e:
+                if not e.retryable or attempt >= self.max_retries:
+                    raise
+                delay = self._delay(attempt, e)
+            attempt += 1
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+    async def _fetch(self, key: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            response = await self._post(body)
+            if self.client.cache is not None:
+                # SQLite may block on a busy database; keep it off the loop
+                await asyncio.get_running_loop().run_in_executor(
+                    None, self.client.cache.put, key, response
+                )
+            return response
+        finally:
+            del self._in_flight[key]
+
+    def close(self) -> None:
+        """Release the request threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def __aenter__(self) -> "AsyncTavilyClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    async def search(
+        self,
+        query: str,
+        search_type: Optional[str] = None,
+        **options: Any
+    ) -> Dict[str, Any]:
+        """Search the web; see `TavilyClient.search()`."""
+        body = self.client.request_for(query, search_type, **options)
+        key = self.client.cache_key(body)
+        task = self._in_flight.get(key)
+        if task is None and self.client.cache is not None:
+            cached = await asyncio.get_running_loop().run_in_executor(
+                None, self.client.cache.get, key
+            )
+            if cached is not None:
+                return cached
+            # The same search may have started while the cache was read
+            task = self._in_flight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        task = self._in_flight[key] = asyncio.ensure_future(self._fetch(key, body))
+        return await asyncio.shield(task)
+
+    async def search_many(
+        self,
+        queries: Iterable[SearchItem],
+        search_type: Optional[str] = None,
+        return_exceptions: bool = False,
+        **options: Any
+    ) -> List[Any]:
+        """Run many searches concurrently.
+
+        Args:
+            queries: Queries, (query, search_type) pairs, or dicts of
+                `search()` arguments
+            search_type: Search type for items that do not name one
+            return_exceptions: Return failures in place of their results
+                instead of raising the first one
+            **options: Overrides applied to every search
+
+        Returns:
+            One response (or exception) per query, in input order
+        """
+        calls = []
+        for item in queries:
+            arguments: Dict[str, Any] = {"search_type": search_type, **options}
+            if isinstance(item, str):
+                arguments["query"] = item
+            elif isinstance(item, dict):
+                arguments.update(item)
+            else:
+                arguments["query"], item_type = item
+                arguments["search_type"] = item_type or search_type
+            calls.append(self.search(**arguments))
+        return await asyncio.gather(*calls, return_exceptions=return_exceptions)
+
+_default_client: Optional[TavilyClient] = None
+
+def default_client() -> TavilyClient:
+    """Shared client, using ./tools_config.json search types if present."""
+    global _default_client
+    if _default_client is None:
+        config_file = Path("tools_config.json")
+        if config_file.exists():
+            _default_client = TavilyClient.from_config(config_file)
+        else:
+            _default_client = TavilyClient()
+    return _default_client
+
+def search(query: str, search_type: Optional[str] = None, **options: Any) -> Dict[str, Any]:
+    """Search with the shared client; see `TavilyClient.search()`."""
+    return default_client().search(query, search_type, **options)
+
+async def search_many(
+    queries: Iterable[SearchItem],
+    search_type: Optional[str] = None,
+    max_concurrency: int = 8,
+    **options: Any
+) -> List[Any]:
+    """Run many searches concurrently with the shared client's settings and
+    cache; see `AsyncTavilyClient.search_many()`."""
+    async with AsyncTavilyClient(default_client(), max_concurrency) as client:
+        return await client.search_many(queries, search_type, **options)
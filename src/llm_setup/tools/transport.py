@@ -0,0 +1,334 @@
+"""
+Shared HTTP transport for tool integrations.
+
+Tool clients send their requests through one process-wide `Transport`
+(see `shared_transport()`), which keeps connections alive between requests
+instead of paying a TCP and TLS handshake for each one:
+
+- connections are pooled per host and reused while the server keeps them
+  open; idle ones are dropped after `keepalive_expiry` seconds
+- at most `max_connections_per_host` requests run against a host at once,
+  further requests wait for a free connection
+- when `httpx` and `h2` are installed, requests use HTTP/2, which
+  multiplexes them over a single connection per host; otherwise the
+  standard library's HTTP/1.1 client is used
+
+Settings come from the "http" section of `tools_config.json`:
+
+    "http": {
+      "max_connections_per_host": 8,
+      "keepalive_expiry": 30,
+      "http2": true,
+      "timeout": 30
+    }
+"""
+
+from collections import deque
+from dataclasses import dataclass, fields
+from pathlib import Path
+import http.client
+import json
+import ssl
+import threading
+import time
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+DEFAULT_TIMEOUT = 30.0
+
+@dataclass(frozen=True)
+class TransportConfig:
+    """Connection pool settings."""
+    max_connections_per_host: int = 8
+    keepalive_expiry: float = 30.0
+    http2: bool = True
+    timeout: float = DEFAULT_TIMEOUT
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> "TransportConfig":
+        """Settings from a tools_config.json "http" section; unknown keys
+        are ignored."""
+        known = {f.name for f in fields(cls)}
+        return cls(**{key: value for key, value in data.items() if key in known})
+
+    @classmethod
+    def from_tools_config(cls, config_file: Path) -> "TransportConfig":
+        """Settings from the "http" section of a tools_config.json file."""
+        with config_file.open() as f:
+            return cls.from_dict(json.load(f).get("http", {}))
+
+@dataclass(frozen=True)
+class Response:
+    """Fully read HTTP response."""
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    http_version: str = "HTTP/1.1"
+
+    def json(self) -> Any:
+        """Decode the body as JSON."""
+        return json.loads(self.body)
+
+@dataclass
+class TransportStats:
+    """Counters for verifying connection reuse."""
+    requests: int = 0
+    connections: int = 0
+    reused: int = 0
+
+Origin = Tuple[str, str, int]
+
+def _origin(url: str) -> Tuple[Origin, str]:
+    """Split a URL into its (scheme, host, port) origin and request target."""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ValueError(f"Unsupported URL: {url}")
+    port = parts.port or (443 if parts.scheme == "https" else 80)
+    target = parts.path or "/"
+    if parts.query:
+        target += f"?{parts.query}"
+    return (parts.scheme, parts.hostname, port), target
+
+# Errors raised when a kept-alive connection was closed by the server
+# before it read the request; the request is safe to send again
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+    http.client.CannotSendRequest
+)
+
+class _PooledBackend:
+    """HTTP/1.1 keep-alive connection pool on `http.client`."""
+
+    http2 = False
+
+    def __init__(self, config: TransportConfig, stats: TransportStats):
+        self.config = config
+        self.stats = stats
+        self._idle: Dict[Origin, Deque[Tuple[float, http.client.HTTPConnection]]] = {}
+        self._lock = threading.Lock()
+        self._ssl: Optional[ssl.SSLContext] = None
+
+    def _connect(self, origin: Origin, timeout: float) -> http.client.HTTPConnection:
+        scheme, host, port = origin
+        with self._lock:
+            self.stats.connections += 1
+        if scheme == "http":
+            return http.client.HTTPConnection(host, port, timeout=timeout)
+        if self._ssl is None:
+            # Building a context loads the CA store; do it once
+            self._ssl = ssl.create_default_context()
+        return http.client.HTTPSConnection(host, port, timeout=timeout, context=self._ssl)
+
+    def _checkout(self, origin: Origin) -> Optional[http.client.HTTPConnection]:
+        """An idle connection to the origin that has not expired, if any."""
+        now = time.monotonic()
+        with self._lock:
+            idle = self._idle.get(origin)
+            while idle:
+                released, connection = idle.pop()
+                if now - released < self.config.keepalive_expiry:
+                    return connection
+                connection.close()
+        return None
+
+    def _checkin(self, origin: Origin, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(origin, deque()).append((time.monotonic(), connection))
+
+    def request(
+        self,
+        method: str,
+        origin: Origin,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Response:
+        connection = self._checkout(origin)
+        reused = connection is not None
+        while True:
+            if connection is None:
+                connection = self._connect(origin, timeout)
+            else:
+                with self._lock:
+                    self.stats.reused += 1
+            connection.timeout = timeout
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            try:
+                connection.request(method, target, body=body, headers=headers)
+                response = connection.getresponse()
+                data = response.read()
+            except _STALE_ERRORS:
+                connection.close()
+                if not reused:
+                    raise
+                with self._lock:
+                    self.stats.reused -= 1
+                connection, reused = None, False
+                continue
+            except BaseException:
+                connection.close()
+                raise
+            break
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._checkin(origin, connection)
+        return Response(
+            response.status,
+            {key.lower(): value for key, value in response.getheaders()},
+            data
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            for idle in self._idle.values():
+                for _, connection in idle:
+                    connection.close()
+            self._idle.clear()
+
+class _HttpxBackend:
+    """HTTP/2 (or HTTP/1.1) pool on `httpx`, used when it is installed."""
+
+    def __init__(self, config: TransportConfig, stats: TransportStats, http2: bool):
+        import httpx
+
+        self.http2 = http2
+        self.stats = stats
+        self._httpx = httpx
+        self._client = httpx.Client(
+            http2=http2,
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=None,
+                max_keepalive_connections=None,
+                keepalive_expiry=config.keepalive_expiry
+            )
+        )
+
+    def request(
+        self,
+        method: str,
+        origin: Origin,
+        target: str,
+        body: Optional[bytes],
+        headers: Dict[str, str],
+        timeout: float
+    ) -> Response:
+        scheme, host, port = origin
+        try:
+            response = self._client.request(
+                method,
+                f"{scheme}://{host}:{port}{target}",
+                content=body,
+                headers=headers,
+                timeout=timeout
+            )
+        except self._httpx.TimeoutException as e:
+            raise TimeoutError(str(e)) from e
+        except self._httpx.TransportError as e:
+            raise ConnectionError(str(e)) from e
+        return Response(
+            response.status_code,
+            {key.lower(): value for key, value in response.headers.items()},
+            response.content,
+            response.http_version
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+def _http2_available() -> bool:
+    """Whether the optional HTTP/2 client (httpx with h2) is installed."""
+    from importlib.util import find_spec
+
+    return find_spec("httpx") is not None and find_spec("h2") is not None
+
+class Transport:
+    """Pooled HTTP client shared by tool integrations."""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self.stats = TransportStats()
+        if self.config.http2 and _http2_available():
+            self._backend: Any = _HttpxBackend(self.config, self.stats, http2=True)
+        else:
+            self._backend = _PooledBackend(self.config, self.stats)
+        self._limits: Dict[Origin, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def http2(self) -> bool:
+        """Whether requests are sent over HTTP/2."""
+        return self._backend.http2
+
+    def _limit(self, origin: Origin) -> threading.BoundedSemaphore:
+        with self._lock:
+            limit = self._limits.get(origin)
+            if limit is None:
+                limit = self._limits[origin] = threading.BoundedSemaphore(
+                    self.config.max_connections_per_host
+                )
+            return limit
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Optional[bytes] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: Optional[float] = None
+    ) -> Response:
+        """Send a request and read the whole response.
+
+        HTTP error statuses are returned, not raised.
+
+        Args:
+            method: HTTP method
+            url: Absolute http or https URL
+            body: Request body
+            headers: Request headers
+            timeout: Seconds to wait for a free connection, to connect and
+                for each read (defaults to the configured timeout)
+
+        Raises:
+            ValueError: If the URL is not an http or https URL
+            TimeoutError: If no connection to the host became free in time
+            OSError: If the request could not be sent or answered
+        """
+        origin, target = _origin(url)
+        timeout = self.config.timeout if timeout is None else timeout
+        limit = self._limit(origin)
+        if not limit.acquire(timeout=timeout):
+            raise TimeoutError(f"No free connection to {origin[1]} within {timeout}s")
+        with self._lock:
+            self.stats.requests += 1
+        try:
+            return self._backend.request(
+                method, origin, target, body, dict(headers or {}), timeout
+            )
+        finally:
+            limit.release()
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        self._backend.close()
+
+_shared: Optional[Transport] = None
+_shared_lock = threading.Lock()
+
+def shared_transport(config: Optional[TransportConfig] = None) -> Transport:
+    """The process-wide transport.
+
+    It is created on first use, with `config` if given; later calls return
+    the same transport and ignore `config`.
+    """
+    global _shared
+    with _shared_lock:
+        if _shared is None:
+            _shared = Transport(config)
+        return _shared
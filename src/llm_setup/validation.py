@@ -0,0 +1,202 @@
+"""
+Project validation engine for Cline LLM Methodology.
+
+Each project tree is scanned once with `os.scandir`, only descending into
+directories that a rule refers to, and every rule is checked against that
+in-memory listing. Many projects are validated in parallel on a process pool.
+"""
+
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+import json
+import os
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Set
+
+from .schema import validate_file
+
+REQUIRED_DIRS = [
+    "docs/methodology",
+    "docs/adr",
+    "src",
+    "tests",
+    "tools"
+]
+
+REQUIRED_DOCS = [
+    "docs/methodology/llm_methodology.md",
+    "docs/methodology/tools_integration.md",
+    "docs/methodology/project_initialization.md"
+]
+
+CONFIG_FILE = "tools_config.json"
+
+CONTEXT_FILE = "docs/methodology/context.yaml"
+
+@dataclass
+class ProjectValidation:
+    """Validation result for a single project root."""
+    root: str
+    missing_dirs: List[str] = field(default_factory=list)
+    missing_docs: List[str] = field(default_factory=list)
+    config_status: str = "valid"
+    config_errors: List[str] = field(default_factory=list)
+    context_errors: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """Whether every rule passed."""
+        return (
+            not self.missing_dirs
+            and not self.missing_docs
+            and self.config_status == "valid"
+            and not self.context_errors
+        )
+
+    def to_dict(self) -> Dict:
+        """Machine-readable representation."""
+        return {**asdict(self), "ok": self.ok}
+
+def _scan_prefixes(paths: Iterable[str]) -> Set[str]:
+    """Directories that must be listed to check the given paths."""
+    prefixes = {""}
+    for path in paths:
+        parts = path.split("/")[:-1]
+        for i in range(1, len(parts) + 1):
+            prefixes.add("/".join(parts[:i]))
+    return prefixes
+
+_PREFIXES = _scan_prefixes(
+    REQUIRED_DIRS + REQUIRED_DOCS + [CONFIG_FILE, CONTEXT_FILE]
+)
+
+def scan_tree(root: Path, prefixes: Set[str] = _PREFIXES) -> Dict[str, bool]:
+    """List a project tree in a single pass.
+
+    Args:
+        root: Project root directory
+        prefixes: Relative directories to descend into ("" is the root)
+
+    Returns:
+        Mapping of relative path to whether the entry is a directory
+    """
+    entries: Dict[str, bool] = {}
+    pending = [""]
+    while pending:
+        relative = pending.pop()
+        try:
+            iterator = os.scandir(root / relative if relative else root)
+        except OSError:
+            continue
+        with iterator:
+            for entry in iterator:
+                path = f"{relative}/{entry.name}" if relative else entry.name
+                is_dir = entry.is_dir()
+                entries[path] = is_dir
+                if is_dir and path in prefixes:
+                    pending.append(path)
+    return entries
+
+def _check_file(path: Path, schema: str) -> List[str]:
+    """Validate a configuration file, returning its errors as text."""
+    try:
+        return [str(violation) for violation in validate_file(path, schema)]
+    except (ValueError, OSError) as e:
+        return [str(e)]
+
+def validate_project(root: Path | str) -> ProjectValidation:
+    """Validate a single project root.
+
+    Args:
+        root: Project root directory
+    """
+    start = time.perf_counter()
+    root = Path(root)
+    result = ProjectValidation(root=str(root))
+    entries = scan_tree(root)
+
+    result.missing_dirs = [path for path in REQUIRED_DIRS if not entries.get(path)]
+    result.missing_docs = [path for path in REQUIRED_DOCS if path not in entries]
+
+    if CONFIG_FILE not in entries:
+        result.config_status = "missing"
+    else:
+        result.config_errors = _check_file(root / CONFIG_FILE, "tools_config")
+        if result.config_errors:
+            result.config_status = "invalid"
+
+    if CONTEXT_FILE in entries:
+        result.context_errors = _check_file(root / CONTEXT_FILE, "context")
+
+    result.duration = time.perf_counter() - start
+    return result
+
+def validate_projects(
+    roots: Sequence[Path | str],
+    workers: Optional[int] = None
+) -> List[ProjectValidation]:
+    """Validate many project roots in parallel.
+
+    Args:
+        roots: Project root directories
+        workers: Number of worker processes (defaults to the CPU count);
+            1 validates in the current process
+
+    Returns:
+        One result per root, in input order
+    """
+    if workers == 1 or len(roots) <= 1:
+        return [validate_project(root) for root in roots]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(roots) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(validate_project, roots, chunksize=chunksize))
+
+def to_json(results: Iterable[ProjectValidation]) -> str:
+    """Format validation results as JSON."""
+    return json.dumps([result.to_dict() for result in results], indent=2)
+
+def _failures(result: ProjectValidation) -> List[str]:
+    """Human-readable list of failed rules."""
+    failures = [f"Missing directory: {path}" for path in result.missing_dirs]
+    failures += [f"Missing documentation: {path}" for path in result.missing_docs]
+    if result.config_status == "missing":
+        failures.append(f"Missing {CONFIG_FILE}")
+    failures += [f"Invalid {CONFIG_FILE}: {error}" for error in result.config_errors]
+    failures += [f"Invalid {CONTEXT_FILE}: {error}" for error in result.context_errors]
+    return failures
+
+def to_junit(results: Iterable[ProjectValidation]) -> str:
+    """Format validation results as a JUnit XML report.
+
+    Each project root becomes one test case.
+    """
+    from xml.etree import ElementTree
+
+    results = list(results)
+    suite = ElementTree.Element(
+        "testsuite",
+        name="llm-setup validate",
+        tests=str(len(results)),
+        failures=str(sum(1 for result in results if not result.ok)),
+        time=f"{sum(result.duration for result in results):.6f}"
+    )
+    for result in results:
+        case = ElementTree.SubElement(
+            suite,
+            "testcase",
+            classname="llm_setup.validate",
+            name=result.root,
+            time=f"{result.duration:.6f}"
+        )
+        failures = _failures(result)
+        if failures:
+            failure = ElementTree.SubElement(
+                case, "failure", message=f"{len(failures)} rule(s) failed"
+            )
+            failure.text = "\n".join(failures)
+    return ElementTree.tostring(suite, encoding="unicode", xml_declaration=True)
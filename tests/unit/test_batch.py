@@ -0,0 +1,76 @@
+"""
+Unit tests for batch project setup.
+"""
+
+from pathlib import Path
+import json
+from cline_llm_methodology.llm_setup.setup import ProjectConfig
+from cline_llm_methodology.llm_setup.batch import load_records, run_batch
+
+def make_config(name: str, path: Path) -> ProjectConfig:
+    """Build a minimal project configuration."""
+    return ProjectConfig(
+        name=name,
+        type="api",
+        technologies=["python"],
+        base_structure="standard",
+        documentation_path=path
+    )
+
+def test_load_records_from_jsonl(tmp_path, config_data):
+    """Test loading batch records from a JSONL file."""
+    source = tmp_path / "projects.jsonl"
+    source.write_text(
+        json.dumps(config_data) + "\n\n" + json.dumps({"name": "other"}) + "\n"
+    )
+
+    records = load_records(source)
+    assert [origin for origin, _, _ in records] == ["projects.jsonl:1", "projects.jsonl:3"]
+    assert records[0][1:] == (config_data, None)
+    assert records[1][1:] == ({"name": "other"}, None)
+
+def test_load_records_reports_bad_records(tmp_path, config_data):
+    """Test that invalid and non-object records are returned as errors."""
+    source = tmp_path / "projects.jsonl"
+    source.write_text("{bad\n[1, 2]\n" + json.dumps(config_data) + "\n")
+
+    records = load_records(source)
+    assert [record for _, record, _ in records] == [None, None, config_data]
+    assert records[0][2].startswith("Invalid JSON")
+    assert records[1][2] == "Record must be a JSON object, not list"
+
+def test_load_records_from_directory(tmp_path, config_data):
+    """Test loading batch records from a directory of JSON files."""
+    source = tmp_path / "configs"
+    source.mkdir()
+    (source / "b.json").write_text(json.dumps({**config_data, "name": "b"}))
+    (source / "a.json").write_text(json.dumps({**config_data, "name": "a"}))
+    (source / "notes.txt").write_text("ignored")
+
+    records = load_records(source)
+    assert [record["name"] for _, record, _ in records] == ["a", "b"]
+
+def test_run_batch_creates_all_projects(tmp_path):
+    """Test that every project in a batch is set up."""
+    configs = [make_config(f"svc-{i}", tmp_path / f"svc-{i}") for i in range(5)]
+
+    results = run_batch(configs, workers=3)
+    assert [result.name for result in results] == [c.name for c in configs]
+    assert all(result.ok for result in results)
+    for config in configs:
+        assert (config.documentation_path / "tools_config.json").exists()
+
+def test_run_batch_continues_after_failure(tmp_path):
+    """Test that a failing project does not stop the batch."""
+    blocker = tmp_path / "blocked"
+    blocker.write_text("not a directory")
+    configs = [
+        make_config("broken", blocker),
+        make_config("fine", tmp_path / "fine")
+    ]
+
+    results = run_batch(configs, workers=2)
+    assert not results[0].ok
+    assert results[0].error
+    assert results[1].ok
+    assert (tmp_path / "fine/docs/methodology/llm_methodology.md").exists()
@@ -83,7 +83,7 @@ def test_validate_command_invalid_project(runner, tmp_path):
     (tmp_path / "src").mkdir()
     
     result = runner.invoke(validate, [str(tmp_path)])
-    assert result.exit_code == 0  # Command succeeds but reports issues
+    assert result.exit_code == 1  # Issues are reported and fail the command
     assert "❌ Missing required directories" in result.output
     assert "❌ Missing required documentation" in result.output
     assert "❌ Missing tools_config.json" in result.output
@@ -165,4 +165,165 @@ def test_cli_help(runner):
     for cmd in ["setup", "validate", "init"]:
         result = runner.invoke(cli, [cmd, "--help"])
         assert result.exit_code == 0
-        assert cmd in result.output
\ No newline at end of file
+        assert cmd in result.output
+
+def test_setup_many_command(runner, tmp_path):
+    """Test batch setup command with a JSONL source."""
+    records = [
+        {"name": "svc-a", "type": "api", "technologies": ["python"], "base_structure": "standard"},
+        {"name": "svc-b", "type": "cli", "technologies": ["python"], "base_structure": "minimal"}
+    ]
+    source = tmp_path / "projects.jsonl"
+    source.write_text("\n".join(json.dumps(record) for record in records))
+
+    result = runner.invoke(
+        cli, ["setup-many", str(source), "-o", str(tmp_path / "out"), "-w", "2"]
+    )
+    assert result.exit_code == 0
+    assert "2 succeeded, 0 failed" in result.output
+    assert (tmp_path / "out/svc-a/tools_config.json").exists()
+    assert (tmp_path / "out/svc-b/tools_config.json").exists()
+
+def test_setup_many_reports_invalid_records(runner, tmp_path):
+    """Test batch setup keeps going past invalid records."""
+    source = tmp_path / "projects.jsonl"
+    source.write_text("\n".join([
+        json.dumps({"name": "broken"}),
+        json.dumps({"name": "svc", "type": "api", "technologies": ["python"], "base_structure": "standard"})
+    ]))
+
+    result = runner.invoke(cli, ["setup-many", str(source), "-o", str(tmp_path / "out")])
+    assert result.exit_code != 0
+    assert "Missing required fields" in result.output
+    assert "1 succeeded, 1 failed" in result.output
+    assert (tmp_path / "out/svc/tools_config.json").exists()
+
+def test_setup_many_reports_unparsable_records(runner, tmp_path):
+    """Test batch setup keeps going past bad JSON and non-object records."""
+    source = tmp_path / "projects.jsonl"
+    source.write_text("\n".join([
+        "{bad",
+        "[1, 2]",
+        json.dumps({"name": "svc", "type": "api", "technologies": ["python"], "base_structure": "standard"})
+    ]))
+
+    result = runner.invoke(cli, ["setup-many", str(source), "-o", str(tmp_path / "out")])
+    assert result.exit_code != 0
+    assert "projects.jsonl:1: Invalid JSON" in result.output
+    assert "projects.jsonl:2: Record must be a JSON object" in result.output
+    assert "1 succeeded, 2 failed" in result.output
+    assert (tmp_path / "out/svc/tools_config.json").exists()
+
+def test_setup_command_dry_run(runner, test_config, tmp_path):
+    """Test setup dry run leaves the output directory untouched."""
+    output = tmp_path / "project"
+    result = runner.invoke(setup, [str(test_config), "-o", str(output), "--dry-run"])
+    assert result.exit_code == 0
+    assert "+++ b/tools_config.json" in result.output
+    assert not output.exists()
+
+def test_validate_command_many_projects_json(runner, test_config, tmp_path):
+    """Test validating several projects with JSON output."""
+    valid = tmp_path / "valid"
+    result = runner.invoke(setup, [str(test_config), "-o", str(valid)])
+    assert result.exit_code == 0
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    
+    result = runner.invoke(validate, [str(valid), str(broken), "--format", "json"])
+    assert result.exit_code == 1
+    report = json.loads(result.output)
+    assert [entry["ok"] for entry in report] == [True, False]
+    
+    result = runner.invoke(validate, [str(valid), "--format", "junit"])
+    assert result.exit_code == 0
+
+def test_check_config_command(runner, tmp_path):
+    """Test checking configuration files against their schema."""
+    valid = tmp_path / "valid/tools_config.json"
+    valid.parent.mkdir()
+    valid.write_text(json.dumps({"mcp_tools": {"enabled": True}}))
+    invalid = tmp_path / "tools_config.json"
+    invalid.write_text(json.dumps({"mcp_tools": {"enabled": "yes"}}))
+    
+    result = runner.invoke(cli, ["check-config", str(valid)])
+    assert result.exit_code == 0
+    
+    result = runner.invoke(cli, ["check-config", str(valid), str(invalid)])
+    assert result.exit_code != 0
+    assert "Field 'mcp_tools.enabled' must be a boolean" in result.output
+
+def test_migrate_command(runner, tmp_path):
+    """Test migrating a tree with a mapping file."""
+    source = tmp_path / "legacy"
+    (source / "docs/notes").mkdir(parents=True)
+    (source / "docs/notes/a.md").write_text("# A\n")
+    (source / "docs/notes/b.txt").write_text("B\n")
+    mapping = tmp_path / "mapping.yaml"
+    mapping.write_text(
+        "rules:\n"
+        "  - source: docs/**/*.md\n"
+        "    target: handbook\n"
+    )
+    target = tmp_path / "new"
+    
+    result = runner.invoke(cli, ["migrate", str(source), str(target), "-m", str(mapping)])
+    assert result.exit_code == 0
+    assert "Migrated" in result.output
+    assert (target / "handbook/notes/a.md").exists()
+    assert not (target / "handbook/notes/b.txt").exists()
+    
+    result = runner.invoke(cli, ["migrate", str(tmp_path / "missing"), str(target)])
+    assert result.exit_code != 0
+
+def test_setup_command_timings_and_profile(runner, test_config, tmp_path):
+    """Test per-step timings and the cProfile dump."""
+    import pstats
+    
+    profile = tmp_path / "setup.pstats"
+    result = runner.invoke(cli, [
+        "setup", str(test_config), "-o", str(tmp_path / "project"),
+        "--timings", "--profile", str(profile)
+    ])
+    assert result.exit_code == 0
+    assert "Step timings" in result.output
+    assert "peak Python memory" in result.output
+    # Steps run on worker threads, which the profile must cover too
+    stats = pstats.Stats(str(profile))
+    assert any(func[2] == "_render" for func in stats.stats)
+
+def test_search_command(runner, tmp_path):
+    """Test searching project documentation."""
+    (tmp_path / "docs/adr").mkdir(parents=True)
+    (tmp_path / "docs/adr/001.md").write_text("# Transport\n\nPool keep-alive connections.\n")
+    
+    result = runner.invoke(cli, ["search", "keep-alive pool", "-p", str(tmp_path)])
+    assert result.exit_code == 0
+    assert "docs/adr/001.md:1  Transport" in result.output
+    
+    result = runner.invoke(
+        cli, ["search", "keep-alive", "-p", str(tmp_path), "--format", "json"]
+    )
+    assert json.loads(result.output)[0]["heading"] == "Transport"
+    
+    result = runner.invoke(cli, ["search", "missing", "-p", str(tmp_path)])
+    assert "No matching documentation" in result.output
+
+def test_context_command(runner, test_config, tmp_path):
+    """Test packing a resume prompt for a generated project."""
+    project = tmp_path / "test-project"
+    result = runner.invoke(cli, ["setup", str(test_config), "-o", str(project)])
+    assert result.exit_code == 0
+    
+    result = runner.invoke(cli, ["context", "-p", str(project), "-b", "200"])
+    assert result.exit_code == 0
+    assert result.output.startswith("# Project context")
+    
+    output = tmp_path / "resume.md"
+    result = runner.invoke(cli, ["context", "-p", str(project), "-o", str(output)])
+    assert result.exit_code == 0
+    assert "Packed" in result.output
+    assert output.read_text().startswith("# Project context")
+    
+    result = runner.invoke(cli, ["context", "-p", str(project), "-b", "200", "--report"])
+    assert json.loads(result.output)["tokens"] <= 200
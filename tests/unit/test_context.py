@@ -0,0 +1,91 @@
+"""
+Unit tests for the resume context packer.
+"""
+
+import pytest
+import os
+import time
+from cline_llm_methodology.llm_setup.context import (
+    TOKEN_CACHE_FILE,
+    TokenCache,
+    default_query,
+    estimate_tokens,
+    pack_context,
+)
+from cline_llm_methodology.llm_setup.setup import ProjectConfig, LLMMethodologySetup
+
+DAY = 86400
+
+@pytest.fixture
+def project(tmp_path):
+    """Generated project with an old and a recent ADR."""
+    config = ProjectConfig(
+        name="billing",
+        type="api",
+        technologies=["python", "fastapi"],
+        base_structure="standard",
+        documentation_path=tmp_path / "billing"
+    )
+    LLMMethodologySetup(config).run()
+    root = tmp_path / "billing"
+    now = time.time()
+    for number, topic, age in [(1, "Queue retries", 90), (2, "Invoice storage", 1)]:
+        adr = root / f"docs/adr/{number:03d}.md"
+        adr.write_text(f"# ADR {number:03d}\n\n## Decision\n\n{topic} " + "detail " * 40 + "\n")
+        os.utime(adr, (now - age * DAY, now - age * DAY))
+    return root
+
+def test_estimate_tokens():
+    """Test the token estimate for words and punctuation."""
+    assert estimate_tokens("") == 0
+    assert estimate_tokens("cache, keyed") == 3
+    assert estimate_tokens("internationalization") == 4
+
+def test_pack_respects_budget_and_ranks(project):
+    """Test budgeted packing ordered by relevance and recency."""
+    packed = pack_context(project, budget=300, query="invoice storage")
+
+    assert packed.tokens <= 300
+    assert packed.prompt.startswith("# Project context")
+    assert "- Project: billing (api)" in packed.prompt
+    assert packed.sections[0].path == "docs/adr/002.md"
+    assert packed.skipped > 0
+
+    # Without a query, the recent ADR still outranks the old one
+    packed = pack_context(project, budget=100000)
+    paths = [section.path for section in packed.sections]
+    assert paths.index("docs/adr/002.md") < paths.index("docs/adr/001.md")
+    assert packed.query == default_query({
+        "project": {"name": "billing", "type": "api", "technologies": ["python", "fastapi"]},
+        "state": {"phase": "initialization", "mode": "architect"}
+    })
+
+    with pytest.raises(ValueError, match="budget"):
+        pack_context(project, budget=0)
+
+def test_pack_truncates_state_to_budget(project, caplog):
+    """Test that the project state never exceeds a tiny budget."""
+    packed = pack_context(project, budget=8)
+    assert packed.tokens <= 8
+    assert packed.prompt.startswith("# Project context")
+    assert "- Project" not in packed.prompt
+    assert "truncated" in caplog.text
+
+    packed = pack_context(project, budget=1)
+    assert packed.tokens <= 1
+    assert "# Project context" not in packed.prompt
+    assert "skipped" in caplog.text
+
+def test_token_counts_are_cached(project):
+    """Test that unchanged sections reuse their cached token counts."""
+    first = pack_context(project, budget=100000)
+    assert first.cache_misses > 0
+    assert (project / TOKEN_CACHE_FILE).exists()
+
+    second = pack_context(project, budget=100000)
+    assert second.cache_misses == 0
+    assert second.prompt == first.prompt
+
+    cache = TokenCache(project / TOKEN_CACHE_FILE)
+    assert cache.count("new text") == 2
+    assert (cache.hits, cache.misses) == (0, 1)
@@ -0,0 +1,87 @@
+"""
+Unit tests for structured run events.
+"""
+
+import pytest
+import io
+import json
+from cline_llm_methodology.llm_setup.events import EventStream, NULL_EVENTS, run_events
+from cline_llm_methodology.llm_setup.migration import MigrationConfig, MigrationTool
+from cline_llm_methodology.llm_setup.setup import ProjectConfig, LLMMethodologySetup
+
+def read_events(sink: io.StringIO):
+    return [json.loads(line) for line in sink.getvalue().splitlines()]
+
+def test_events_are_json_lines():
+    """Test event records and step timing."""
+    sink = io.StringIO()
+    stream = EventStream(sink)
+    with stream.step("copy") as result:
+        result.update(files=2, bytes=10)
+    with pytest.raises(RuntimeError):
+        with stream.step("fail"):
+            raise RuntimeError("boom")
+
+    events = read_events(sink)
+    assert [e["event"] for e in events] == ["step_start", "step_end"] * 2
+    assert {e["run"] for e in events} == {stream.run_id}
+    assert events[1]["ok"] and events[1]["files"] == 2 and events[1]["bytes"] == 10
+    assert events[1]["duration"] >= 0
+    assert not events[3]["ok"] and events[3]["error"] == "boom"
+
+def test_disabled_stream_emits_nothing():
+    """Test that a stream without consumers does no work."""
+    assert not NULL_EVENTS.enabled
+    with NULL_EVENTS.step("step") as result:
+        result["files"] = 1
+    NULL_EVENTS.emit("progress", files=1)
+
+    seen = []
+    stream = EventStream()
+    stream.subscribe(seen.append)
+    assert stream.enabled
+    stream.emit("progress", files=1)
+    assert seen[0]["files"] == 1
+
+def test_setup_run_events(tmp_path):
+    """Test the events of a project setup."""
+    sink = io.StringIO()
+    config = ProjectConfig(
+        name="test-project",
+        type="api",
+        technologies=["python"],
+        base_structure="standard",
+        documentation_path=tmp_path / "project"
+    )
+    LLMMethodologySetup(config, events=EventStream(sink)).run()
+
+    events = read_events(sink)
+    assert events[0]["event"] == "run_start" and events[0]["kind"] == "setup"
+    assert events[-1]["event"] == "run_end" and events[-1]["ok"]
+    steps = {e["step"]: e for e in events if e["event"] == "step_end"}
+    assert steps["tools"]["ok"]
+    assert steps["tools"]["files"] == 1 and steps["tools"]["bytes"] > 0
+
+def test_migration_run_events(tmp_path):
+    """Test the events of a migration, written to a file."""
+    source = tmp_path / "legacy"
+    for path in ["pyproject.toml", "src/main.py", "tests/unit/test_main.py"]:
+        (source / path).parent.mkdir(parents=True, exist_ok=True)
+        (source / path).write_text("[tool.poetry.dependencies]\n" if path.endswith(".toml") else "")
+    events_file = tmp_path / "events.jsonl"
+
+    with run_events(str(events_file)) as events:
+        tool = MigrationTool(MigrationConfig(source, tmp_path / "new"), events=events)
+        assert tool.run()
+
+    events = [json.loads(line) for line in events_file.read_text().splitlines()]
+    assert events[-1]["event"] == "run_end" and events[-1]["ok"]
+    progress = [e for e in events if e["event"] == "progress"]
+    assert progress[-1]["files"] == progress[-1]["total_files"] == 2
+    copied = next(e for e in events if e.get("step") == "migrate_files" and e["event"] == "step_end")
+    assert copied["files"] == 2
+    # pyproject.toml is written by the dependency merge
+    merged = next(
+        e for e in events if e.get("step") == "update_dependencies" and e["event"] == "step_end"
+    )
+    assert merged["files"] == 1
@@ -0,0 +1,125 @@
+"""
+Unit tests for declarative migration mappings.
+"""
+
+import pytest
+from pathlib import Path
+from cline_llm_methodology.llm_setup.mapping import (
+    Mapping,
+    glob_to_regex,
+    load_mapping,
+)
+
+@pytest.fixture
+def mapping():
+    """Mapping exercising globs, renames and filters."""
+    return Mapping.from_dict({
+        "rules": [
+            {"source": "docs/prompt_llm/**", "target": "docs/methodology"},
+            {"source": "docs/**/*.md", "target": "handbook"},
+            {"source": "tests/{unit,xml}/**", "target": "tests"},
+            {"source": "pyproject.toml", "target": "pyproject.toml"}
+        ],
+        "rename": [{"pattern": r"\.markdown$", "replace": ".md"}],
+        "exclude": ["__pycache__", "*.pyc", "tests/xml/private"]
+    })
+
+def test_glob_to_regex():
+    """Test glob translation."""
+    import re
+
+    assert re.fullmatch(glob_to_regex("a/**/b.md"), "a/b.md")
+    assert re.fullmatch(glob_to_regex("a/**/b.md"), "a/x/y/b.md")
+    assert not re.fullmatch(glob_to_regex("a/*.md"), "a/x/b.md")
+    assert re.fullmatch(glob_to_regex("f?le.[!x]y"), "file.zy")
+    assert re.fullmatch(glob_to_regex("{a,b}/*"), "b/c")
+
+def test_first_matching_rule_wins(mapping):
+    """Test rule order and prefix-relative targets."""
+    assert mapping.match("docs/prompt_llm/guide.md") == (0, "docs/methodology/guide.md")
+    assert mapping.match("docs/adr/0001.md") == (1, "handbook/adr/0001.md")
+    assert mapping.match("tests/unit/test_a.py") == (2, "tests/unit/test_a.py")
+    assert mapping.match("pyproject.toml") == (3, "pyproject.toml")
+    assert mapping.match("docs/adr/diagram.png") is None
+    assert mapping.match("tests/integration/test_b.py") is None
+
+def test_rename_and_exclude(mapping):
+    """Test rename rules and exclude filters."""
+    assert mapping.match("docs/prompt_llm/notes.markdown") == (
+        0, "docs/methodology/notes.md"
+    )
+    assert mapping.match("tests/unit/__pycache__/test_a.cpython-311.pyc") is None
+    assert mapping.match("tests/unit/module.pyc") is None
+    assert mapping.match("tests/xml/private/payload.xml") is None
+
+def test_include_filter():
+    """Test that include patterns restrict migrated files."""
+    mapping = Mapping.from_dict({
+        "rules": [{"source": "**", "target": ""}],
+        "include": ["src", "*.toml"]
+    })
+    assert mapping.match("src/pkg/a.py") == (0, "src/pkg/a.py")
+    assert mapping.match("pyproject.toml") == (0, "pyproject.toml")
+    assert mapping.match("docs/index.md") is None
+
+def test_walk_skips_unreachable_directories(mapping, tmp_path, monkeypatch):
+    """Test that only directories some rule can reach are listed."""
+    for path in [
+        "docs/prompt_llm/guide.md",
+        "docs/adr/0001.md",
+        "tests/unit/test_a.py",
+        "tests/integration/test_b.py",
+        "tests/xml/private/payload.xml",
+        "node_modules/pkg/index.js",
+        "pyproject.toml"
+    ]:
+        (tmp_path / path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / path).write_text(path)
+
+    import os
+
+    listed = []
+    scandir = os.scandir
+
+    def recording_scandir(path):
+        listed.append(Path(path).relative_to(tmp_path).as_posix())
+        return scandir(path)
+
+    monkeypatch.setattr(os, "scandir", recording_scandir)
+    targets = sorted(target for _, target, _, _ in mapping.walk(tmp_path))
+
+    assert targets == [
+        "docs/methodology/guide.md",
+        "handbook/adr/0001.md",
+        "pyproject.toml",
+        "tests/unit/test_a.py"
+    ]
+    assert "node_modules" not in listed
+    assert "tests/integration" not in listed
+    assert "tests/xml/private" not in listed
+
+def test_default_mapping():
+    """Test the built-in API-H2H layout."""
+    mapping = load_mapping()
+
+    assert mapping.match("docs/prompt_llm/llm.md")[1] == "docs/methodology/llm.md"
+    assert mapping.match("tests/xml/payload.xml")[1] == "tests/xml/payload.xml"
+    assert mapping.match("src/api/main.py")[1] == "src/api/main.py"
+    assert mapping.match(".gitignore")[1] == ".gitignore"
+    assert mapping.match("scripts/deploy.sh") is None
+    assert mapping.required == ["pyproject.toml", "src", "tests"]
+
+def test_load_mapping_file(tmp_path):
+    """Test loading YAML and JSON mapping files."""
+    yaml_file = tmp_path / "mapping.yaml"
+    yaml_file.write_text("rules:\n  - source: src/**\n    target: lib\n")
+    assert load_mapping(yaml_file).match("src/a.py") == (0, "lib/a.py")
+
+    json_file = tmp_path / "mapping.json"
+    json_file.write_text('{"rules": [{"source": "src"}]}')
+    with pytest.raises(ValueError, match="Invalid mapping rule"):
+        load_mapping(json_file)
+
+    json_file.write_text('{"rules": {}}')
+    with pytest.raises(ValueError, match="list of rules"):
+        load_mapping(json_file)
@@ -0,0 +1,365 @@
+"""
+Unit tests for project migration.
+"""
+
+import pytest
+from pathlib import Path
+import json
+import os
+import tomllib
+from cline_llm_methodology.llm_setup import migration
+from cline_llm_methodology.llm_setup.mapping import Mapping
+from cline_llm_methodology.llm_setup.migration import (
+    FastCopier,
+    MigrationConfig,
+    MigrationJournal,
+    MigrationTool,
+    NEW_DEPENDENCIES,
+    copy_file,
+    hash_file,
+    merge_dependencies,
+    migrate_many,
+)
+from cline_llm_methodology.llm_setup.setup import LLMMethodologySetup, ProjectConfig
+from cline_llm_methodology.llm_setup.validation import validate_project
+
+LEGACY_FILES = {
+    "pyproject.toml": '[tool.poetry]\nname = "legacy"\n\n'
+                      '[tool.poetry.dependencies]\npython = "^3.11"\n',
+    "src/api/main.py": "print('api')\n",
+    "tests/unit/test_main.py": "def test_main(): pass\n",
+    "tests/xml/a.xml": "<payload/>\n" * 100,
+    "tests/xml/b.xml": "<payload/>\n" * 100,
+    "docs/prompt_llm/prompt.md": "# Prompt\n",
+    "docs/adr/0001.md": "# ADR\n",
+    "scripts/deploy.sh": "exit 0\n"
+}
+
+@pytest.fixture
+def legacy_dir(tmp_path):
+    """Legacy API-H2H project tree."""
+    root = tmp_path / "legacy"
+    for path, content in LEGACY_FILES.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(content)
+    return root
+
+def migrate(source: Path, target: Path, resume: bool = False, **options) -> MigrationTool:
+    tool = MigrationTool(MigrationConfig(source, target), **options)
+    assert tool.run(resume=resume), tool.errors
+    return tool
+
+def test_migration_follows_default_mapping(legacy_dir, tmp_path):
+    """Test a full migration with the built-in mapping."""
+    target = tmp_path / "new"
+    tool = migrate(legacy_dir, target)
+
+    assert (target / "docs/methodology/prompt.md").read_text() == "# Prompt\n"
+    assert (target / "docs/adr/0001.md").exists()
+    assert (target / "src/api/main.py").exists()
+    assert (target / "tests/xml/a.xml").exists()
+    assert not (target / "scripts").exists()
+    assert tool.copy_stats.files == 7
+
+    dependencies = tomllib.loads((target / "pyproject.toml").read_text())
+    assert set(NEW_DEPENDENCIES) <= set(dependencies["tool"]["poetry"]["dependencies"])
+
+    report = json.loads((target / "migration_report.json").read_text())
+    assert report["success"]
+    assert report["copied_files"] == 7
+
+def test_resume_skips_completed_work(legacy_dir, tmp_path):
+    """Test that a resumed migration skips journaled steps and files."""
+    target = tmp_path / "new"
+    migrate(legacy_dir, target)
+    journal = target / MigrationJournal.FILE_NAME
+    lines = journal.read_text().splitlines()
+    # Simulate a crash while copying: keep the first steps and three files,
+    # with a truncated last line
+    kept = [line for line in lines if '"step"' in line][:2]
+    kept += [
+        line for line in lines
+        if '"file"' in line and "pyproject.toml" not in line
+    ][:3]
+    journal.write_text("\n".join(kept) + '\n{"type": "fi')
+
+    tool = migrate(legacy_dir, target, resume=True)
+    # The three journaled files, and pyproject.toml, whose merge is current
+    assert tool.copy_stats.skipped == 4
+    assert tool.copy_stats.files == 3
+
+def test_copy_falls_back_without_zero_copy(tmp_path, monkeypatch):
+    """Test the fallbacks from copy_file_range to sendfile to a plain copy."""
+    source = tmp_path / "source.bin"
+    source.write_bytes(os.urandom(300_000))
+    used = []
+
+    def unsupported(name):
+        def primitive(*args):
+            used.append(name)
+            raise OSError(18, "Invalid cross-device link")
+        return primitive
+
+    def sendfile(dst_fd, src_fd, offset, count):
+        used.append("sendfile")
+        data = os.pread(src_fd, min(count, 65536), offset)
+        return os.pwrite(dst_fd, data, offset)
+
+    monkeypatch.setattr(os, "copy_file_range", unsupported("copy_file_range"), raising=False)
+    monkeypatch.setattr(os, "sendfile", sendfile, raising=False)
+    copy_file(source, tmp_path / "a.bin", source.stat().st_size)
+    assert used[0] == "copy_file_range" and used[-1] == "sendfile"
+    assert (tmp_path / "a.bin").read_bytes() == source.read_bytes()
+
+    used.clear()
+    monkeypatch.delattr(os, "copy_file_range", raising=False)
+    monkeypatch.setattr(os, "sendfile", unsupported("sendfile"), raising=False)
+    digest = copy_file(source, tmp_path / "b.bin", source.stat().st_size)
+    assert used == ["sendfile"]
+    assert digest is None
+    assert (tmp_path / "b.bin").read_bytes() == source.read_bytes()
+    assert (tmp_path / "b.bin").stat().st_mtime_ns == source.stat().st_mtime_ns
+
+    # Hashing reads the content once in user space
+    used.clear()
+    assert copy_file(source, tmp_path / "c.bin", 0, with_hash=True) == hash_file(source)
+    assert not used
+
+def test_zero_copy_error_after_partial_copy_is_raised(tmp_path, monkeypatch):
+    """Test that a failure midway is not hidden by a fallback."""
+    source = tmp_path / "source.bin"
+    source.write_bytes(b"x" * 1000)
+    calls = []
+
+    def copy_file_range(src_fd, dst_fd, count, offset_src, offset_dst):
+        calls.append(count)
+        if len(calls) > 1:
+            raise OSError(5, "Input/output error")
+        return os.pwrite(dst_fd, os.pread(src_fd, 100, offset_src), offset_dst)
+
+    monkeypatch.setattr(os, "copy_file_range", copy_file_range, raising=False)
+    with pytest.raises(OSError, match="Input/output"):
+        copy_file(source, tmp_path / "target.bin", 1000)
+
+def test_dedup_falls_back_to_copy_without_links(tmp_path, monkeypatch):
+    """Test that duplicates are copied when no link type is available."""
+    source = tmp_path / "source"
+    source.mkdir()
+    for name in ("a", "b", "c"):
+        (source / name).write_text("same content\n")
+    monkeypatch.setattr(migration, "_reflink", lambda original, target: False)
+
+    def read_again(path):
+        raise AssertionError(f"{path} read twice")
+
+    # The digest comes from the copy itself
+    monkeypatch.setattr(migration, "hash_file", read_again)
+
+    stats = FastCopier(workers=2, dedup="reflink").copy_tree(source, tmp_path / "copy")
+    assert (stats.files, stats.linked) == (3, 0)
+    assert (tmp_path / "copy/c").read_text() == "same content\n"
+
+    stats = FastCopier(workers=2, dedup="auto").copy_tree(source, tmp_path / "linked")
+    assert (stats.files, stats.linked) == (3, 2)
+    assert os.stat(tmp_path / "linked/a").st_nlink == 3
+
+def test_journal_resumes_after_interruption(tmp_path):
+    """Test reloading a journal whose last write was cut short."""
+    target = tmp_path / "target.txt"
+    target.write_text("copied\n")
+    stat = target.stat()
+    path = tmp_path / MigrationJournal.FILE_NAME
+
+    journal = MigrationJournal(path)
+    journal.step_done("validate_source")
+    journal.file_done("target.txt", stat, hash_file(target))
+    journal.close()
+    with open(path, "a") as f:
+        f.write('{"type": "file", "path": "other.txt", "si')
+
+    journal = MigrationJournal(path, resume=True)
+    assert journal.steps == {"validate_source"}
+    assert set(journal.files) == {"target.txt"}
+    assert journal.is_copied("target.txt", stat, target, verify=True)
+    assert not journal.is_copied("other.txt", stat, target)
+
+    # A copy damaged after it was journaled is only caught with verify
+    target.write_text("damaged")
+    os.utime(target, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert journal.is_copied("target.txt", stat, target)
+    assert not journal.is_copied("target.txt", stat, target, verify=True)
+    journal.close()
+
+    # Starting over without resume discards the journal
+    assert not MigrationJournal(path).files
+
+def test_copier_delta_counts(tmp_path):
+    """Test added, updated, unchanged and deleted counts of a tree sync."""
+    source = tmp_path / "source"
+    (source / "sub").mkdir(parents=True)
+    for name in ("a", "b", "sub/c", "sub/d"):
+        (source / name).write_text(name)
+    target = tmp_path / "target"
+    FastCopier().copy_tree(source, target)
+
+    (source / "a").write_text("changed")
+    (source / "sub/d").unlink()
+    (source / "e").write_text("e")
+    (target / "stray").write_text("stray")
+
+    stats = FastCopier(delete=True).copy_tree(source, target)
+    assert stats.delta() == {"added": 1, "updated": 1, "unchanged": 2, "deleted": 2}
+    assert not (target / "sub/d").exists() and not (target / "stray").exists()
+
+    stats = FastCopier(incremental=True).copy_tree(source, target)
+    assert stats.delta() == {"added": 0, "updated": 0, "unchanged": 4, "deleted": 0}
+
+def test_incremental_copies_only_changes(legacy_dir, tmp_path):
+    """Test incremental sync with deletion of removed files."""
+    target = tmp_path / "new"
+    migrate(legacy_dir, target)
+    (legacy_dir / "src/api/main.py").write_text("print('v2')\n")
+    (legacy_dir / "tests/unit/test_main.py").unlink()
+    (legacy_dir / "docs/adr/0002.md").write_text("# ADR 2\n")
+
+    tool = migrate(legacy_dir, target, incremental=True, delete=True)
+    assert tool.copy_stats.delta() == {
+        "added": 1, "updated": 1, "unchanged": 5, "deleted": 1
+    }
+    assert (target / "src/api/main.py").read_text() == "print('v2')\n"
+    assert not (target / "tests/unit/test_main.py").exists()
+    assert (target / "migration_report.json").exists()
+
+    # With nothing changed, the merged pyproject.toml is left alone too
+    pyproject = target / "pyproject.toml"
+    before = pyproject.stat().st_mtime_ns
+    tool = migrate(legacy_dir, target, incremental=True, delete=True)
+    assert tool.copy_stats.delta() == {
+        "added": 0, "updated": 0, "unchanged": 7, "deleted": 0
+    }
+    assert pyproject.stat().st_mtime_ns == before
+
+    (legacy_dir / "pyproject.toml").write_text(
+        LEGACY_FILES["pyproject.toml"] + 'fastapi = "^0.110"\n'
+    )
+    tool = migrate(legacy_dir, target, incremental=True)
+    assert tool.copy_stats.delta()["updated"] == 1
+    dependencies = tomllib.loads(pyproject.read_text())["tool"]["poetry"]["dependencies"]
+    assert "fastapi" in dependencies and "mkdocs" in dependencies
+
+def test_delete_keeps_files_not_written_by_migration(legacy_dir, tmp_path):
+    """Test that --delete leaves scaffolded files in place."""
+    target = tmp_path / "new"
+    LLMMethodologySetup(ProjectConfig(
+        name="new",
+        type="api",
+        technologies=["python"],
+        base_structure="standard",
+        documentation_path=target
+    )).run()
+    scaffolded = [
+        path.relative_to(target) for path in target.rglob("*") if path.is_file()
+    ]
+
+    tool = migrate(legacy_dir, target, incremental=True, delete=True)
+    assert tool.copy_stats.deleted == 0
+    (legacy_dir / "docs/adr/0001.md").unlink()
+    tool = migrate(legacy_dir, target, incremental=True, delete=True)
+
+    assert tool.copy_stats.deleted == 1
+    assert not (target / "docs/adr/0001.md").exists()
+    assert all((target / path).exists() for path in scaffolded)
+    assert validate_project(target).ok
+
+def test_dedup_links_identical_files(legacy_dir, tmp_path):
+    """Test that identical files are stored once."""
+    target = tmp_path / "new"
+    tool = migrate(legacy_dir, target, dedup="hardlink")
+
+    assert tool.copy_stats.linked == 1
+    assert tool.copy_stats.saved_bytes == len(LEGACY_FILES["tests/xml/a.xml"])
+    assert (target / "tests/xml/a.xml").samefile(target / "tests/xml/b.xml")
+
+    # Updating one copy must not change the other
+    (legacy_dir / "tests/xml/b.xml").write_text("<changed/>\n")
+    migrate(legacy_dir, target, incremental=True)
+    assert (target / "tests/xml/a.xml").read_text() == LEGACY_FILES["tests/xml/a.xml"]
+
+def test_main_requires_dedup_mode(legacy_dir, tmp_path):
+    """Test that --dedup takes a mode and never swallows the source."""
+    target = tmp_path / "new"
+    assert migration.main(["--dedup", "hardlink", str(legacy_dir), str(target)]) == 0
+    assert (target / "tests/xml/a.xml").samefile(target / "tests/xml/b.xml")
+
+    with pytest.raises(SystemExit):
+        migration.main(["--dedup", str(legacy_dir), str(tmp_path / "other")])
+    assert not (tmp_path / "other").exists()
+
+def test_incremental_run_keeps_dedup_links(legacy_dir, tmp_path):
+    """Test that an incremental run over a deduplicated tree keeps its links."""
+    target = tmp_path / "new"
+    migrate(legacy_dir, target, dedup="hardlink")
+
+    tool = migrate(legacy_dir, target, incremental=True, dedup="hardlink")
+    assert tool.copy_stats.delta() == {
+        "added": 0, "updated": 0, "unchanged": 7, "deleted": 0
+    }
+    assert (target / "tests/xml/a.xml").samefile(target / "tests/xml/b.xml")
+
+    # A new duplicate is linked to the copy left from the previous run
+    (legacy_dir / "tests/xml/c.xml").write_text(LEGACY_FILES["tests/xml/a.xml"])
+    tool = migrate(legacy_dir, target, incremental=True, dedup="hardlink")
+    assert tool.copy_stats.delta()["added"] == 1
+    assert tool.copy_stats.linked == 1
+    assert (target / "tests/xml/c.xml").samefile(target / "tests/xml/a.xml")
+
+def test_custom_mapping(legacy_dir, tmp_path):
+    """Test migrating with a custom mapping."""
+    mapping = Mapping.from_dict({
+        "rules": [{"source": "scripts/*.sh", "target": "bin"}],
+        "required": ["scripts"]
+    })
+    target = tmp_path / "new"
+    tool = MigrationTool(MigrationConfig(legacy_dir, target, mapping))
+    assert tool.run()
+    assert (target / "bin/deploy.sh").exists()
+    assert not (target / "src").exists()
+    assert tool.warnings
+
+def test_merge_dependencies_preserves_formatting():
+    """Test the TOML-aware dependency merge."""
+    text = (
+        '[tool.poetry.dependencies]\n'
+        'python = "^3.11"  # runtime\n'
+        'MkDocs = "^1.4"\n'
+        '\n'
+        '[tool.poetry.group.dev.dependencies]\n'
+        'pytest = "*"\n'
+    )
+    merged = merge_dependencies(text, NEW_DEPENDENCIES)
+
+    assert merged == (
+        '[tool.poetry.dependencies]\n'
+        'python = "^3.11"  # runtime\n'
+        'MkDocs = "^1.4"\n'
+        'cline-llm-methodology = "^1.0.0"\n'
+        'mkdocs-material = "^9.0.0"\n'
+        '\n'
+        '[tool.poetry.group.dev.dependencies]\n'
+        'pytest = "*"\n'
+    )
+    assert merge_dependencies(merged, NEW_DEPENDENCIES) == merged
+
+def test_migrate_many(legacy_dir, tmp_path):
+    """Test migrating several repositories on a process pool."""
+    pairs = [
+        (legacy_dir, tmp_path / "one"),
+        (tmp_path / "missing", tmp_path / "two"),
+        (legacy_dir, tmp_path / "three")
+    ]
+    summary = migrate_many(pairs, {}, jobs=2)
+
+    assert summary["total"] == 3
+    assert summary["succeeded"] == 2
+    assert [r["success"] for r in summary["repositories"]] == [True, False, True]
+    assert "does not exist" in summary["failures"][0]["errors"][0]
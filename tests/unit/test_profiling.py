@@ -0,0 +1,29 @@
+"""
+Unit tests for the timing and profiling instrumentation.
+"""
+
+import pstats
+import sys
+import threading
+from cline_llm_methodology.llm_setup.profiling import profiled
+
+def _work():
+    return sum(range(100))
+
+def test_profiling_covers_threads_started_in_the_block(tmp_path):
+    """Test that worker threads are profiled and the hook is removed."""
+    path = tmp_path / "run.pstats"
+
+    with profiled(path):
+        thread = threading.Thread(target=_work)
+        thread.start()
+        thread.join()
+    assert threading.getprofile() is None
+
+    after = []
+    thread = threading.Thread(target=lambda: after.append(sys.getprofile()))
+    thread.start()
+    thread.join()
+
+    assert after == [None]
+    assert any(func[2] == "_work" for func in pstats.Stats(str(path)).stats)
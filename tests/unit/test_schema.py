@@ -0,0 +1,61 @@
+"""
+Unit tests for configuration schemas.
+"""
+
+import pytest
+import json
+import yaml
+from cline_llm_methodology.llm_setup.schema import get_validator, validate_file
+
+def test_generated_documents_are_valid(mock_tools_config, mock_project_context, config_data):
+    """Test that documents written by setup match their schemas."""
+    assert get_validator("tools_config")(mock_tools_config) == []
+    assert get_validator("context")(mock_project_context) == []
+    assert get_validator("project_config")(config_data) == []
+
+def test_violations_report_every_path(mock_tools_config):
+    """Test that all violations are reported with their paths."""
+    mock_tools_config["browser_action"]["resolution"] = "wide"
+    mock_tools_config["tavily_ai"]["search_types"]["technical"]["depth"] = "deep"
+    mock_tools_config["tavily_ai"]["search_types"]["reference"] = {"max_results": 0}
+    mock_tools_config["mcp_tools"]["enabled"] = "yes"
+    
+    violations = get_validator("tools_config")(mock_tools_config)
+    assert {v.path: v.kind for v in violations} == {
+        "browser_action.resolution": "pattern",
+        "tavily_ai.search_types.technical.depth": "enum",
+        "tavily_ai.search_types.reference.max_results": "minimum",
+        "mcp_tools.enabled": "type"
+    }
+
+def test_context_violations(mock_project_context):
+    """Test context schema checks for required fields and ranges."""
+    del mock_project_context["state"]["mode"]
+    mock_project_context["metrics"]["testing"] = 150
+    mock_project_context["project"]["technologies"] = ["python", 3]
+    
+    violations = get_validator("context")(mock_project_context)
+    assert sorted(str(v) for v in violations) == [
+        "Field 'metrics.testing' must be <= 100",
+        "Field 'project.technologies[1]' must be a string",
+        "Field 'state.mode' is required"
+    ]
+
+def test_validator_is_compiled_once():
+    """Test that compiled validators are cached."""
+    assert get_validator("tools_config") is get_validator("tools_config")
+
+def test_validate_file_infers_schema(tmp_path, mock_tools_config, mock_project_context):
+    """Test schema selection from file names."""
+    tools = tmp_path / "tools_config.json"
+    tools.write_text(json.dumps(mock_tools_config))
+    context = tmp_path / "context.yaml"
+    context.write_text(yaml.dump({"project": {}}))
+    
+    assert validate_file(tools) == []
+    assert [v.path for v in validate_file(context)] == [
+        "state", "metrics", "project.name", "project.type", "project.technologies"
+    ]
+    
+    with pytest.raises(ValueError, match="No schema"):
+        validate_file(tmp_path / "other.json")
@@ -0,0 +1,98 @@
+"""
+Unit tests for the documentation search index.
+"""
+
+import pytest
+import os
+from cline_llm_methodology.llm_setup.search import (
+    DocIndex,
+    INDEX_FILE,
+    search,
+    split_sections,
+    tokenize,
+)
+
+@pytest.fixture
+def project(tmp_path):
+    """Project with a few documentation files."""
+    (tmp_path / "docs/adr").mkdir(parents=True)
+    (tmp_path / "docs/guides").mkdir(parents=True)
+    (tmp_path / "docs/other").mkdir(parents=True)
+    (tmp_path / "docs/adr/001-cache.md").write_text(
+        "# ADR 001: Response cache\n\n"
+        "## Decision\n\nCache Tavily responses in SQLite with a TTL.\n\n"
+        "## Consequences\n\nRepeated searches are answered locally.\n"
+    )
+    (tmp_path / "docs/guides/setup.md").write_text(
+        "# Guía de configuración\n\n"
+        "La migración copia los documentos.\n\n"
+        "```\n# not a heading\n```\n"
+    )
+    (tmp_path / "docs/other/ignored.md").write_text("# Cache\n\nCache cache cache.\n")
+    return tmp_path
+
+def test_tokenize_and_sections():
+    """Test term folding and heading-based sections."""
+    assert tokenize("Migración de API_Keys") == ["migracion", "de", "api_keys"]
+
+    sections = list(split_sections("intro\n# A\ntext\n```\n# code\n```\n## B\nmore\n", "doc"))
+    assert [(heading, first, last) for heading, first, last, _ in sections] == [
+        ("doc", 1, 1), ("A", 2, 6), ("B", 7, 8)
+    ]
+
+def test_search_ranks_sections(project):
+    """Test BM25 ranking over the indexed directories only."""
+    hits = search(project, "sqlite cache")
+
+    assert hits[0].path == "docs/adr/001-cache.md"
+    assert hits[0].heading == "Decision"
+    assert hits[0].line == 3
+    assert "SQLite" in hits[0].snippet
+    assert all(not hit.path.startswith("docs/other") for hit in hits)
+    assert search(project, "migracion")[0].path == "docs/guides/setup.md"
+    assert search(project, "nothing-matches-this") == []
+
+def test_update_is_incremental(project):
+    """Test that only added, changed and removed files are re-indexed."""
+    index = DocIndex(project)
+    first = index.update()
+    assert sorted(first.added) == ["docs/adr/001-cache.md", "docs/guides/setup.md"]
+    assert (project / INDEX_FILE).exists()
+
+    reloaded = DocIndex(project)
+    assert not reloaded.update().changed
+    assert reloaded.search("sqlite")[0].heading == "Decision"
+
+    guide = project / "docs/guides/setup.md"
+    guide.write_text("# Guide\n\nRotate the SQLite cache weekly.\n")
+    os.utime(guide, ns=(1, 1))
+    (project / "docs/adr/001-cache.md").unlink()
+    (project / "docs/guides/new.md").write_text("# New\n\nUnrelated.\n")
+
+    result = DocIndex(project).update()
+    assert result.added == ["docs/guides/new.md"]
+    assert result.updated == ["docs/guides/setup.md"]
+    assert result.removed == ["docs/adr/001-cache.md"]
+
+    index = DocIndex(project)
+    assert [hit.path for hit in index.search("sqlite")] == ["docs/guides/setup.md"]
+    assert index.search("migracion") == []
+    assert index.search("unrelated")[0].path == "docs/guides/new.md"
+
+def test_rejects_foreign_index_file(project):
+    """Test that an unrelated file at the index location is an error."""
+    (project / INDEX_FILE).write_text("{}")
+    with pytest.raises(ValueError, match="Not a documentation index"):
+        DocIndex(project)
+
+def test_rebuilds_corrupt_index(project):
+    """Test that a truncated index is rebuilt instead of failing."""
+    DocIndex(project).update()
+    data = (project / INDEX_FILE).read_bytes()
+
+    for size in [len(data) // 2, 10]:
+        (project / INDEX_FILE).write_bytes(data[:size])
+        index = DocIndex(project)
+        assert index.sections == []
+        assert len(index.update().added) == 2
+        assert search(project, "sqlite cache")[0].path == "docs/adr/001-cache.md"
@@ -0,0 +1,99 @@
+"""
+Unit tests for the persistent command server and its client.
+"""
+
+import pytest
+from pathlib import Path
+import tempfile
+import threading
+import time
+from cline_llm_methodology.llm_setup import __version__
+from cline_llm_methodology.llm_setup import client
+from cline_llm_methodology.llm_setup.server import CommandServer
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (Unix socket paths are limited to ~100 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="llm") as directory:
+        yield Path(directory) / "s.sock"
+
+@pytest.fixture
+def server(socket_path):
+    """Command server running in a background thread."""
+    server = CommandServer(socket_path, idle_timeout=30)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    server.stopping = True
+    thread.join(timeout=5)
+
+def test_ping(server, socket_path):
+    """Test that the server answers with its version."""
+    response = client.request("ping", socket_path=socket_path, autostart=False)
+    assert response["ok"]
+    assert response["version"] == __version__
+
+def test_run_command_in_client_cwd(server, socket_path, project_dir, monkeypatch):
+    """Test running a CLI command line relative to the client's cwd."""
+    monkeypatch.chdir(project_dir)
+    
+    response = client.run(["validate", "."], socket_path=socket_path, autostart=False)
+    assert response["exit_code"] == 0
+    assert "✅ Directory structure valid" in response["output"]
+
+def test_version_mismatch_stops_server(server, socket_path, monkeypatch):
+    """Test that a client with another version makes the server exit."""
+    monkeypatch.setattr(client, "__version__", "0.0.0-other")
+    
+    response = client.request("ping", socket_path=socket_path, autostart=False)
+    assert response["error"] == "version_mismatch"
+    
+    for _ in range(100):
+        if not socket_path.exists():
+            break
+        time.sleep(0.05)
+    assert not socket_path.exists()
+
+def test_idle_timeout(socket_path):
+    """Test that an idle server exits and removes its socket."""
+    server = CommandServer(socket_path, idle_timeout=0.2)
+    server.serve()
+    assert not socket_path.exists()
+
+def test_existing_server_is_not_replaced(server, socket_path):
+    """Test that a second server refuses a socket that is in use."""
+    with pytest.raises(RuntimeError, match="already listening"):
+        CommandServer(socket_path)
+
+def test_client_autostarts_server(socket_path):
+    """Test that the client starts a detached server on demand."""
+    try:
+        response = client.request("ping", socket_path=socket_path, idle_timeout=10)
+        assert response["ok"]
+    finally:
+        client.request("shutdown", socket_path=socket_path, autostart=False)
+
+def test_socket_is_private(server, socket_path, monkeypatch, tmp_path):
+    """Test socket permissions and the checks on its directory and owner."""
+    import os
+    import stat
+    
+    assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+    
+    monkeypatch.delenv("LLM_SETUP_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+    default = client.default_socket_path()
+    assert default.parent == tmp_path / f"llm-setup-{os.getuid()}"
+    client.ensure_private_dir(default.parent)
+    assert stat.S_IMODE(os.stat(default.parent).st_mode) == 0o700
+    
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError, match="0700"):
+        CommandServer(shared / "s.sock")
+    
+    impostor = default.parent / "server.sock"
+    impostor.write_text("")
+    with pytest.raises(PermissionError, match="not a socket"):
+        client.request("ping", socket_path=impostor, autostart=False)
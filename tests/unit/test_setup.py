@@ -6,7 +6,8 @@ import pytest
 from pathlib import Path
 import json
 import yaml
-from cline_llm_methodology.llm_setup.setup import ProjectConfig, LLMMethodologySetup
+import os
+from cline_llm_methodology.llm_setup.setup import ProjectConfig, LLMMethodologySetup, MANIFEST_FILE
 
 @pytest.fixture
 def test_config():
@@ -113,6 +114,8 @@ def test_setup_version_control(setup_instance):
     assert "__pycache__" in content
     assert ".env" in content
     assert ".coverage" in content
+    assert ".llm_docs_index" in content
+    assert ".llm_context_tokens" in content
 
 def test_full_setup_process(setup_instance):
     """Test complete setup process."""
@@ -156,4 +159,192 @@ def test_setup_with_existing_files(setup_instance):
     
     # Verify existing file was preserved
     assert test_file.exists()
-    assert test_file.read_text() == "Test content"
\ No newline at end of file
+    assert test_file.read_text() == "Test content"
+
+def test_steps_depend_only_on_directories(setup_instance):
+    """Test the setup task graph dependencies."""
+    steps = {step.name: step for step in setup_instance.steps()}
+    
+    assert steps["directories"].depends_on == ()
+    for name, step in steps.items():
+        if name != "directories":
+            assert step.depends_on == ("directories",)
+    assert "docs/README.md" in steps
+    assert "tools" in steps
+
+def test_run_records_step_timings(setup_instance):
+    """Test per-step timing report after a full run."""
+    setup_instance.run(max_workers=4)
+    
+    names = {step.name for step in setup_instance.steps()}
+    assert set(setup_instance.timings) == names
+    assert all(duration >= 0 for duration in setup_instance.timings.values())
+    assert "directories" in setup_instance.timing_report()
+
+def test_run_stops_scheduling_after_failure(setup_instance, monkeypatch):
+    """Test that a failed prerequisite prevents dependent steps."""
+    def fail():
+        raise OSError("disk full")
+        
+    monkeypatch.setattr(setup_instance, "create_directory_structure", fail)
+    
+    with pytest.raises(OSError, match="disk full"):
+        setup_instance.run()
+        
+    assert not (setup_instance.config.documentation_path / "tools_config.json").exists()
+
+def test_failed_run_leaves_no_partial_project(tmp_path, test_config, monkeypatch):
+    """Test that a failing step leaves neither target nor staging behind."""
+    test_config.documentation_path = tmp_path / "new-project"
+    setup = LLMMethodologySetup(test_config)
+    
+    def fail():
+        raise OSError("disk full")
+        
+    monkeypatch.setattr(setup, "setup_version_control", fail)
+    
+    with pytest.raises(OSError, match="disk full"):
+        setup.run()
+        
+    assert list(tmp_path.iterdir()) == []
+    
+    # Retrying after the failure starts from a clean slate
+    monkeypatch.undo()
+    LLMMethodologySetup(test_config).run()
+    assert (tmp_path / "new-project/.gitignore").exists()
+    assert [p.name for p in tmp_path.iterdir()] == ["new-project"]
+
+def test_failed_publish_restores_existing_project(setup_instance, monkeypatch):
+    """Test rollback of a partially published update to an existing project."""
+    setup_instance.run()
+    root = setup_instance.config.documentation_path
+    edited = [
+        root / ".gitignore",
+        root / "tools_config.json",
+        root / "docs/methodology/README.md"
+    ]
+    for path in edited:
+        path.write_text("Local edits")
+        
+    real_replace = os.replace
+    calls = []
+    
+    def flaky_replace(src, dst):
+        calls.append(dst)
+        if Path(dst).name == "README.md" and calls.count(dst) == 1:
+            raise OSError("connection lost")
+        return real_replace(src, dst)
+        
+    monkeypatch.setattr(os, "replace", flaky_replace)
+    
+    with pytest.raises(OSError, match="connection lost"):
+        setup_instance.run()
+        
+    assert len(calls) > 2
+    for path in edited:
+        assert path.read_text() == "Local edits"
+    assert not [p for p in root.parent.iterdir() if p.name.startswith(f".{root.name}.")]
+
+def test_rerun_only_rewrites_changed_files(setup_instance):
+    """Test that an unchanged re-setup writes nothing."""
+    setup_instance.run()
+    root = setup_instance.config.documentation_path
+    assert (root / MANIFEST_FILE).exists()
+    assert set(setup_instance.changes.values()) == {"created"}
+    
+    files = [root / relative for relative in setup_instance.changes]
+    files.append(root / MANIFEST_FILE)
+    before = {path: path.stat().st_mtime_ns for path in files}
+    
+    setup_instance.run()
+    assert set(setup_instance.changes.values()) == {"unchanged"}
+    assert {path: path.stat().st_mtime_ns for path in files} == before
+    
+    # Only the locally edited file is rewritten
+    gitignore = root / ".gitignore"
+    gitignore.write_text("custom")
+    setup_instance.run()
+    assert setup_instance.changes[".gitignore"] == "modified"
+    assert "__pycache__" in gitignore.read_text()
+    readme = root / "docs/methodology/README.md"
+    assert readme.stat().st_mtime_ns == before[readme]
+
+def test_dry_run_reports_diff_without_writing(setup_instance):
+    """Test dry-run mode on new and existing projects."""
+    root = setup_instance.config.documentation_path
+    
+    setup_instance.run(dry_run=True)
+    assert list(root.iterdir()) == []
+    assert setup_instance.changes["tools_config.json"] == "created"
+    
+    setup_instance.run()
+    (root / ".gitignore").write_text("custom\n")
+    
+    setup_instance.run(dry_run=True)
+    assert setup_instance.changes[".gitignore"] == "modified"
+    assert setup_instance.changes["tools_config.json"] == "unchanged"
+    diff = setup_instance.diff()
+    assert "--- a/.gitignore" in diff
+    assert "-custom" in diff
+    assert (root / ".gitignore").read_text() == "custom\n"
+
+def test_metrics_report_writes_and_memory(setup_instance):
+    """Test the step metrics API."""
+    setup_instance.run(trace_memory=True)
+    metrics = setup_instance.metrics()
+    
+    steps = {step.name: step for step in metrics.steps}
+    assert steps["tools"].files == 1
+    assert steps["tools"].bytes == len(
+        (setup_instance.config.documentation_path / "tools_config.json").read_bytes()
+    )
+    assert steps["directories"].files == 0
+    assert metrics.files == 9
+    assert metrics.peak_memory > 0
+    assert metrics.to_dict()["steps"][0]["name"] in steps
+    
+    # A re-run writes nothing
+    setup_instance.run()
+    assert setup_instance.metrics().files == 0
+    assert setup_instance.metrics().peak_memory is None
+
+def test_logging_is_configured_once(test_config, tmp_path, capsys):
+    """Test that instances share one queue-backed handler."""
+    import logging
+    from cline_llm_methodology.llm_setup.setup import flush_logging
+    
+    test_config.documentation_path = tmp_path
+    logger = LLMMethodologySetup(test_config).logger
+    handlers = list(logger.handlers)
+    for _ in range(5):
+        LLMMethodologySetup(test_config)
+    assert logger.handlers == handlers
+    assert [type(h) for h in handlers] == [logging.handlers.QueueHandler]
+    
+    capsys.readouterr()
+    logger.info("written once")
+    flush_logging()
+    assert capsys.readouterr().out.count("written once") == 1
+
+def test_run_removes_staging_of_killed_runs(tmp_path, test_config):
+    """Test that leftovers of killed runs are cleaned up, live ones kept."""
+    import subprocess
+    import sys
+
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    test_config.documentation_path = tmp_path / "new-project"
+    stale = [
+        f".new-project.staging-{finished.pid}-0123456789ab",
+        f".new-project.staging-{finished.pid}-0123456789ab-backup",
+        ".new-project.staging-ba9876543210"
+    ]
+    kept = [
+        f".new-project.staging-{os.getpid()}-0123456789ab",
+        f".other.staging-{finished.pid}-0123456789ab"
+    ]
+    for name in stale + kept:
+        (tmp_path / name / "docs").mkdir(parents=True)
+
+    LLMMethodologySetup(test_config).run()
+    assert sorted(p.name for p in tmp_path.iterdir()) == sorted(kept + ["new-project"])
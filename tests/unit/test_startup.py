@@ -0,0 +1,84 @@
+"""
+Startup benchmark for the command-line interface.
+
+Runs the CLI import in a fresh interpreter with `python -X importtime` and
+fails if cold start pulls in heavy dependencies or exceeds its time budget.
+The budget can be adjusted for slow machines with LLM_SETUP_STARTUP_BUDGET_MS.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, Tuple
+from cline_llm_methodology.llm_setup import cli as cli_module
+
+CLI_MODULE = cli_module.__name__
+
+# Modules only some subcommands need; none may load at startup
+HEAVY_MODULES = [
+    "yaml",
+    "jinja2",
+    "rich",
+    "concurrent.futures",
+    "xml.etree.ElementTree",
+    CLI_MODULE.rsplit(".", 1)[0] + ".setup",
+    CLI_MODULE.rsplit(".", 1)[0] + ".validation",
+]
+
+# Import time of our own code on top of click, in milliseconds
+STARTUP_BUDGET_MS = float(os.environ.get("LLM_SETUP_STARTUP_BUDGET_MS", "60"))
+
+def run_python(*args: str) -> subprocess.CompletedProcess:
+    """Run a fresh interpreter with the test process's import path."""
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    return subprocess.run(
+        [sys.executable, *args], env=env, capture_output=True, text=True, check=True
+    )
+
+def import_times(statement: str) -> Dict[str, Tuple[int, int]]:
+    """Parse `-X importtime` output into {module: (self_us, cumulative_us)}."""
+    result = run_python("-X", "importtime", "-c", statement)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cumulative_us))
+    return times
+
+def loaded_heavy_modules(statement: str) -> list:
+    """Run a statement and report which heavy modules it loaded."""
+    check = (
+        f"import sys, json\n{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    return json.loads(run_python("-c", check).stdout.splitlines()[-1])
+
+def test_cli_import_is_lightweight():
+    """Test that importing the CLI loads no subcommand dependencies."""
+    assert loaded_heavy_modules(f"import {CLI_MODULE}") == []
+
+def test_help_is_lightweight():
+    """Test that `llm-setup --help` loads no subcommand dependencies."""
+    statement = (
+        f"from {CLI_MODULE} import cli\n"
+        "try:\n"
+        "    cli(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass"
+    )
+    assert loaded_heavy_modules(statement) == []
+
+def test_cold_start_budget():
+    """Test that CLI import time stays within budget (best of three runs)."""
+    overheads = []
+    for _ in range(3):
+        times = import_times(f"import {CLI_MODULE}")
+        overheads.append(times[CLI_MODULE][1] - times["click"][1])
+        
+    best_ms = min(overheads) / 1000
+    assert best_ms <= STARTUP_BUDGET_MS, (
+        f"CLI cold start costs {best_ms:.1f} ms on top of click "
+        f"(budget {STARTUP_BUDGET_MS:.0f} ms)"
+    )
@@ -0,0 +1,223 @@
+"""
+Unit tests for the Tavily client and its response cache.
+"""
+
+import pytest
+import asyncio
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+from cline_llm_methodology.llm_setup.tools.cache import ResponseCache
+from cline_llm_methodology.llm_setup.tools.transport import Transport, TransportConfig
+from cline_llm_methodology.llm_setup.tools.tavily import (
+    AsyncTavilyClient,
+    TavilyAPIError,
+    TavilyClient,
+)
+
+SEARCH_TYPES = {
+    "technical": {"depth": "comprehensive", "include_code": True, "max_results": 10},
+    "reference": {"depth": "basic", "include_docs": True, "max_results": 3}
+}
+
+class StubTavily(BaseHTTPRequestHandler):
+    """Local stand-in for the Tavily search endpoint."""
+    protocol_version = "HTTP/1.1"
+    requests = []
+    status = 200
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.requests.append(body)
+        if self.status != 200:
+            self.send_response(self.status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        payload = json.dumps({
+            "query": body["query"],
+            "results": [{"title": f"result {i}"} for i in range(body["max_results"])]
+        }).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def stub_server():
+    """Stub Tavily server on a free local port."""
+    StubTavily.requests = []
+    StubTavily.status = 200
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubTavily)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def client(stub_server, tmp_path):
+    """Client pointed at the stub server with a temporary cache."""
+    return TavilyClient(
+        api_key="test-key",
+        search_types=SEARCH_TYPES,
+        cache=ResponseCache(tmp_path / "cache.sqlite3"),
+        base_url=f"http://127.0.0.1:{stub_server.server_port}",
+        transport=Transport(TransportConfig(http2=False))
+    )
+
+def test_search_applies_search_type(client):
+    """Test that search type settings shape the request."""
+    response = client.search("Python  async patterns", search_type="technical")
+
+    assert len(response["results"]) == 10
+    request = StubTavily.requests[0]
+    assert request["query"] == "Python  async patterns"
+    assert request["search_depth"] == "advanced"
+    assert request["include_raw_content"] is True
+    assert request["api_key"] == "test-key"
+
+    client.search("python", search_type="reference", max_results=2)
+    assert StubTavily.requests[1]["max_results"] == 2
+    assert StubTavily.requests[1]["search_depth"] == "basic"
+
+    with pytest.raises(ValueError, match="Unknown search type"):
+        client.search("python", search_type="missing")
+
+def test_cache_answers_repeated_queries(client):
+    """Test that normalized repeats are served from the cache."""
+    first = client.search("FastAPI dependency injection", search_type="technical")
+    second = client.search("  fastapi   dependency injection ", search_type="technical")
+    client.search("fastapi dependency injection", search_type="reference")
+
+    assert first == second
+    assert len(StubTavily.requests) == 2
+    # Both requests went over one kept-alive connection
+    assert client.transport.stats.connections == 1
+    stats = client.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3, abs=1e-3)
+
+def test_api_errors(client):
+    """Test error codes for failed requests, which are not cached."""
+    StubTavily.status = 429
+    with pytest.raises(TavilyAPIError) as error:
+        client.search("python")
+    assert error.value.code == "rate_limit_exceeded"
+    assert error.value.status == 429
+
+    StubTavily.status = 200
+    assert client.search("python")["results"]
+
+def test_cache_ttl_and_lru_eviction(tmp_path, monkeypatch):
+    """Test expiry and least-recently-used eviction."""
+    import time
+
+    now = [1000.0]
+    monkeypatch.setattr(time, "time", lambda: now[0])
+    cache = ResponseCache(tmp_path / "cache.sqlite3", ttl=60, max_entries=2)
+
+    cache.put("a", {"v": 1})
+    now[0] += 1
+    cache.put("b", {"v": 2})
+    now[0] += 1
+    assert cache.get("a") == {"v": 1}
+    now[0] += 1
+    cache.put("c", {"v": 3})
+
+    # "b" was the least recently used entry
+    assert cache.get("b") is None
+    assert cache.get("a") == {"v": 1}
+    assert cache.stats.evictions == 1
+
+    now[0] += 120
+    assert cache.get("c") is None
+    assert cache.stats.expired == 1
+    assert len(cache) == 1
+
+def test_search_many_coalesces_and_limits_concurrency(client):
+    """Test batched async searches."""
+    import time
+
+    active = []
+    peak = []
+    post = client._post
+
+    def slow_post(body):
+        active.append(body)
+        peak.append(len(active))
+        time.sleep(0.05)
+        active.remove(body)
+        return post(body)
+
+    client._post = slow_post
+    queries = [f"query {i}" for i in range(6)] + ["Query 0", ("query 1", "reference")]
+
+    async def run():
+        async with AsyncTavilyClient(client, max_concurrency=3) as batch:
+            results = await batch.search_many(queries, search_type="technical")
+            return batch, results
+
+    batch, results = asyncio.run(run())
+    assert len(results) == 8
+    assert results[6] == results[0]
+    assert len(results[7]["results"]) == 3
+    # "Query 0" shares the request of "query 0"
+    assert batch.coalesced == 1
+    assert len(StubTavily.requests) == 7
+    assert max(peak) <= 3
+
+def test_async_cache_calls_leave_the_event_loop(client):
+    """Test that blocking cache reads and writes run off the loop thread."""
+    threads = []
+    cache = client.cache
+    get, put = cache.get, cache.put
+
+    def record(call):
+        def wrapper(*args):
+            threads.append(threading.current_thread())
+            return call(*args)
+        return wrapper
+
+    cache.get, cache.put = record(get), record(put)
+
+    async def run():
+        async with AsyncTavilyClient(client) as batch:
+            await batch.search("python")
+            await batch.search("python")
+        return threading.current_thread()
+
+    loop_thread = asyncio.run(run())
+    assert len(threads) == 3
+    assert loop_thread not in threads
+    assert len(StubTavily.requests) == 1
+
+def test_async_retries_rate_limits(client):
+    """Test backoff retries after a rate-limit response."""
+
+    post = client._post
+    failures = [TavilyAPIError("rate_limit_exceeded", "slow down", 429, 0.01)] * 2
+
+    def flaky_post(body):
+        if failures:
+            raise failures.pop()
+        return post(body)
+
+    client._post = flaky_post
+
+    async def run():
+        async with AsyncTavilyClient(client, backoff=0.01) as batch:
+            result = await batch.search("python")
+            return batch, result
+
+    batch, result = asyncio.run(run())
+    assert result["results"]
+    assert batch.retries == 2
+
+    failures.extend([TavilyAPIError("invalid_api_key", "no", 401)])
+    with pytest.raises(TavilyAPIError, match="no"):
+        asyncio.run(AsyncTavilyClient(client).search("other query"))
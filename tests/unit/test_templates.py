@@ -0,0 +1,46 @@
+"""
+Unit tests for the documentation template engine.
+"""
+
+import pytest
+from jinja2 import TemplateNotFound
+from cline_llm_methodology.llm_setup.templates import get_environment, render_template
+
+def test_render_readme(test_config):
+    """Test rendering the built-in README template."""
+    content = render_template("README.md.j2", test_config)
+    
+    assert content.startswith("# test-project\n")
+    assert "- Technologies: python, fastapi" in content
+    assert content.endswith("```\n")
+
+def test_type_specific_template_overrides_default(test_config, tmp_path):
+    """Test per-type and per-base_structure template selection."""
+    (tmp_path / "api").mkdir()
+    (tmp_path / "api/README.md.j2").write_text("API {{ config.name }}")
+    (tmp_path / "standard").mkdir()
+    (tmp_path / "standard/README.md.j2").write_text("Standard {{ config.name }}")
+    
+    assert render_template("README.md.j2", test_config, [tmp_path]) == "API test-project"
+    
+    test_config.type = "cli"
+    assert render_template("README.md.j2", test_config, [tmp_path]) == "Standard test-project"
+    
+    test_config.base_structure = "minimal"
+    assert render_template("README.md.j2", test_config, [tmp_path]).startswith(
+        "# test-project"
+    )
+
+def test_missing_template(test_config):
+    """Test that an unknown template is reported."""
+    with pytest.raises(TemplateNotFound):
+        render_template("missing.md.j2", test_config)
+
+def test_bytecode_cache_persists_compiled_templates(test_config, tmp_path):
+    """Test that compiled templates are written to the bytecode cache."""
+    cache_dir = tmp_path / "cache"
+    environment = get_environment((), str(cache_dir))
+    
+    environment.get_template("README.md.j2").render(config=test_config)
+    assert list(cache_dir.glob("__jinja2_*.cache"))
+    assert get_environment((), str(cache_dir)) is environment
@@ -0,0 +1,100 @@
+"""
+Unit tests for the pooled HTTP transport.
+"""
+
+import pytest
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from cline_llm_methodology.llm_setup.tools.transport import (
+    Transport,
+    TransportConfig,
+    shared_transport,
+)
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Local HTTP stand-in that records concurrency."""
+    protocol_version = "HTTP/1.1"
+    active = 0
+    peak = 0
+    delay = 0.0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.active += 1
+            cls.peak = max(cls.peak, cls.active)
+        time.sleep(cls.delay)
+        with cls.lock:
+            cls.active -= 1
+        body = json.dumps({"path": self.path}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if self.path == "/close":
+            self.send_header("Connection", "close")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    """Stub server on a free local port."""
+    StubHandler.active = StubHandler.peak = 0
+    StubHandler.delay = 0.0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+def test_connections_are_kept_alive(server):
+    """Test that sequential requests reuse one connection."""
+    transport = Transport(TransportConfig(http2=False))
+    for index in range(5):
+        response = transport.request("GET", f"{server}/item?i={index}")
+        assert response.status == 200
+        assert response.json() == {"path": f"/item?i={index}"}
+
+    assert (transport.stats.requests, transport.stats.connections) == (5, 1)
+    assert transport.stats.reused == 4
+
+    # A response asking to close the connection is not pooled
+    transport.request("GET", f"{server}/close")
+    transport.request("GET", f"{server}/after")
+    assert transport.stats.connections == 2
+    transport.close()
+
+def test_per_host_limit(server):
+    """Test that concurrent requests to a host are capped."""
+    StubHandler.delay = 0.05
+    transport = Transport(TransportConfig(max_connections_per_host=2, http2=False))
+    with ThreadPoolExecutor(6) as executor:
+        statuses = list(executor.map(
+            lambda index: transport.request("GET", f"{server}/{index}").status,
+            range(6)
+        ))
+
+    assert statuses == [200] * 6
+    assert StubHandler.peak == 2
+    assert transport.stats.connections == 2
+
+def test_timeouts(server):
+    """Test read timeouts and rejected URLs."""
+    StubHandler.delay = 0.5
+    transport = Transport(TransportConfig(timeout=0.1, http2=False))
+    with pytest.raises(OSError):
+        transport.request("GET", f"{server}/slow")
+    with pytest.raises(ValueError, match="Unsupported URL"):
+        transport.request("GET", "ftp://example.com/file")
+
+def test_shared_transport_is_configured_once():
+    """Test the process-wide transport."""
+    transport = shared_transport(TransportConfig(max_connections_per_host=3))
+    assert shared_transport() is transport
+    assert shared_transport(TransportConfig(max_connections_per_host=5)) is transport
@@ -0,0 +1,94 @@
+"""
+Unit tests for the project validation engine.
+"""
+
+import json
+from xml.etree import ElementTree
+from cline_llm_methodology.llm_setup.validation import (
+    scan_tree,
+    to_json,
+    to_junit,
+    validate_project,
+    validate_projects,
+)
+
+def test_scan_tree_only_descends_into_relevant_dirs(project_dir):
+    """Test single-pass tree scan pruning."""
+    (project_dir / "src/package").mkdir()
+    (project_dir / "src/package/module.py").touch()
+    
+    entries = scan_tree(project_dir)
+    assert entries["docs/methodology"] is True
+    assert entries["docs/methodology/llm_methodology.md"] is False
+    assert entries["src"] is True
+    assert "src/package" not in entries
+
+def test_validate_valid_project(project_dir):
+    """Test validation of a complete project."""
+    result = validate_project(project_dir)
+    
+    assert result.ok
+    assert result.missing_dirs == []
+    assert result.missing_docs == []
+    assert result.config_status == "valid"
+
+def test_validate_incomplete_project(empty_project_dir):
+    """Test validation reports every missing item."""
+    (empty_project_dir / "src").mkdir()
+    (empty_project_dir / "tools").touch()
+    
+    result = validate_project(empty_project_dir)
+    assert not result.ok
+    assert result.missing_dirs == ["docs/methodology", "docs/adr", "tests", "tools"]
+    assert len(result.missing_docs) == 3
+    assert result.config_status == "missing"
+
+def test_validate_invalid_config(project_dir):
+    """Test validation of an unparseable tools_config.json."""
+    (project_dir / "tools_config.json").write_text("{invalid")
+    
+    result = validate_project(project_dir)
+    assert result.config_status == "invalid"
+    assert result.config_errors
+
+def test_validate_projects_in_parallel(tmp_path, project_dir):
+    """Test validating several roots on a process pool keeps input order."""
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    roots = [project_dir, broken, project_dir]
+    
+    results = validate_projects(roots, workers=2)
+    assert [result.root for result in results] == [str(root) for root in roots]
+    assert [result.ok for result in results] == [True, False, True]
+
+def test_machine_readable_reports(tmp_path, project_dir):
+    """Test JSON and JUnit report formats."""
+    broken = tmp_path / "broken"
+    broken.mkdir()
+    results = validate_projects([project_dir, broken], workers=1)
+    
+    data = json.loads(to_json(results))
+    assert [entry["ok"] for entry in data] == [True, False]
+    assert data[1]["config_status"] == "missing"
+    
+    suite = ElementTree.fromstring(to_junit(results))
+    assert suite.get("tests") == "2"
+    assert suite.get("failures") == "1"
+    cases = suite.findall("testcase")
+    assert cases[0].find("failure") is None
+    assert "Missing tools_config.json" in cases[1].find("failure").text
+
+def test_validate_schema_violations(project_dir, mock_project_context):
+    """Test that schema violations make a project invalid."""
+    (project_dir / "tools_config.json").write_text(
+        json.dumps({"browser_action": {"resolution": 900}})
+    )
+    del mock_project_context["metrics"]
+    (project_dir / "docs/methodology/context.yaml").write_text(
+        json.dumps(mock_project_context)
+    )
+    
+    result = validate_project(project_dir)
+    assert result.config_status == "invalid"
+    assert result.config_errors == ["Field 'browser_action.resolution' must be a string"]
+    assert result.context_errors == ["Field 'metrics' is required"]